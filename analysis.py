@@ -0,0 +1,365 @@
+"""N일 후 하락 분석 공용 계산 커널 (app.py / mcp_server.py 공용)."""
+import time
+from dataclasses import dataclass
+from math import exp, log, sqrt
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+
+# ── N일 후 가격 조회 ──────────────────────────────────────────────────────────
+
+# N일의 단위: 달력일(다음 거래일로 보정) 또는 거래일(위치 이동)
+CALENDAR_DAYS = "calendar_days"
+TRADING_DAYS = "trading_days"
+HORIZON_UNITS = (CALENDAR_DAYS, TRADING_DAYS)
+
+
+def forward_prices(index: pd.DatetimeIndex, close, signal_index: pd.DatetimeIndex, days_after: int):
+    """각 신호일 + N 달력일 이후 첫 거래일의 종가와 실제 경과일을 한 번에 계산.
+
+    index는 정렬된 거래일 인덱스, close는 같은 길이의 종가 배열.
+    searchsorted 한 번으로 모든 신호일을 처리하며, 해당 거래일이 없으면 NaN.
+    """
+    close = np.asarray(close, dtype=float)
+    targets = signal_index + pd.Timedelta(days=days_after)
+    pos = index.searchsorted(targets, side="left")
+    found = pos < len(index)
+
+    prices = np.full(len(pos), np.nan)
+    actual_days = np.full(len(pos), np.nan)
+    hit = pos[found]
+    prices[found] = close[hit]
+    actual_days[found] = (index[hit] - signal_index[found]).days
+    return prices, actual_days
+
+
+def forward_prices_trading(index: pd.DatetimeIndex, close, positions, bars: int):
+    """각 신호일(거래일 위치)로부터 N 거래일 뒤 종가와 실제 경과 달력일.
+
+    날짜 검색 없이 위치만 옮기므로(Close.shift(-N)과 같음) O(n)이고 휴장일 차이에 영향받지 않는다.
+    N 거래일 뒤가 데이터 범위를 넘으면 NaN.
+    """
+    close = np.asarray(close, dtype=float)
+    positions = np.asarray(positions)
+    target = positions + bars
+    found = target < len(close)
+
+    prices = np.full(len(positions), np.nan)
+    actual_days = np.full(len(positions), np.nan)
+    hit = target[found]
+    prices[found] = close[hit]
+    actual_days[found] = (index[hit] - index[positions[found]]).days
+    return prices, actual_days
+
+
+def horizon_text(days_after: int, horizon_unit: str) -> str:
+    """표시용 기간 문구: 'N일' 또는 'N거래일'."""
+    return f"{days_after}거래일" if horizon_unit == TRADING_DAYS else f"{days_after}일"
+
+
+def _check_days_after(days_after):
+    if days_after < 1:
+        raise ValueError("N일(days_after)은 1 이상이어야 합니다.")
+
+
+def _forward(index, close, signal_index, days_after, horizon_unit):
+    _check_days_after(days_after)
+    if horizon_unit == CALENDAR_DAYS:
+        return forward_prices(index, close, signal_index, days_after)
+    if horizon_unit == TRADING_DAYS:
+        return forward_prices_trading(index, close, index.get_indexer(signal_index), days_after)
+    raise ValueError(f"horizon_unit은 {', '.join(HORIZON_UNITS)} 중 하나여야 합니다.")
+
+
+# ── 압축 가격 배열 ────────────────────────────────────────────────────────────
+
+def day_numbers(index) -> np.ndarray:
+    """날짜 인덱스 → 1970-01-01 기준 일수(int32). 시간대가 있으면 그 시간대의 날짜 기준."""
+    index = pd.DatetimeIndex(index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.to_numpy().astype("datetime64[D]").astype(np.int32)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class PriceArrays:
+    """종목 하나의 일봉 압축 표현 (봉당 12바이트, float64 OHLCV DataFrame은 48바이트).
+
+    days는 day_numbers 일수(int32), close/volume은 float32. 계산할 때는 float64로 올려 쓴다.
+    source는 price_arena 파일을 매핑한 배열일 때 (경로, 시작 일수)로, 피클 시 배열 대신 이것만 넘긴다.
+    """
+    days: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray = None
+    source: tuple = None
+
+    def __reduce__(self):
+        if self.source is not None:
+            return _remap_arena, self.source
+        return PriceArrays, (self.days, self.close, self.volume)
+
+    @classmethod
+    def from_frame(cls, data: pd.DataFrame) -> "PriceArrays":
+        """종가가 있는 봉만 압축. Volume 열이 없으면 volume=None."""
+        data = data[data["Close"].notna()]
+        volume = data["Volume"].to_numpy(dtype=np.float32) if "Volume" in data else None
+        return cls(day_numbers(data.index), data["Close"].to_numpy(dtype=np.float32), volume)
+
+    def __len__(self):
+        return len(self.days)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(a.nbytes for a in (self.days, self.close, self.volume) if a is not None)
+
+
+def _remap_arena(path, from_day):
+    from price_arena import remap  # price_arena가 이 모듈을 import하므로 지연 import
+    return remap(path, from_day)
+
+
+# ── N일 후 하락 분석 ──────────────────────────────────────────────────────────
+
+# 즉시 매도 성공률(%)이 이 값보다 크면 매도, WAIT_BELOW보다 작으면 대기 전략
+SELL_ABOVE = 55
+WAIT_BELOW = 45
+
+
+def find_drop_days(data: pd.DataFrame, drop_threshold_pct: float) -> tuple:
+    """(종가+전일 대비 변화율 프레임, 변화율이 -drop_threshold_pct% 이하인 신호일 프레임)."""
+    prices = data[["Close"]].assign(Pct_Change=data["Close"].pct_change() * 100)
+    signal_days = prices[prices["Pct_Change"] <= -drop_threshold_pct]
+    return prices, signal_days.assign(Price_Today=signal_days["Close"])
+
+
+def add_forward_returns(signal_days: pd.DataFrame, prices: pd.DataFrame, days_after: int,
+                        horizon_unit: str = CALENDAR_DAYS) -> pd.DataFrame:
+    """신호일별 N일 후 종가·실제 경과일·결과(Win=즉시 매도 유리)·변화율(%) 추가.
+
+    horizon_unit이 trading_days면 N 거래일 뒤 종가를 쓴다. N일 후 데이터가 아직 없는 신호일은 제외.
+    """
+    later = f"Price_{days_after}D_Later"
+    prices_later, actual_days = _forward(
+        prices.index, prices["Close"].to_numpy(), signal_days.index, days_after, horizon_unit
+    )
+    signal_days = signal_days.assign(**{later: prices_later, "Actual_Days_Later": actual_days})
+    signal_days = signal_days.dropna(subset=[later])
+    signal_days["Result"] = np.where(signal_days["Price_Today"] > signal_days[later], "Win", "Lose")
+    signal_days[f"Change_{days_after}D"] = (
+        (signal_days[later] - signal_days["Price_Today"]) / signal_days["Price_Today"] * 100
+    )
+    return signal_days
+
+
+def _strategy(win_rate):
+    if win_rate > SELL_ABOVE:
+        return "sell"
+    if win_rate < WAIT_BELOW:
+        return "wait"
+    return "neutral"
+
+
+def _mean(values):
+    return float(values.mean()) if len(values) else None
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class DropStats:
+    """drop_stats 결과. 신호가 없어 계산할 수 없는 값은 None."""
+    signals: int              # N일 후 데이터가 없는 날 포함 하락일 수
+    total: int                # N일 후 데이터가 있는 신호 수
+    win: int
+    lose: int
+    win_rate: float
+    avg_change: float
+    median_change: float
+    avg_win_change: float     # 즉시 매도가 유리했던 신호의 평균 N일 변화율
+    avg_lose_change: float
+    avg_drop_pct: float
+    max_drop_pct: float
+    avg_actual_days: float
+    strategy: str
+    wins: np.ndarray          # 신호별 즉시 매도 유리 여부 (부트스트랩용)
+
+
+def _forward_days(days, close, signal, days_after, horizon_unit):
+    """day_numbers 일수 배열 위에서 신호 위치별 N일 후 종가와 실제 경과일 (없으면 NaN)."""
+    _check_days_after(days_after)
+    if horizon_unit == CALENDAR_DAYS:
+        pos = np.searchsorted(days, days[signal] + days_after, side="left")
+    elif horizon_unit == TRADING_DAYS:
+        pos = signal + days_after
+    else:
+        raise ValueError(f"horizon_unit은 {', '.join(HORIZON_UNITS)} 중 하나여야 합니다.")
+    found = pos < len(days)
+    prices = np.full(len(signal), np.nan)
+    actual_days = np.full(len(signal), np.nan)
+    prices[found] = close[pos[found]]
+    actual_days[found] = days[pos[found]] - days[signal[found]]
+    return prices, actual_days
+
+
+def drop_stats(days, close, drop_threshold_pct: float, days_after: int,
+               horizon_unit: str = CALENDAR_DAYS) -> DropStats:
+    """종가 배열 하나에서 하락 신호 통계 전체를 한 번에 계산 (행 단위 루프·중간 DataFrame 없음).
+
+    days는 정렬된 거래일로, day_numbers 일수 배열(PriceArrays.days) 또는 DatetimeIndex/datetime64 배열.
+    close는 같은 길이의 종가 배열 (float32여도 float64로 계산).
+    """
+    if not (isinstance(days, np.ndarray) and days.dtype.kind in "iu"):
+        days = day_numbers(days)
+    close = np.asarray(close, dtype=float)
+    pct = np.full(len(close), np.nan)
+    pct[1:] = (close[1:] / close[:-1] - 1) * 100
+    signal = np.flatnonzero(pct <= -drop_threshold_pct)   # NaN 비교는 False
+
+    later, actual_days = _forward_days(days, close, signal, days_after, horizon_unit)
+    has_later = ~np.isnan(later)
+    today = close[signal[has_later]]
+    later = later[has_later]
+    change = (later - today) / today * 100
+    drops = pct[signal[has_later]]
+    wins = today > later
+
+    total = len(change)
+    win = int(wins.sum())
+    win_rate = win / total * 100 if total else 0.0
+    return DropStats(
+        signals=len(signal),
+        total=total,
+        win=win,
+        lose=total - win,
+        win_rate=win_rate,
+        avg_change=_mean(change),
+        median_change=float(np.median(change)) if total else None,
+        avg_win_change=_mean(change[wins]),
+        avg_lose_change=_mean(change[~wins]),
+        avg_drop_pct=_mean(drops),
+        max_drop_pct=float(drops.min()) if total else None,
+        avg_actual_days=_mean(actual_days[has_later]),
+        strategy=_strategy(win_rate),
+        wins=wins,
+    )
+
+
+def drop_grid(data: pd.DataFrame, thresholds, horizons, horizon_unit: str = CALENDAR_DAYS) -> dict:
+    """하락 기준 × N일 조합 전체의 통계를 한 번에 계산.
+
+    기간별 N일 후 가격 행렬(기간 × 거래일)을 먼저 만들고, 하락 기준마다 불리언 마스크만 바꿔
+    집계한다. 반환: {"count", "win_rate", "avg_change", "median_change"} → 각각
+    index=하락 기준, columns=N일인 DataFrame (신호가 없는 칸은 NaN, count는 0).
+    """
+    index = data.index
+    close = data["Close"].to_numpy(dtype=float)
+    pct = np.full(len(close), np.nan)
+    pct[1:] = (close[1:] / close[:-1] - 1) * 100
+
+    later = np.vstack([_forward(index, close, index, h, horizon_unit)[0] for h in horizons])
+    change = (later - close) / close * 100
+    has_later = ~np.isnan(later)
+    win = close > later
+
+    shape = (len(thresholds), len(horizons))
+    count = np.zeros(shape, dtype=int)
+    win_rate = np.full(shape, np.nan)
+    avg_change = np.full(shape, np.nan)
+    median_change = np.full(shape, np.nan)
+    for i, t in enumerate(thresholds):
+        mask = has_later & (pct <= -t)   # NaN 비교는 False
+        n = mask.sum(axis=1)
+        count[i] = n
+        ok = n > 0
+        masked = np.where(mask, change, np.nan)
+        win_rate[i, ok] = (win & mask).sum(axis=1)[ok] / n[ok] * 100
+        avg_change[i, ok] = np.nansum(masked, axis=1)[ok] / n[ok]
+        if ok.any():
+            median_change[i, ok] = np.nanmedian(masked[ok], axis=1)
+
+    def frame(values):
+        return pd.DataFrame(values, index=pd.Index(thresholds, name="threshold"),
+                            columns=pd.Index(horizons, name="days_after"))
+
+    return {
+        "count": frame(count),
+        "win_rate": frame(win_rate),
+        "avg_change": frame(avg_change),
+        "median_change": frame(median_change),
+    }
+
+
+# ── 부트스트랩 신뢰구간 ───────────────────────────────────────────────────────
+
+# 한 번에 만드는 재표본 인덱스 행렬의 최대 원소 수 (메모리 상한, 약 32MB)
+_BOOTSTRAP_BLOCK = 4_000_000
+# 신호가 이보다 적거나 전부 승/패면 재표본 분포가 퇴화하므로 Wilson 구간 사용
+_MIN_BOOTSTRAP_N = 30
+
+
+def binomial_p_value(win: int, n: int) -> float:
+    """승률 50% 귀무가설에 대한 정확한 양측 이항검정 p-value.
+
+    꼬리 확률을 로그 공간에서 더해 O(n) (큰 정수 이항계수는 n에 대해 제곱 이상으로 느림).
+    """
+    if n == 0:
+        return 1.0
+    tail = min(win, n - win)
+    # log C(n, i) = Σ_{j=1..i} log((n - j + 1) / j)
+    j = np.arange(1, tail + 1, dtype=np.float64)
+    log_comb = np.concatenate(([0.0], np.cumsum(np.log((n - j + 1) / j))))
+    peak = log_comb.max()
+    log_tail = peak + log(np.exp(log_comb - peak).sum()) - n * log(2)
+    return min(1.0, 2 * exp(log_tail))
+
+
+def wilson_interval(win: int, n: int, confidence: float = 0.95) -> tuple:
+    """승률(%)의 Wilson 점수 신뢰구간 (low, high)."""
+    z = NormalDist().inv_cdf(1 - (1 - confidence) / 2)
+    p = win / n
+    center = (p + z * z / (2 * n)) / (1 + z * z / n)
+    half = z * sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / (1 + z * z / n)
+    return max(0.0, center - half) * 100, min(1.0, center + half) * 100
+
+
+def bootstrap_win_rate(wins, resamples: int = 10_000, confidence: float = 0.95,
+                       budget_sec: float = 0.5, seed=None) -> dict:
+    """승(True)/패 배열로 승률(%)의 신뢰구간과 50% 대비 양측 p-value 계산.
+
+    p-value는 정확한 이항검정. 구간은 부트스트랩 백분위로, 재표본은 (블록 크기 × 신호 수)
+    인덱스 행렬 하나로 한꺼번에 뽑아 평균낸다. budget_sec이 지나면 남은 블록을 건너뛰고,
+    실제로 사용한 재표본 수를 resamples로 돌려준다. 신호가 _MIN_BOOTSTRAP_N개 미만이거나
+    전부 승/패면 Wilson 구간을 쓰고 resamples는 0 (method로 구분).
+    """
+    wins = np.asarray(wins, dtype=np.float64)
+    n = len(wins)
+    if n == 0:
+        return {"ci_low": None, "ci_high": None, "p_value": None, "resamples": 0, "method": None}
+    win = int(wins.sum())
+    p_value = binomial_p_value(win, n)
+    if n < _MIN_BOOTSTRAP_N or win in (0, n):
+        low, high = wilson_interval(win, n, confidence)
+        return {"ci_low": low, "ci_high": high, "p_value": p_value, "resamples": 0, "method": "wilson"}
+
+    rng = np.random.default_rng(seed)
+    block = max(1, min(resamples, _BOOTSTRAP_BLOCK // n))
+    deadline = time.perf_counter() + budget_sec
+    rates = []
+    drawn = 0
+    while drawn < resamples:
+        size = min(block, resamples - drawn)
+        rates.append(wins[rng.integers(0, n, size=(size, n))].mean(axis=1))
+        drawn += size
+        if time.perf_counter() > deadline:
+            break
+    rates = np.concatenate(rates)
+
+    alpha = (1 - confidence) / 2
+    low, high = np.quantile(rates, [alpha, 1 - alpha])
+    return {
+        "ci_low": float(low * 100),
+        "ci_high": float(high * 100),
+        "p_value": p_value,
+        "resamples": int(len(rates)),
+        "method": "bootstrap",
+    }
@@ -1,15 +1,51 @@
+import time
 import streamlit as st
-import yfinance as yf
 import pandas as pd
 import numpy as np
-import requests
 from datetime import datetime
-from bs4 import BeautifulSoup
 
+import scrapers
+from analysis import (
+    CALENDAR_DAYS, TRADING_DAYS, add_forward_returns, bootstrap_win_rate, drop_grid, drop_stats, find_drop_days,
+    horizon_text,
+)
+from indicators import (
+    buffett_field, build_refresher, interpret_buffett, interpret_fgi, interpret_pci, interpret_qqq,
+    interpret_rsi, interpret_usd_krw, interpret_vix,
+)
+from price_store import get_history
+import scanner
+from market_data import download_market_history
+
+INDICATOR_WAIT = 8  # 콜드 스타트 시 첫 갱신을 기다리는 최대 시간(초)
+INDICATOR_GRACE = 3600  # 갱신 실패 시 직전 값을 계속 보여주는 최대 나이(초)
+AUTO_REFRESH_SEC = 60  # 자동 새로고침 주기(초)
+REFRESH_COOLDOWN_SEC = 30  # 새로고침 버튼 재사용 대기 시간(초)
+# 분석 기간 선택지 (N일 분석 / 종목 스캔 공용)
+DAY_OPTIONS = {
+    "1일": 1,
+    "3일": 3,
+    "5일": 5,
+    "1주(7일)": 7,
+    "2주(14일)": 14,
+    "1개월(30일)": 30,
+    "3개월(90일)": 90,
+    "6개월(180일)": 180,
+    "1년(365일)": 365,
+}
+HORIZON_UNIT_LABELS = {"달력일": CALENDAR_DAYS, "거래일": TRADING_DAYS}
+GRID_THRESHOLDS = (1.0, 2.0, 3.0, 5.0)  # 격자 비교용 하락 기준(%) (선택한 기준은 자동 포함)
+# 새로고침 대상 → 지표 이름 (None은 전체)
+REFRESH_TARGETS = {
+    "전체": None,
+    "공포 & 탐욕 지수": ("fgi",),
+    "Put/Call 비율": ("pci",),
+    "시세 지표 (VIX, RSI, QQQ, 버핏, 환율)": ("qqq", "vix", "rsi", "buffett", "buffett_actual", "usd_krw"),
+}
 
 try:
     from stock_library import (
-        KOREAN_STOCKS, 
+        get_all_sectors,
         get_ticker_from_name, 
         process_ticker_input,
         get_stock_count
@@ -302,305 +338,30 @@ button[kind="primary"] { background: #00D09C !important; color: #0C0D10 !importa
 """, unsafe_allow_html=True)
 
 # Market data functions
-@st.cache_data(ttl=60)  # Cache for 1 minute
-def get_qqq_data():
-    try:
-        qqq = yf.Ticker("QQQ")
-        data = qqq.history(period="1d")
-        if data.empty:
-            return None, None
-        qqq_price = data['Close'].iloc[-1]
-        qqq_history = qqq.history(period="200d")['Close']
-        if len(qqq_history) < 200:
-            return None, None
-        qqq_sma = qqq_history.mean()
-        return qqq_price, qqq_sma
-    except Exception:
-        return None, None
-
-@st.cache_data(ttl=60)
-def get_vix_data():
-    try:
-        vix_symbols = ["^VIX", "VIX", "VIXY"]
-        
-        for symbol in vix_symbols:
-            try:
-                vix = yf.Ticker(symbol)
-                data = vix.history(period="5d")  # 더 긴 기간으로 시도
-                if not data.empty and len(data) > 0:
-                    return data['Close'].iloc[-1]
-            except:
-                continue
-        
-        
-        return None
-    except Exception:
-        return None
-
-@st.cache_data(ttl=60)
-def get_usd_krw_rate():
-    """원달러 환율 정보 가져오기"""
-    try:
-        # yfinance로 USD/KRW 환율 가져오기
-        usd_krw = yf.Ticker("USDKRW=X")
-        data = usd_krw.history(period="5d")  # 더 많은 데이터로 확실한 전날 비교
-        if not data.empty and len(data) >= 2:
-            current_rate = data['Close'].iloc[-1]
-            prev_rate = data['Close'].iloc[-2]
-            
-            # 변화량과 변화율 계산
-            change_amount = current_rate - prev_rate
-            change_pct = (change_amount / prev_rate) * 100
-            
-            return current_rate, change_amount, change_pct
-        return None, None, None
-    except Exception:
-        return None, None, None
-
-@st.cache_data(ttl=300)  # Cache for 5 minutes due to web scraping
-def fetch_fgi():
-    try:
-        url = 'https://feargreedmeter.com/'
-        headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        fgi_element = soup.find('div', class_='text-center text-4xl font-semibold mb-1 text-white')
-        if fgi_element:
-            fgi_text = fgi_element.text.strip()
-            return int(fgi_text) if fgi_text.isdigit() else None
-        return None
-    except Exception:
-        return None
-
-@st.cache_data(ttl=300)
-def fetch_pci():
-    try:
-        url = 'https://ycharts.com/indicators/cboe_equity_put_call_ratio'
-        headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        td_elements = soup.find_all('td', class_='col-6')
-        for td in td_elements:
-            try:
-                return float(td.text.strip().replace(',', ''))
-            except ValueError:
-                continue
-        return None
-    except Exception:
+@st.cache_resource
+def get_refresher():
+    """세션 간 공유하는 지표 백그라운드 갱신기 (프로세스당 하나)"""
+    return build_refresher(
+        download_market_history, scrapers.fetch_fgi, scrapers.fetch_pci, scrapers.fetch_buffett,
+        grace=INDICATOR_GRACE,
+    ).start()
+
+def get_indicator_snapshot():
+    """최신 지표 스냅샷. 콜드 스타트면 첫 갱신 시도까지만 잠깐 대기"""
+    refresher = get_refresher()
+    if refresher.ready():
+        return refresher.snapshot()
+    return refresher.wait_ready(INDICATOR_WAIT)
+
+def _age_text(snap, name):
+    age = snap.age(name)
+    if age is None:
         return None
+    text = f"{int(age)}초 전" if age < 120 else f"{int(age // 60)}분 전"
+    # 최근 갱신이 실패해 직전 값을 보여주는 중
+    return f"{text} (지연)" if snap.is_stale(name) else text
 
-@st.cache_data(ttl=300)
-def fetch_buffett_indicator():
-    """버핏 지수 (미국 주식 시가총액 대비 GDP 비율) 가져오기"""
-    try:
-        # Wilshire 5000 지수를 yfinance로 직접 가져오기
-        wilshire = yf.Ticker("^W5000")
-        wilshire_data = wilshire.history(period="1d")
-        
-        if not wilshire_data.empty:
-            wilshire_value = wilshire_data['Close'].iloc[-1]
-            
-            # Wilshire 5000은 미국 전체 시장 시가총액을 나타냄 (단위: 십억 달러)
-            # GDP는 약 25조 달러 (2024년 기준)
-            # 실제 GDP 데이터는 FRED API가 필요하지만, 최근 추정치 사용
-            gdp_estimate = 29184  # 27조 달러 (2024년 추정)
-            # 29184890
-            # 버핏 지수 계산: (시가총액 / GDP) * 100
-            # Wilshire 5000 지수는 포인트당 약 10억 달러를 나타냄
-            market_cap = wilshire_value  # 십억 달러 단위
-            buffett_ratio = (market_cap / gdp_estimate) * 100
-            
-            return buffett_ratio, "wilshire"
-        
-        # Wilshire 5000이 실패한 경우 SPY 기반 추정
-        spy = yf.Ticker("SPY")
-        spy_data = spy.history(period="1d")
-        if spy_data.empty:
-            return None, None
-            
-        # SPY ETF 가격을 기반으로 S&P 500 추정 시가총액 계산
-        spy_price = spy_data['Close'].iloc[-1]
-        
-        # 대략적인 버핏 지수 계산 (SPY 기반 추정)
-        # 역사적으로 SPY $400 수준에서 버핏 지수가 약 180% 정도
-        estimated_ratio = (spy_price / 400) * 180
-        
-        # 더 정확한 방법: 웹 스크래핑으로 실제 버핏 지수 가져오기
-        try:
-            url = 'https://www.longtermtrends.net/market-cap-to-gdp-the-buffett-indicator/'
-            headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
-            response = requests.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 페이지에서 현재 비율 찾기
-            ratio_elements = soup.find_all('span', class_='indicator-value')
-            if ratio_elements:
-                for element in ratio_elements:
-                    text = element.text.strip()
-                    if '%' in text:
-                        ratio_str = text.replace('%', '').strip()
-                        try:
-                            actual_ratio = float(ratio_str)
-                            return actual_ratio, "actual"
-                        except ValueError:
-                            continue
-        except:
-            pass
-            
-        # 실제 데이터를 가져올 수 없는 경우 추정치 사용
-        return estimated_ratio, "estimated"
-        
-    except Exception:
-        return None, None
-
-def calculate_rsi(data, window=14):
-    try:
-        delta = data.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=window).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=window).mean()
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi.iloc[-1] if not rsi.empty else None
-    except:
-        return None
-
-# Interpretation functions
-def interpret_fgi(fgi):
-    if fgi is None:
-        return "데이터 없음", "neutral"
-    if fgi <= 25:
-        return "극심한 공포 (매수 신호)", "bullish"
-    elif fgi <= 45:
-        return "공포 (매수 신호)", "bullish"
-    elif fgi <= 55:
-        return "중립적 (유지 또는 관망)", "neutral"
-    elif fgi <= 75:
-        return "탐욕적 (매도 신호)", "bearish"
-    else:
-        return "극도로 탐욕적 (매도 신호)", "bearish"
-
-def interpret_vix(vix):
-    if vix is None:
-        return "데이터 없음", "neutral"
-    if vix < 15:
-        return "변동성 낮음 (안정적 상승장)", "bullish"
-    elif vix < 25:
-        return "변동성 중간 (중립)", "neutral"
-    else:
-        return "변동성 높음 (불안정)", "bearish"
-
-def interpret_pci(pci):
-    if pci is None:
-        return "데이터 없음", "neutral"
-    if pci > 0.95:
-        return "하락 베팅 증가 (역발상 매수 신호)", "bullish"
-    elif pci < 0.65:
-        return "상승 베팅 증가 (역발상 매도 신호)", "bearish"
-    else:
-        return "중립적 상태", "neutral"
-
-def interpret_rsi(rsi):
-    if rsi is None:
-        return "데이터 없음", "neutral"
-    if rsi < 30:
-        return "과매도 (매수 신호)", "bullish"
-    elif rsi > 70:
-        return "과매수 (매도 신호)", "bearish"
-    else:
-        return "중립", "neutral"
-
-def interpret_buffett_indicator(ratio, data_type):
-    if ratio is None:
-        return "데이터 없음", "neutral"
-    
-    if data_type == "wilshire":
-        data_suffix = " (Wilshire 5000 기준)"
-    elif data_type == "estimated":
-        data_suffix = " (추정)"
-    else:
-        data_suffix = ""
-    
-    if ratio <= 80:
-        return f"심각한 저평가{data_suffix} (강력한 매수 신호)", "bullish"
-    elif ratio <= 100:
-        return f"저평가{data_suffix} (매수 신호)", "bullish"
-    elif ratio <= 120:
-        return f"적정 가치{data_suffix} (중립)", "neutral"
-    elif ratio <= 140:
-        return f"약간 고평가{data_suffix} (주의)", "neutral"
-    elif ratio <= 180:
-        return f"고평가{data_suffix} (매도 신호)", "bearish"
-    else:
-        return f"심각한 고평가{data_suffix} (강력한 매도 신호)", "bearish"
-
-def interpret_usd_krw(rate, change_amount, change_pct):
-    if rate is None:
-        return "데이터 없음", "neutral"
-    
-    if change_amount > 0:
-        arrow = "↗️"
-        amount_text = f"(↗️ {change_amount:.1f}원, +{change_pct:.2f}%)"
-        sentiment = "bearish"  # 원화 약세
-        trend_text = "전일 대비"
-    elif change_amount < 0:
-        arrow = "↘️"
-        amount_text = f"(↘️ {abs(change_amount):.1f}원, {change_pct:.2f}%)"
-        sentiment = "bullish"  # 원화 강세
-        trend_text = "전일 대비"
-    else:
-        arrow = "➡️"
-        amount_text = "(➡️ 보합)"
-        sentiment = "neutral"
-        trend_text = "보합"
-    
-    return f"{trend_text} {amount_text}", sentiment
-
-def get_trading_day_after(data_index, target_date, days_after):
-    """
-    특정 날짜로부터 정확히 N 달력일 후의 가장 가까운 거래일을 찾는 함수
-    """
-    try:
-        # N 달력일 후의 날짜 계산
-        target_calendar_date = target_date + pd.Timedelta(days=days_after)
-        
-        # 해당 날짜 이후의 첫 번째 거래일 찾기
-        future_dates = data_index[data_index >= target_calendar_date]
-        
-        if len(future_dates) > 0:
-            return future_dates[0]
-        else:
-            return None
-    except (KeyError, IndexError):
-        return None
-
-def add_nday_later_prices(signal_days, data, days_after):
-    """
-    각 신호일로부터 정확히 N 달력일 후의 가격을 추가하는 함수
-    """
-    nday_later_prices = []
-    actual_days_list = []
-    
-    for signal_date in signal_days.index:
-        # N 달력일 후의 거래일 찾기
-        future_date = get_trading_day_after(data.index, signal_date, days_after)
-        
-        if future_date is not None and future_date in data.index:
-            nday_later_prices.append(data.loc[future_date, 'Close'])
-            # 실제 경과된 달력일 계산
-            actual_days = (future_date - signal_date).days
-            actual_days_list.append(actual_days)
-        else:
-            nday_later_prices.append(None)
-            actual_days_list.append(None)
-    
-    signal_days[f'Price_{days_after}D_Later'] = nday_later_prices
-    signal_days[f'Actual_Days_Later'] = actual_days_list
-    return signal_days
-
-def display_metric(title, value, interpretation, sentiment):
+def display_metric(title, value, interpretation, sentiment, age=None):
     pill_class = f"pill-{sentiment}"
     pill_label = {"bullish": "매수", "bearish": "매도", "neutral": "중립"}.get(sentiment, "")
     value_class = sentiment if sentiment in ("bullish", "bearish") else ""
@@ -608,35 +369,24 @@ def display_metric(title, value, interpretation, sentiment):
     <div class="metric-card {sentiment}">
         <div class="mc-label">{title}</div>
         <div class="mc-value {value_class}">{value}<span class="signal-pill {pill_class}">{pill_label}</span></div>
-        <div class="mc-interp">{interpretation}</div>
+        <div class="mc-interp">{interpretation}{f" · {age} 갱신" if age else ""}</div>
     </div>
     """, unsafe_allow_html=True)
 
 # Tab 1: Market Sentiment
-def market_sentiment_tab():
-    col_refresh, col_auto = st.columns([1, 4])
-    with col_refresh:
-        if st.button("새로고침", key="refresh_market"):
-            st.cache_data.clear()
-            st.rerun()
-    with col_auto:
-        auto_refresh = st.checkbox("자동 새로고침 (60초)", key="auto_refresh")
-
+def indicator_cards():
+    """지표 카드 2열 그리드 (자동 새로고침 시 fragment로 이 부분만 재실행)"""
     with st.spinner("시장 데이터 불러오는 중..."):
-        # Get all market data
-        qqq_price, qqq_sma = get_qqq_data()
-        vix = get_vix_data()
-        fgi = fetch_fgi()
-        pci = fetch_pci()
-        usd_krw_rate, usd_krw_change_amount, usd_krw_change_pct = get_usd_krw_rate()
-        buffett_ratio, buffett_type = fetch_buffett_indicator()
-        
-        # Get RSI data
-        try:
-            spy_data = yf.Ticker("SPY").history(period="50d")["Close"]
-            rsi = calculate_rsi(spy_data)
-        except:
-            rsi = None
+        # 백그라운드 갱신기의 최신 스냅샷 (요청마다 원격 조회하지 않음)
+        snap = get_indicator_snapshot()
+        qqq_price, qqq_sma = snap.get("qqq") or (None, None)
+        vix = snap.get("vix")
+        fgi = snap.get("fgi")
+        pci = snap.get("pci")
+        usd_krw_rate, usd_krw_change_amount, usd_krw_change_pct = snap.get("usd_krw") or (None, None, None)
+        buffett_name = buffett_field(snap)
+        buffett_ratio, buffett_type = snap.get(buffett_name) or (None, None)
+        rsi = snap.get("rsi")
 
     # Display metrics in responsive columns (2x4 grid)
     col1, col2 = st.columns([1, 1])
@@ -644,31 +394,31 @@ def market_sentiment_tab():
     with col1:
         if fgi is not None:
             fgi_interp, fgi_sentiment = interpret_fgi(fgi)
-            display_metric("공포 & 탐욕 지수", f"{fgi}/100", fgi_interp, fgi_sentiment)
+            display_metric("공포 & 탐욕 지수", f"{fgi}/100", fgi_interp, fgi_sentiment, _age_text(snap, "fgi"))
         else:
             display_metric("공포 & 탐욕 지수", "N/A", "데이터 로딩 실패", "neutral")
 
         if buffett_ratio is not None:
-            buffett_interp, buffett_sentiment = interpret_buffett_indicator(buffett_ratio, buffett_type)
-            display_metric("버핏 지수 (시총/GDP)", f"{buffett_ratio:.1f}%", buffett_interp, buffett_sentiment)
+            buffett_interp, buffett_sentiment = interpret_buffett(buffett_ratio, buffett_type)
+            display_metric("버핏 지수 (시총/GDP)", f"{buffett_ratio:.1f}%", buffett_interp, buffett_sentiment, _age_text(snap, buffett_name))
         else:
             display_metric("버핏 지수 (시총/GDP)", "N/A", "데이터 로딩 실패", "neutral")
 
         if vix is not None:
             vix_interp, vix_sentiment = interpret_vix(vix)
-            display_metric("VIX 변동성 지수", f"{vix:.2f}", vix_interp, vix_sentiment)
+            display_metric("VIX 변동성 지수", f"{vix:.2f}", vix_interp, vix_sentiment, _age_text(snap, "vix"))
         else:
             display_metric("VIX 변동성 지수", "—", "데이터 새로고침 중", "neutral")
 
         if qqq_price is not None and qqq_sma is not None:
-            price_vs_sma = "bullish" if qqq_price > qqq_sma else "bearish"
-            trend_text = "상승 추세" if qqq_price > qqq_sma else "하락 추세"
+            qqq_interp, qqq_sentiment = interpret_qqq(qqq_price, qqq_sma)
             percentage_diff = ((qqq_price - qqq_sma) / qqq_sma) * 100
             display_metric(
                 "QQQ / 200일 이동평균",
                 f"${qqq_price:.2f}  ·  200MA ${qqq_sma:.2f}  ({percentage_diff:+.1f}%)",
-                trend_text,
-                price_vs_sma,
+                qqq_interp,
+                qqq_sentiment,
+                _age_text(snap, "qqq"),
             )
         else:
             display_metric("QQQ / 200일 이동평균", "N/A", "데이터 로딩 실패", "neutral")
@@ -676,22 +426,53 @@ def market_sentiment_tab():
     with col2:
         if pci is not None:
             pci_interp, pci_sentiment = interpret_pci(pci)
-            display_metric("Put/Call 비율", f"{pci:.3f}", pci_interp, pci_sentiment)
+            display_metric("Put/Call 비율", f"{pci:.3f}", pci_interp, pci_sentiment, _age_text(snap, "pci"))
         else:
             display_metric("Put/Call 비율", "N/A", "데이터 로딩 실패", "neutral")
 
         if rsi is not None:
             rsi_interp, rsi_sentiment = interpret_rsi(rsi)
-            display_metric("RSI — S&P500", f"{rsi:.1f}", rsi_interp, rsi_sentiment)
+            display_metric("RSI — S&P500", f"{rsi:.1f}", rsi_interp, rsi_sentiment, _age_text(snap, "rsi"))
         else:
             display_metric("RSI — S&P500", "N/A", "데이터 로딩 실패", "neutral")
 
         if usd_krw_rate is not None:
             usd_krw_interp, usd_krw_sentiment = interpret_usd_krw(usd_krw_rate, usd_krw_change_amount, usd_krw_change_pct)
-            display_metric("원달러 환율", f"₩{usd_krw_rate:.2f}", usd_krw_interp, usd_krw_sentiment)
+            display_metric("원달러 환율", f"₩{usd_krw_rate:.2f}", usd_krw_interp, usd_krw_sentiment, _age_text(snap, "usd_krw"))
         else:
             display_metric("원달러 환율", "N/A", "데이터 로딩 실패", "neutral")
 
+def refresh_indicators(target):
+    """선택한 지표(또는 전체)를 만드는 소스만 즉시 갱신. 세션별 쿨다운 적용"""
+    now = time.monotonic()
+    remaining = REFRESH_COOLDOWN_SEC - (now - st.session_state.get("last_refresh", -REFRESH_COOLDOWN_SEC))
+    if remaining > 0:
+        st.toast(f"{remaining:.0f}초 후 다시 새로고침할 수 있습니다.")
+        return
+    st.session_state["last_refresh"] = now
+
+    refresher = get_refresher()
+    fields = REFRESH_TARGETS[target]
+    names = refresher.sources_for(fields) if fields else None
+    version = refresher.snapshot().version
+    # 다른 사용자가 방금 갱신한 소스는 건너뜀 (전역 쿨다운)
+    if refresher.refresh_now(names, cooldown=REFRESH_COOLDOWN_SEC):
+        refresher.wait_newer(version, INDICATOR_WAIT)
+
+def market_sentiment_tab():
+    col_refresh, col_target, col_auto = st.columns([1, 2, 3])
+    with col_target:
+        target = st.selectbox("새로고침 대상", list(REFRESH_TARGETS), key="refresh_target",
+                              label_visibility="collapsed")
+    with col_refresh:
+        if st.button("새로고침", key="refresh_market"):
+            refresh_indicators(target)
+    with col_auto:
+        auto_refresh = st.checkbox("자동 새로고침 (60초)", key="auto_refresh")
+
+    # 자동 새로고침은 지표 카드 fragment만 주기적으로 다시 실행 (틱 사이에는 스크립트 스레드를 점유하지 않음)
+    st.fragment(indicator_cards, run_every=AUTO_REFRESH_SEC if auto_refresh else None)()
+
     st.markdown("""
     <div class="info-card">
         <h4>지표 설명</h4>
@@ -699,7 +480,7 @@ def market_sentiment_tab():
             <li><strong>공포 & 탐욕 지수</strong>: 0–100 시장 심리 지표 (0=극도 공포, 100=극도 탐욕)</li>
             <li><strong>VIX</strong>: 시장 변동성 예상 지수. 낮을수록 안정, 높을수록 불안</li>
             <li><strong>Put/Call 비율</strong>: 풋옵션 대비 콜옵션 거래량 비율</li>
-            <li><strong>RSI</strong>: 상대강도지수 — 30 이하 과매도, 70 이상 과매수</li>
+            <li><strong>RSI</strong>: 상대강도지수 (14일 Wilder 평활) — 30 이하 과매도, 70 이상 과매수</li>
             <li><strong>QQQ vs 200일 이동평균</strong>: 나스닥 ETF 장기 추세 분석</li>
             <li><strong>버핏 지수</strong>: 미국 시가총액 / GDP. 100% 이하 저평가, 180% 이상 고평가</li>
             <li><strong>원달러 환율</strong>: 상승 시 원화 약세, 하락 시 원화 강세</li>
@@ -708,12 +489,29 @@ def market_sentiment_tab():
     </div>
     """, unsafe_allow_html=True)
 
-    if auto_refresh:
-        import time
-        time.sleep(60)
-        st.rerun()
-
 # Tab 2: N-Day Drop Analysis
+def display_drop_grid(data, drop_threshold, day_options, horizon_unit):
+    """하락 기준 × 분석 기간 격자 (한 번 받은 데이터로 전체 조합 계산)"""
+    thresholds = sorted(set(GRID_THRESHOLDS) | {drop_threshold})
+    grid = drop_grid(data, thresholds, list(day_options.values()), horizon_unit)
+    labels = {days: label for label, days in day_options.items()}
+
+    def table(frame):
+        frame = frame.rename(columns=labels)
+        frame.index = [f"{t:g}% 이상" for t in frame.index]
+        return frame
+
+    st.markdown('<div class="section-title">즉시 매도가 유리했던 비율 (%)</div>', unsafe_allow_html=True)
+    st.dataframe(table(grid["win_rate"]).style.format("{:.1f}", na_rep="—"), use_container_width=True)
+    with st.expander("평균 / 중앙값 변화율, 신호 수"):
+        st.caption("평균 변화율 (%)")
+        st.dataframe(table(grid["avg_change"]).style.format("{:+.2f}", na_rep="—"), use_container_width=True)
+        st.caption("중앙값 변화율 (%)")
+        st.dataframe(table(grid["median_change"]).style.format("{:+.2f}", na_rep="—"), use_container_width=True)
+        st.caption("신호 수")
+        st.dataframe(table(grid["count"]), use_container_width=True)
+    st.markdown('<hr>', unsafe_allow_html=True)
+
 def nday_analysis_tab():
     st.markdown("""
     <div class="info-card">
@@ -743,17 +541,7 @@ def nday_analysis_tab():
                                    help="전일 대비 이 퍼센트 이상 하락한 날을 분석")
 
     with col3:
-        day_options = {
-            "1일": 1,
-            "3일": 3,
-            "5일": 5,
-            "1주(7일)": 7,
-            "2주(14일)": 14,
-            "1개월(30일)": 30,
-            "3개월(90일)": 90,
-            "6개월(180일)": 180,
-            "1년(365일)": 365
-        }
+        day_options = DAY_OPTIONS
         
         selected_label = st.selectbox(
             "분석 기간",
@@ -778,11 +566,21 @@ def nday_analysis_tab():
     elif processed_ticker != ticker_input.upper():
         st.info(f"🌏 해외 주식: **{processed_ticker}** 분석 준비")
     
+    unit_col, grid_col = st.columns(2)
+    with unit_col:
+        unit_label = st.radio("기간 단위", list(HORIZON_UNIT_LABELS), horizontal=True, key="horizon_unit",
+                              help="달력일: N일 후가 휴장일이면 다음 거래일 / 거래일: 정확히 N번째 거래일")
+        horizon_unit = HORIZON_UNIT_LABELS[unit_label]
+        horizon = horizon_text(days_after, horizon_unit)
+    with grid_col:
+        show_grid = st.checkbox("모든 하락 기준 × 분석 기간 한 번에 비교", key="show_grid",
+                                help="같은 데이터로 여러 하락 기준과 전체 분석 기간의 결과를 표로 계산")
+    
     if st.button("분석 실행", type="primary", use_container_width=True):
         with st.spinner("데이터를 불러오고 분석 중... 잠시만 기다려주세요."):
             try:
                 # Download data
-                data = yf.download(processed_ticker, start=start_date)
+                data = get_history(processed_ticker, start_date)
                 
                 if data.empty:
                     st.error(f"❌ {processed_ticker} 데이터를 찾을 수 없습니다. 티커를 확인해주세요.")
@@ -797,56 +595,33 @@ def nday_analysis_tab():
                         """)
                     return
                 
-                # Process data
-                if isinstance(data.columns, pd.MultiIndex):
-                    data.columns = data.columns.droplevel(1)
-                
-                data = data[['Close']].copy()
-                data['Pct_Change'] = data['Close'].pct_change() * 100
+                if show_grid:
+                    display_drop_grid(data, drop_threshold, day_options, horizon_unit)
                 
-                # Filter signal days (하락 기준 이상 하락한 날)
-                signal_days = data[data['Pct_Change'] <= -drop_threshold].copy()
+                # 하락 신호 통계 (N일 후 데이터가 없는 신호일은 제외)
+                stats = drop_stats(data.index, data['Close'].to_numpy(), drop_threshold, days_after, horizon_unit)
                 
-                if len(signal_days) == 0:
+                if stats.signals == 0:
                     st.warning(f"⚠️ {drop_threshold}% 이상 하락한 날이 없습니다. 기준을 낮춰보세요.")
                     return
                 
-                # Add N-day later data
-                signal_days['Price_Today'] = signal_days['Close']
-                
-                # 정확한 거래일 기준으로 N일 후 가격 계산
-                signal_days = add_nday_later_prices(signal_days, data, days_after)
-                
-                # NaN 값 제거 (N일 후 데이터가 없는 경우)
-                signal_days = signal_days.dropna(subset=[f'Price_{days_after}D_Later'])
-                
                 # 실제 달력일 수 검증을 위한 추가 정보 표시
-                if len(signal_days) > 0:
-                    avg_actual_days = signal_days['Actual_Days_Later'].mean()
-                    st.info(f"📅 목표: {days_after}일 후 → 실제 평균: {avg_actual_days:.1f}일 후 데이터 사용 (주말/공휴일로 인한 차이)")
+                if stats.total > 0:
+                    avg_actual_days = stats.avg_actual_days
+                    if horizon_unit == TRADING_DAYS:
+                        st.info(f"📅 {days_after}거래일 후 = 평균 {avg_actual_days:.1f} 달력일 후")
+                    else:
+                        st.info(f"📅 목표: {days_after}일 후 → 실제 평균: {avg_actual_days:.1f}일 후 데이터 사용 (주말/공휴일로 인한 차이)")
                 
-                if len(signal_days) == 0:
-                    st.warning(f"⚠️ {days_after}일 후 데이터가 있는 하락일이 없습니다. 기간을 조정해보세요.")
+                if stats.total == 0:
+                    st.warning(f"⚠️ {horizon} 후 데이터가 있는 하락일이 없습니다. 기간을 조정해보세요.")
                     return
                 
-                # Win/Lose 판단
-                signal_days['Result'] = signal_days.apply(
-                    lambda row: 'Win' if row['Price_Today'] > row[f'Price_{days_after}D_Later'] else 'Lose',
-                    axis=1
-                )
-                
-                # Calculate price change
-                signal_days[f'Price_Change_{days_after}D'] = (
-                    (signal_days[f'Price_{days_after}D_Later'] - signal_days['Price_Today']) / signal_days['Price_Today'] * 100
-                )
-                
                 # 결과 요약
-                counts = signal_days['Result'].value_counts()
-                total_signals = len(signal_days)
-                win_count = counts.get('Win', 0)
-                lose_count = counts.get('Lose', 0)
-                winrate = (win_count / total_signals) if total_signals > 0 else 0
-                rate = winrate*100
+                total_signals = stats.total
+                win_count = stats.win
+                lose_count = stats.lose
+                rate = stats.win_rate
                 
                 # Display main results
                 display_ticker = f"{company_name} ({processed_ticker})" if company_name else processed_ticker
@@ -858,17 +633,17 @@ def nday_analysis_tab():
                 with col1:
                     st.metric("총 신호", f"{total_signals}회")
                 with col2:
-                    st.metric("평균 하락률", f"{signal_days['Pct_Change'].mean():.2f}%")
+                    st.metric("평균 하락률", f"{stats.avg_drop_pct:.2f}%")
                 with col3:
-                    st.metric("최대 하락률", f"{signal_days['Pct_Change'].min():.2f}%")
+                    st.metric("최대 하락률", f"{stats.max_drop_pct:.2f}%")
                 with col4:
-                    avg_nd_change = signal_days[f'Price_Change_{days_after}D'].mean()
-                    st.metric(f"평균 {days_after}일 변화", f"{avg_nd_change:+.2f}%")
+                    avg_nd_change = stats.avg_change
+                    st.metric(f"평균 {horizon} 변화", f"{avg_nd_change:+.2f}%")
                 
                 st.markdown("---")
                 
                 # Win/Lose breakdown
-                st.subheader(f"{days_after}일 후 방향 분석")
+                st.subheader(f"{horizon} 후 방향 분석")
                 
                 result_cols = st.columns(2)
                 
@@ -878,7 +653,7 @@ def nday_analysis_tab():
                     <div class="result-card sell">
                         <h4>즉시 매도가 유리했던 경우</h4>
                         <div class="big-num">{win_percentage:.1f}%</div>
-                        <p>{win_count}회 — 하락일 즉시 매도 시 {days_after}일 후보다 유리</p>
+                        <p>{win_count}회 — 하락일 즉시 매도 시 {horizon} 후보다 유리</p>
                     </div>
                     """, unsafe_allow_html=True)
 
@@ -888,7 +663,7 @@ def nday_analysis_tab():
                     <div class="result-card buy">
                         <h4>기다리는 것이 유리했던 경우</h4>
                         <div class="big-num">{lose_percentage:.1f}%</div>
-                        <p>{lose_count}회 — {days_after}일 후 가격이 하락일보다 높았음</p>
+                        <p>{lose_count}회 — {horizon} 후 가격이 하락일보다 높았음</p>
                     </div>
                     """, unsafe_allow_html=True)
 
@@ -897,19 +672,19 @@ def nday_analysis_tab():
 
                 ticker_display = company_name if company_name else processed_ticker
 
-                if winrate > 0.55:
+                if stats.strategy == 'sell':
                     strategy_html = f"""
                     <div class="strategy-card sell-strat">
                         <h4>즉시 매도 전략 추천</h4>
                         <p><strong>{rate:.1f}%</strong> 확률로 즉시 매도가 유리했습니다.</p>
                         <p>{ticker_display} 종목이 {drop_threshold}% 이상 하락하면 매도를 고려하세요.</p>
                     </div>"""
-                elif winrate < 0.45:
+                elif stats.strategy == 'wait':
                     strategy_html = f"""
                     <div class="strategy-card buy-strat">
                         <h4>대기 전략 추천</h4>
-                        <p><strong>{(100-rate):.1f}%</strong> 확률로 {days_after}일 기다리는 것이 유리했습니다.</p>
-                        <p>{ticker_display} 종목이 {drop_threshold}% 이상 하락해도 {days_after}일은 기다려보세요.</p>
+                        <p><strong>{(100-rate):.1f}%</strong> 확률로 {horizon} 기다리는 것이 유리했습니다.</p>
+                        <p>{ticker_display} 종목이 {drop_threshold}% 이상 하락해도 {horizon}은 기다려보세요.</p>
                     </div>"""
                 else:
                     strategy_html = f"""
@@ -920,40 +695,50 @@ def nday_analysis_tab():
                     </div>"""
 
                 st.markdown(strategy_html, unsafe_allow_html=True)
+                boot = bootstrap_win_rate(stats.wins)
+                ci_method = (f"부트스트랩 {boot['resamples']:,}회" if boot["method"] == "bootstrap"
+                             else "표본이 적어 Wilson 구간")
+                st.caption(
+                    f"즉시 매도 유리 비율 95% 신뢰구간 {boot['ci_low']:.1f}% ~ {boot['ci_high']:.1f}% · "
+                    f"50% 대비 p-value {boot['p_value']:.3f} (이항검정, {ci_method})"
+                )
                 
                 # Recent examples
-                if len(signal_days) > 0:
+                if stats.total > 0:
                     st.markdown("---")
                     st.subheader("최근 하락 신호 사례 (최근 50개)")
                     
+                    # 사례 표에만 신호일별 프레임 사용
+                    prices, signal_days = find_drop_days(data, drop_threshold)
+                    signal_days = add_forward_returns(signal_days, prices, days_after, horizon_unit)
                     recent_signals = signal_days.tail(50).sort_index(ascending=False).copy()          
                     recent_signals.index = recent_signals.index.strftime('%Y-%m-%d')
                     
                     # Prepare display data
-                    display_data = recent_signals[['Pct_Change', 'Price_Today', f'Price_{days_after}D_Later', f'Price_Change_{days_after}D', 'Result']].copy()
+                    display_data = recent_signals[['Pct_Change', 'Price_Today', f'Price_{days_after}D_Later', f'Change_{days_after}D', 'Result']].copy()
                     
                     # 가격 단위 조정 (한국 주식의 경우)
                     if company_name:
-                        display_data.columns = ['하락률(%)', '당일종가(₩)', f'{days_after}일후종가(₩)', f'{days_after}일간변화(%)', '결과']
+                        display_data.columns = ['하락률(%)', '당일종가(₩)', f'{horizon}후종가(₩)', f'{horizon}간변화(%)', '결과']
                         # 한국 주식은 원 단위로 표시 (소수점 제거)
                         display_data['당일종가(₩)'] = display_data['당일종가(₩)'].round(0).astype(int)
-                        display_data[f'{days_after}일후종가(₩)'] = display_data[f'{days_after}일후종가(₩)'].round(0).astype(int)
+                        display_data[f'{horizon}후종가(₩)'] = display_data[f'{horizon}후종가(₩)'].round(0).astype(int)
                         display_data['하락률(%)'] = display_data['하락률(%)'].round(2)
-                        display_data[f'{days_after}일간변화(%)'] = display_data[f'{days_after}일간변화(%)'].round(2)
+                        display_data[f'{horizon}간변화(%)'] = display_data[f'{horizon}간변화(%)'].round(2)
                     else:
-                        display_data.columns = ['하락률(%)', '당일종가($)', f'{days_after}일후종가($)', f'{days_after}일간변화(%)', '결과']
+                        display_data.columns = ['하락률(%)', '당일종가($)', f'{horizon}후종가($)', f'{horizon}간변화(%)', '결과']
                         display_data = display_data.round(2)
 
                     display_data['결과'] = display_data['결과'].map({
-                        'Win': f'{days_after}일 후 📉',
-                        'Lose': f'{days_after}일 후 📈'
+                        'Win': f'{horizon} 후 📉',
+                        'Lose': f'{horizon} 후 📈'
                     })
                     
                     # Color code the results
                     def color_result(val):
-                        if val == f'{days_after}일 후 📉':
+                        if val == f'{horizon} 후 📉':
                             return 'background-color: #f8d7da; color: #721c24'
-                        elif val == f'{days_after}일 후 📈':
+                        elif val == f'{horizon} 후 📈':
                             return 'background-color: #d4edda; color: #155724'
                         return ''
                     
@@ -964,8 +749,8 @@ def nday_analysis_tab():
                             return 'color: #dc3545; font-weight: bold'
                         return ''
 
-                    styled_df = display_data.style.applymap(color_result, subset=['결과']) \
-                                                  .applymap(color_change, subset=[f'{days_after}일간변화(%)'])
+                    styled_df = display_data.style.map(color_result, subset=['결과']) \
+                                                  .map(color_change, subset=[f'{horizon}간변화(%)'])
                     
                     st.dataframe(styled_df, use_container_width=True)
                         
@@ -975,14 +760,14 @@ def nday_analysis_tab():
 
                 col1, col2, col3 = st.columns(3)
                 with col1:
-                    avg_win_change = signal_days[signal_days['Result'] == 'Win'][f'Price_Change_{days_after}D'].mean()
-                    st.metric(f"매도 유리 시 평균 {days_after}일 변화", f"{avg_win_change:+.2f}%" if not pd.isna(avg_win_change) else "N/A")
+                    avg_win_change = stats.avg_win_change
+                    st.metric(f"매도 유리 시 평균 {horizon} 변화", f"{avg_win_change:+.2f}%" if avg_win_change is not None else "N/A")
                 with col2:
-                    avg_lose_change = signal_days[signal_days['Result'] == 'Lose'][f'Price_Change_{days_after}D'].mean()
-                    st.metric(f"대기 유리 시 평균 {days_after}일 변화", f"{avg_lose_change:+.2f}%" if not pd.isna(avg_lose_change) else "N/A")
+                    avg_lose_change = stats.avg_lose_change
+                    st.metric(f"대기 유리 시 평균 {horizon} 변화", f"{avg_lose_change:+.2f}%" if avg_lose_change is not None else "N/A")
                 with col3:
-                    median_change = signal_days[f'Price_Change_{days_after}D'].median()
-                    st.metric(f"{days_after}일 변화 중간값", f"{median_change:+.2f}%")
+                    median_change = stats.median_change
+                    st.metric(f"{horizon} 변화 중간값", f"{median_change:+.2f}%")
                 
                 st.markdown("""
                 <div class="info-card">
@@ -1010,6 +795,58 @@ def nday_analysis_tab():
                     """)
 
 # Main App
+# Tab 3: Universe Scan
+def scan_tab():
+    st.markdown("""
+    <div class="info-card">
+        <h4>종목 스캔</h4>
+        <ul>
+            <li>섹터 전체(또는 등록된 한국 종목 전체)에 N일 후 하락 분석을 한 번에 적용해 순위를 매깁니다.</li>
+            <li><strong>즉시 매도 유리 비율</strong>이 높을수록 하락 후 추가 하락이 잦았던 종목입니다.</li>
+        </ul>
+    </div>
+    """, unsafe_allow_html=True)
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        sector = st.selectbox("대상", [scanner.ALL] + get_all_sectors(), index=1, key="scan_sector")
+    with col2:
+        drop_threshold = st.slider("하락 기준 (%)", min_value=0.5, max_value=20.0, value=3.0, step=0.5,
+                                   key="scan_threshold")
+    with col3:
+        days_label = st.selectbox("분석 기간", list(DAY_OPTIONS), index=3, key="scan_days")
+    with col4:
+        start_date = st.date_input("시작일", value=pd.to_datetime("2020-01-01"),
+                                   max_value=pd.to_datetime("today"), key="scan_start")
+
+    col5, col6 = st.columns(2)
+    with col5:
+        sort_label = st.radio("정렬 기준", ["즉시 매도 유리 비율", "평균 변화율"], horizontal=True, key="scan_sort")
+    with col6:
+        min_signals = st.number_input("최소 신호 수", min_value=1, value=5, step=1, key="scan_min_signals")
+    sort_by = "win_rate" if sort_label == "즉시 매도 유리 비율" else "avg_change_pct"
+
+    codes = scanner.universe(sector)
+    if sector == scanner.ALL:
+        st.caption(f"⚠️ {len(codes)}개 종목 전체 스캔은 몇 분 걸릴 수 있습니다.")
+
+    if st.button("스캔 실행", type="primary", use_container_width=True, key="scan_run"):
+        days_after = DAY_OPTIONS[days_label]
+        progress = st.progress(0.0, text="스캔 준비 중...")
+        table = st.empty()
+        results = []
+        # 청크가 끝날 때마다 진행률과 부분 순위를 갱신
+        for done, partial in scanner.scan(codes, drop_threshold, days_after, start_date):
+            results.extend(partial)
+            progress.progress(done / len(codes), text=f"{done}/{len(codes)} 종목 완료")
+            ranking = scanner.rank(results, sort_by, min_signals, 30)
+            if ranking:
+                frame = pd.DataFrame(ranking).set_index("code")[["name", "total_signals", "win_rate", "avg_change_pct"]]
+                frame.columns = ["종목명", "신호 수", "즉시 매도 유리(%)", f"평균 {days_after}일 변화(%)"]
+                table.dataframe(frame, use_container_width=True)
+        if not results:
+            st.warning(f"⚠️ {drop_threshold}% 이상 하락한 종목이 없습니다.")
+
 def main():
     st.markdown("""
     <div class="app-header">
@@ -1018,7 +855,7 @@ def main():
     </div>
     """, unsafe_allow_html=True)
 
-    tab1, tab2 = st.tabs(["시장 심리 지표", "N일 후 하락 분석"])
+    tab1, tab2, tab3 = st.tabs(["시장 심리 지표", "N일 후 하락 분석", "종목 스캔"])
 
     with tab1:
         market_sentiment_tab()
@@ -1026,6 +863,9 @@ def main():
     with tab2:
         nday_analysis_tab()
 
+    with tab3:
+        scan_tab()
+
     current_time = datetime.now().strftime('%Y-%m-%d %H:%M')
     st.markdown(f"""
     <hr>
@@ -0,0 +1,68 @@
+"""가격 아레나 벤치마크: Parquet 읽기 vs mmap 아레나 매핑 (200종목 × 30년, 임시 저장소).
+
+실행: python benchmarks/bench_arena.py
+"""
+import os
+import pickle
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import price_store  # noqa: E402
+from analysis import PriceArrays  # noqa: E402
+
+YEARS = 30
+TICKERS = 200
+START = "1995-01-02"
+
+
+def history(bars, seed):
+    idx = pd.bdate_range(START, periods=bars, name="Date")
+    close = 50_000 * np.cumprod(1 + np.random.default_rng(seed).normal(0, 0.02, bars))
+    return pd.DataFrame({
+        "Open": close, "High": close * 1.01, "Low": close * 0.99, "Close": close,
+        "Volume": np.random.default_rng(seed).integers(1e5, 1e7, bars).astype(float),
+    }, index=idx)
+
+
+def measure(label, load):
+    """(소요 시간, 결과를 들고 있는 동안의 힙: Python/numpy 할당 + Arrow 메모리 풀)."""
+    tracemalloc.start()
+    arrow_before = pa.total_allocated_bytes()
+    t0 = time.perf_counter()
+    loaded = load()
+    elapsed = time.perf_counter() - t0
+    heap = tracemalloc.get_traced_memory()[0] + pa.total_allocated_bytes() - arrow_before
+    tracemalloc.stop()
+    print(f"  {label:<30} {elapsed * 1e3:8.1f} ms  힙 {heap / 2**20:7.2f} MB")
+    return loaded
+
+
+def main():
+    price_store.STORE_DIR = tempfile.mkdtemp(prefix="bench_arena_")
+    tickers = [f"{i:06d}.KS" for i in range(TICKERS)]
+    for i, ticker in enumerate(tickers):
+        price_store._write(price_store._path(ticker, True), history(YEARS * 252, i), pd.Timestamp(START))
+
+    print(f"{TICKERS}종목 × {YEARS}년 로드")
+    measure("Parquet 전체 열", lambda: {t: price_store._read(price_store._path(t, True))[0] for t in tickers})
+    measure("Parquet 종가·거래량 → 압축",
+            lambda: {t: PriceArrays.from_frame(price_store._read(price_store._path(t, True),
+                                                                  ["Close", "Volume"])[0]) for t in tickers})
+    mapped = measure("아레나 mmap (get_price_arrays)", lambda: price_store.get_price_arrays(tickers, START))
+
+    in_memory = {t: PriceArrays(a.days.copy(), a.close.copy(), a.volume.copy()) for t, a in mapped.items()}
+    print("워커로 넘기는 피클 크기")
+    print(f"  메모리 배열   {len(pickle.dumps(in_memory)) / 2**20:7.2f} MB")
+    print(f"  아레나 매핑   {len(pickle.dumps(mapped)) / 2**20:7.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""하락 신호 통계 벤치마크: 기존 행 단위 apply 경로 vs 프레임 파이프라인 vs 배열 커널(drop_stats).
+
+실행: python benchmarks/bench_drop_stats.py
+"""
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analysis import (  # noqa: E402
+    add_forward_returns, drop_stats, find_drop_days, forward_prices,
+)
+
+BARS = 10_000
+DROP_THRESHOLD = 2.0
+DAYS_AFTER = 7
+
+
+def legacy(data, drop_threshold, days_after):
+    """행마다 apply로 결과를 붙이고 value_counts를 두 번 부르던 기존 방식."""
+    data = data.copy()
+    data["Pct_Change"] = data["Close"].pct_change() * 100
+    signal_days = data[data["Pct_Change"] <= -drop_threshold].copy()
+    signal_days["Price_Today"] = signal_days["Close"]
+    later = f"Price_{days_after}D_Later"
+    signal_days[later] = forward_prices(data.index, data["Close"].to_numpy(), signal_days.index, days_after)[0]
+    signal_days = signal_days.dropna(subset=[later]).copy()
+    signal_days["Result"] = signal_days.apply(
+        lambda r: "Win" if r["Price_Today"] > r[later] else "Lose", axis=1)
+    change = (signal_days[later] - signal_days["Price_Today"]) / signal_days["Price_Today"] * 100
+    signal_days[f"Change_{days_after}D"] = change
+    win = int(signal_days["Result"].value_counts().get("Win", 0))
+    lose = int(signal_days["Result"].value_counts().get("Lose", 0))
+    return (win, lose, change.mean(), change.median(),
+            signal_days[signal_days["Result"] == "Win"][f"Change_{days_after}D"].mean(),
+            signal_days[signal_days["Result"] == "Lose"][f"Change_{days_after}D"].mean())
+
+
+def pipeline(data, drop_threshold, days_after):
+    """신호일 프레임을 만든 뒤 열 단위로 요약하는 방식 (앱의 최근 사례 표가 쓰는 경로)."""
+    prices, signal_days = find_drop_days(data, drop_threshold)
+    signal_days = add_forward_returns(signal_days, prices, days_after)
+    change = signal_days[f"Change_{days_after}D"]
+    win = signal_days["Result"] == "Win"
+    return int(win.sum()), int((~win).sum()), change.mean(), change.median(), change[win].mean(), change[~win].mean()
+
+
+def bench(label, fn, number):
+    per_call = min(timeit.repeat(fn, number=number, repeat=5)) / number
+    print(f"  {label:<28} {per_call * 1e3:9.3f} ms")
+    return per_call
+
+
+def main():
+    idx = pd.bdate_range("1985-01-01", periods=BARS)
+    close = 100 * np.cumprod(1 + np.random.default_rng(0).normal(0, 0.02, BARS))
+    data = pd.DataFrame({"Close": close}, index=idx)
+    print(f"{BARS}봉, {DROP_THRESHOLD}% 하락, {DAYS_AFTER}일 후")
+    old = bench("행 단위 apply (기존)", lambda: legacy(data, DROP_THRESHOLD, DAYS_AFTER), 3)
+    frame = bench("프레임 파이프라인", lambda: pipeline(data, DROP_THRESHOLD, DAYS_AFTER), 20)
+    kernel = bench("배열 커널 drop_stats",
+                   lambda: drop_stats(idx, close, DROP_THRESHOLD, DAYS_AFTER), 50)
+    print(f"  커널 가속: 기존 대비 {old / kernel:.0f}배, 파이프라인 대비 {frame / kernel:.1f}배")
+
+
+if __name__ == "__main__":
+    main()
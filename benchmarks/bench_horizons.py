@@ -0,0 +1,48 @@
+"""N일 후 가격 조회 벤치마크: 달력일(searchsorted) vs 거래일(위치 이동) vs 기존 행 루프.
+
+실행: python benchmarks/bench_horizons.py
+"""
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analysis import CALENDAR_DAYS, TRADING_DAYS, add_forward_returns, find_drop_days  # noqa: E402
+
+BARS = 10_000
+DAYS_AFTER = 7
+
+
+def legacy_calendar(signal_days, prices, days_after):
+    later = []
+    for date in signal_days.index:
+        future = prices.index[prices.index >= date + pd.Timedelta(days=days_after)]
+        later.append(prices.loc[future[0], "Close"] if len(future) else np.nan)
+    return later
+
+
+def bench(label, fn, number):
+    per_call = min(timeit.repeat(fn, number=number, repeat=5)) / number
+    print(f"  {label:<28} {per_call * 1e3:9.3f} ms")
+    return per_call
+
+
+def main():
+    idx = pd.bdate_range("1985-01-01", periods=BARS)
+    close = 100 * np.cumprod(1 + np.random.default_rng(0).normal(0, 0.02, BARS))
+    prices, signal_days = find_drop_days(pd.DataFrame({"Close": close}, index=idx), 1.0)
+    print(f"{BARS}봉, 신호 {len(signal_days)}개, {DAYS_AFTER}일 후")
+    legacy = bench("행 루프 (달력일)", lambda: legacy_calendar(signal_days, prices, DAYS_AFTER), 1)
+    calendar = bench("searchsorted (달력일)",
+                     lambda: add_forward_returns(signal_days, prices, DAYS_AFTER, CALENDAR_DAYS), 20)
+    trading = bench("위치 이동 (거래일)",
+                    lambda: add_forward_returns(signal_days, prices, DAYS_AFTER, TRADING_DAYS), 20)
+    print(f"  달력일 가속 {legacy / calendar:.0f}배, 거래일/달력일 {trading / calendar:.2f}")
+
+
+if __name__ == "__main__":
+    main()
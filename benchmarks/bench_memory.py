@@ -0,0 +1,65 @@
+"""종목당 메모리 벤치마크: float64 OHLCV DataFrame vs 압축 배열(PriceArrays), 결과 dict vs DropStats.
+
+실행: python benchmarks/bench_memory.py
+"""
+import os
+import sys
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analysis import DropStats, PriceArrays, drop_stats  # noqa: E402
+
+YEARS = 30
+TICKERS = 200
+
+
+def history(bars, seed):
+    idx = pd.bdate_range("1995-01-02", periods=bars, tz="Asia/Seoul", name="Date")
+    close = 50_000 * np.cumprod(1 + np.random.default_rng(seed).normal(0, 0.02, bars))
+    return pd.DataFrame({
+        "Open": close, "High": close * 1.01, "Low": close * 0.99, "Close": close,
+        "Volume": np.random.default_rng(seed).integers(1e5, 1e7, bars).astype(float),
+    }, index=idx)
+
+
+def traced(build):
+    """build()가 만든 객체를 들고 있는 동안의 할당 바이트."""
+    tracemalloc.start()
+    kept = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def main():
+    bars = YEARS * 252
+    frames = [history(bars, seed) for seed in range(TICKERS)]
+    frame_bytes = frames[0].memory_usage(deep=True).sum()
+    arrays_bytes = PriceArrays.from_frame(frames[0]).nbytes
+    print(f"{YEARS}년 ({bars}봉) 종목 하나")
+    print(f"  OHLCV DataFrame (float64, tz 인덱스)  {frame_bytes / 1024:8.1f} KB")
+    print(f"  PriceArrays (int32 + float32 ×2)      {arrays_bytes / 1024:8.1f} KB  ({frame_bytes / arrays_bytes:.1f}배 감소)")
+
+    frame_total = traced(lambda: [f.copy() for f in frames])
+    arrays_total = traced(lambda: [PriceArrays.from_frame(f) for f in frames])
+    print(f"{TICKERS}종목 보관 (tracemalloc)")
+    print(f"  DataFrame   {frame_total / 2**20:8.1f} MB")
+    print(f"  PriceArrays {arrays_total / 2**20:8.1f} MB  ({frame_total / arrays_total:.1f}배 감소)")
+
+    arrays = [PriceArrays.from_frame(f) for f in frames]
+    stats = [drop_stats(a.days, a.close, 3.0, 7) for a in arrays]
+    fields = [{k: getattr(s, k) for k in DropStats.__slots__} for s in stats]
+    dict_total = traced(lambda: [dict(f) for f in fields])
+    record_total = traced(lambda: [DropStats(**f) for f in fields])
+    print(f"{TICKERS}종목 통계 결과 레코드 (값 객체는 공유)")
+    print(f"  dict        {dict_total / 1024:8.1f} KB")
+    print(f"  DropStats   {record_total / 1024:8.1f} KB  ({dict_total / record_total:.1f}배 감소)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""스크래핑 파서 벤치마크: 정규식 파서 vs 기존 BeautifulSoup(html.parser) 경로.
+
+tests/fixtures의 HTML은 실제 페이지를 저장한 것이 아니라 대상 요소 구조와 페이지 크기만
+흉내 낸 합성 페이지다. 수치는 두 파서의 상대 비교용이며, 실제 페이지에서는 달라질 수 있다.
+
+실행: python benchmarks/bench_scrapers.py
+"""
+import os
+import sys
+import timeit
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import scrapers  # noqa: E402
+
+FIXTURES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "fixtures")
+
+
+def legacy_fgi(page):
+    el = BeautifulSoup(page, "html.parser").find("div", class_="text-center text-4xl font-semibold mb-1 text-white")
+    return el.text.strip() if el else None
+
+
+def legacy_pci(page):
+    for td in BeautifulSoup(page, "html.parser").find_all("td", class_="col-6"):
+        try:
+            return float(td.text.strip().replace(",", ""))
+        except ValueError:
+            continue
+    return None
+
+
+def bench(label, fn, page, number):
+    per_call = min(timeit.repeat(lambda: fn(page), number=number, repeat=5)) / number
+    print(f"  {label:<28} {per_call * 1e3:9.3f} ms")
+    return per_call
+
+
+def main():
+    cases = [
+        ("feargreedmeter.html", legacy_fgi, scrapers.parse_fgi),
+        ("ycharts_put_call.html", legacy_pci, scrapers.parse_pci),
+    ]
+    for name, legacy, fast in cases:
+        with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+            page = f.read()
+        print(f"{name} ({len(page) / 1024:.0f} KB)")
+        slow = bench("BeautifulSoup html.parser", legacy, page, 5)
+        quick = bench("scrapers (regex)", fast, page, 200)
+        print(f"  speedup                      {slow / quick:9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""종목 목록 import 벤치마크: 기존 방식(파이썬 dict 리터럴 + import 시 인덱스 생성) vs 지연 로드 데이터 파일.
+
+기존 방식 모듈은 data/korean_stocks.tsv로 임시 디렉터리에 생성해 비교한다. 각 측정은 새 프로세스에서
+(.pyc가 만들어진 뒤) import 시간과 tracemalloc 상주 메모리를 잰다.
+
+실행: python benchmarks/bench_stock_library.py
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import stock_library  # noqa: E402
+
+PROBE = """
+import json, sys, time, tracemalloc
+sys.path.insert(0, {path!r})
+if {trace}:
+    tracemalloc.start()
+t0 = time.perf_counter()
+import {module} as sl
+imported = time.perf_counter() - t0
+import_mem = tracemalloc.get_traced_memory()[0]
+sl.get_company_name("005930")
+lookup_mem = tracemalloc.get_traced_memory()[0]
+sl.search_stocks("삼성")
+search_mem = tracemalloc.get_traced_memory()[0]
+print(json.dumps([imported, import_mem, lookup_mem, search_mem]))
+"""
+
+LEGACY = '''KOREAN_STOCKS = {stocks}
+SECTORS = {sectors}
+
+
+def _build_index():
+    global _CODES, _NAMES, _NAME_TO_CODE, _GRAM_INDEX
+    _CODES = list(KOREAN_STOCKS.keys())
+    _NAMES = list(KOREAN_STOCKS.values())
+    _NAME_TO_CODE = {{}}
+    _GRAM_INDEX = {{}}
+    for i, name in enumerate(_NAMES):
+        _NAME_TO_CODE.setdefault(name, _CODES[i])
+        grams = set(name) | {{name[j:j + 2] for j in range(len(name) - 1)}}
+        for gram in grams:
+            _GRAM_INDEX.setdefault(gram, []).append(i)
+
+
+_build_index()
+
+
+def get_company_name(ticker):
+    return KOREAN_STOCKS.get(ticker, "Unknown")
+
+
+def search_stocks(keyword):
+    return [(_CODES[i], _NAMES[i]) for i in range(len(_NAMES)) if keyword in _NAMES[i]]
+'''
+
+
+def run(path, module, trace):
+    code = PROBE.format(path=path, module=module, trace=trace)
+    return json.loads(subprocess.run([sys.executable, "-c", code], check=True, capture_output=True,
+                                     text=True).stdout)
+
+
+def probe(path, module):
+    """(최소 import 시간: tracemalloc 없이 5회, [import 후, 첫 조회 후, 첫 검색 후] 메모리)."""
+    run(path, module, False)  # .pyc 생성
+    elapsed = min(run(path, module, False)[0] for _ in range(5))
+    return elapsed, run(path, module, True)[1:]
+
+
+def main():
+    legacy_dir = tempfile.mkdtemp(prefix="bench_stocks_")
+    with open(os.path.join(legacy_dir, "legacy_stocks.py"), "w", encoding="utf-8") as f:
+        f.write(LEGACY.format(stocks=repr(dict(stock_library.get_all_stocks())),
+                              sectors=repr(dict(stock_library.SECTORS))))
+
+    print(f"{stock_library.get_stock_count()}개 종목")
+    print(f"  {'':<22}{'import':>10}{'import 후':>12}{'첫 조회 후':>12}{'첫 검색 후':>12}")
+    for label, path, module in (("dict 리터럴 (기존)", legacy_dir, "legacy_stocks"),
+                                ("지연 로드 데이터 파일", ROOT, "stock_library")):
+        elapsed, (import_mem, lookup_mem, search_mem) = probe(path, module)
+        print(f"  {label:<20}{elapsed * 1e3:8.2f} ms"
+              f"{import_mem / 1024:9.0f} KB{lookup_mem / 1024:9.0f} KB{search_mem / 1024:9.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""프로세스 전역 TTL 캐시 (MCP 서버용 st.cache_data 대응) + 동시 요청 합치기.
+
+grace를 주면 stale-while-revalidate로 동작한다: ttl이 지난 값도 grace 동안은 즉시 반환하고
+갱신은 백그라운드에서 한 번만 수행한다. 갱신이 실패하면 grace가 끝날 때까지 직전 값을 유지한다.
+"""
+import functools
+import threading
+import time
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class TTLCache:
+    """만료 시간 + 최대 항목 수(LRU)를 가진 스레드 안전 캐시.
+
+    ttl이 지난 항목은 get/peek에서 미스지만, grace초 동안은 lookup으로 (값, 나이)를 꺼낼 수 있다.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 128, timer=time.monotonic, grace: float = 0):
+        self.ttl = ttl
+        self.grace = grace
+        self.maxsize = maxsize
+        self.timer = timer
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self._data = OrderedDict()  # key → (저장 시각, 값)
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            value = self._lookup(key, default)
+            if value is default:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def _lookup(self, key, default):
+        value, age = self._entry(key, default)
+        return value if age is not None and age < self.ttl else default
+
+    def _entry(self, key, default):
+        """(값, 나이). 없거나 ttl + grace가 지났으면 (default, None)."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default, None
+        age = self.timer() - entry[0]
+        if age >= self.ttl + self.grace:
+            del self._data[key]
+            return default, None
+        self._data.move_to_end(key)
+        return entry[1], age
+
+    def lookup(self, key, default=None):
+        """grace 안의 만료 항목까지 포함한 (값, 나이). 나이 >= ttl이면 stale 적중으로 집계."""
+        with self._lock:
+            value, age = self._entry(key, default)
+            if age is None:
+                self.misses += 1
+            elif age < self.ttl:
+                self.hits += 1
+            else:
+                self.stale_hits += 1
+            return value, age
+
+    def age(self, key):
+        """저장된 값의 나이(초). 없으면 None (통계 미포함)."""
+        with self._lock:
+            return self._entry(key, None)[1]
+
+    def peek(self, key, default=None):
+        """적중/미스 통계에 포함하지 않는 조회."""
+        with self._lock:
+            return self._lookup(key, default)
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (self.timer(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale_hits": self.stale_hits,
+            "hit_rate": round(self.hits / total, 3) if total else None,
+        }
+
+
+class _Call:
+    __slots__ = ("event", "value", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class SingleFlight:
+    """같은 키로 동시에 들어온 호출을 한 번의 실행으로 합치고 결과를 공유."""
+
+    def __init__(self):
+        self.shared = 0  # 다른 호출의 결과를 기다려 받은 횟수
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn, *args, **kwargs):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = fn(*args, **kwargs)
+            return call.value
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+
+def ttl_cache(ttl: float, maxsize: int = 128, grace: float = 0):
+    """함수 결과를 인자별로 ttl초 동안 캐시. None(조회 실패)과 예외는 캐시하지 않음.
+
+    캐시 미스가 동시에 여러 개 들어오면 SingleFlight로 한 번만 실행한다.
+    grace > 0이면 ttl이 지난 값을 grace초 동안 그대로 반환하면서 백그라운드에서 다시 불러온다.
+    """
+    def decorator(fn):
+        cache = TTLCache(ttl, maxsize, grace=grace)
+        flight = SingleFlight()
+        refreshing = set()
+        lock = threading.Lock()
+
+        def load(key, args, kwargs):
+            # 앞선 리더가 방금 채웠을 수 있으므로 한 번 더 확인
+            value = cache.peek(key, _MISSING)
+            if value is not _MISSING:
+                return value
+            value = fn(*args, **kwargs)
+            if value is not None:
+                cache.set(key, value)
+            return value
+
+        def revalidate(key, args, kwargs):
+            try:
+                flight.do(key, load, key, args, kwargs)
+            except Exception:
+                pass  # 실패 시 grace가 끝날 때까지 직전 값 유지
+            finally:
+                with lock:
+                    refreshing.discard(key)
+
+        def make_key(args, kwargs):
+            return (args, tuple(sorted(kwargs.items())))
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = make_key(args, kwargs)
+            value, age = cache.lookup(key, _MISSING)
+            if value is _MISSING:
+                return flight.do(key, load, key, args, kwargs)
+            if age >= ttl:
+                with lock:
+                    start = key not in refreshing
+                    refreshing.add(key)
+                if start:
+                    threading.Thread(target=revalidate, args=(key, args, kwargs), daemon=True).start()
+            return value
+
+        def age(*args, **kwargs):
+            """인자에 해당하는 캐시 값의 나이(초). 없으면 None."""
+            return cache.age(make_key(args, kwargs))
+
+        wrapper.cache = cache
+        wrapper.flight = flight
+        wrapper.age = age
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
@@ -0,0 +1,36 @@
+"""스크래핑용 공용 HTTP 세션 (커넥션 풀 + keep-alive + 5xx 재시도)."""
+import os
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+# 호스트당 유지할 keep-alive 연결 수 (동시 스크래핑 스레드 수 이상)
+POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", 8))
+RETRIES = int(os.getenv("HTTP_RETRIES", 2))
+DEFAULT_TIMEOUT = 10
+
+
+def build_session() -> requests.Session:
+    session = requests.Session()
+    retry = Retry(
+        total=RETRIES,
+        backoff_factor=0.5,  # 0.5s, 1s, ...
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=("GET", "HEAD"),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_SIZE, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
+
+# 프로세스 전역 세션: 호스트별 TCP/TLS 연결을 재사용
+session = build_session()
+
+
+def get(url: str, timeout: float = DEFAULT_TIMEOUT, **kwargs) -> requests.Response:
+    return session.get(url, timeout=timeout, **kwargs)
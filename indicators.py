@@ -0,0 +1,348 @@
+"""시장 지표 백그라운드 갱신기와 해석 함수 (app.py / mcp_server.py 공용).
+
+소스별로 각자의 주기에 맞춰 백그라운드 스레드가 지표를 다시 계산하고, 새 값이 나올 때마다
+불변 스냅샷을 통째로 교체한다. 사용자 요청은 최신 스냅샷을 읽기만 하므로 기다리지 않는다.
+갱신이 실패한 필드는 grace초 동안 직전 값을 stale로 표시해 계속 내보낸다.
+"""
+import threading
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+from market_data import buffett_indicator, closes, latest_vix, qqq_vs_sma, usd_krw_change
+from rsi import WILDER, RSIEngine
+
+INDICATOR_NAMES = ("qqq", "vix", "rsi", "buffett", "usd_krw", "fgi", "pci")
+# 소스별 갱신 주기(초): 시세 60초, 스크래핑 300초
+MARKET_INTERVAL = 60
+SCRAPE_INTERVAL = 300
+# 시장 RSI(S&P500) 계산 방식과 기간
+RSI_METHOD = WILDER
+RSI_WINDOW = 14
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """한 시점의 지표 값 묶음. 필드마다 마지막으로 갱신에 성공한 시각(epoch)을 함께 보관.
+
+    stale은 마지막 갱신 시도가 실패해 직전 값을 내보내는 필드, grace는 그런 값을 쓸 수 있는 최대 나이(초).
+    """
+    version: int = 0
+    values: MappingProxyType = field(default_factory=lambda: MappingProxyType({}))
+    updated_at: MappingProxyType = field(default_factory=lambda: MappingProxyType({}))
+    stale: frozenset = frozenset()
+    grace: float = None
+
+    def get(self, name, default=None, now=None):
+        """name 값. 나이가 grace를 넘었으면 default."""
+        if self.grace is not None:
+            age = self.age(name, now)
+            if age is not None and age > self.grace:
+                return default
+        return self.values.get(name, default)
+
+    def is_stale(self, name) -> bool:
+        return name in self.stale
+
+    def age(self, name, now=None):
+        """name 값의 나이(초). 아직 값이 없으면 None."""
+        ts = self.updated_at.get(name)
+        if ts is None:
+            return None
+        return (time.time() if now is None else now) - ts
+
+
+@dataclass(frozen=True)
+class Source:
+    fetch: object      # () -> {지표 이름: 값}. 값이 None이면 직전 값 유지
+    interval: float    # 갱신 주기(초)
+
+
+def _present(value):
+    if value is None:
+        return None
+    if isinstance(value, tuple) and all(v is None for v in value):
+        return None
+    return value
+
+
+def market_fields(frames: dict, rsi_engine: RSIEngine = None) -> dict:
+    """일괄 시세(market_data.download_market_history)에서 yfinance 기반 지표 5개 계산.
+
+    rsi_engine이 있으면 RSI는 엔진에 아직 반영하지 않은 SPY 봉만 더해 계산한다.
+    """
+    if rsi_engine is None:
+        rsi_engine = RSIEngine(RSI_WINDOW, RSI_METHOD)
+    return {
+        "qqq": _present(qqq_vs_sma(frames)),
+        "vix": latest_vix(frames),
+        "rsi": rsi_engine.extend("SPY", closes(frames, "SPY")),
+        "buffett": _present(buffett_indicator(frames)),
+        "usd_krw": _present(usd_krw_change(frames)),
+    }
+
+
+def buffett_field(snap: Snapshot) -> str:
+    """버핏 지수를 읽을 스냅샷 필드 이름.
+
+    시세 값(buffett)이 Wilshire 5000 기반이 아니고 스크래핑한 실제 값(buffett_actual)이 있으면
+    실제 값을, 아니면 시세 값을 쓴다.
+    """
+    _, data_type = snap.get("buffett") or (None, None)
+    if data_type != "wilshire" and snap.get("buffett_actual") is not None:
+        return "buffett_actual"
+    return "buffett"
+
+
+def build_refresher(fetch_market, fetch_fgi, fetch_pci, fetch_buffett=None, grace=None):
+    """표준 소스 구성의 갱신기 (시작 전 상태).
+
+    fetch_market은 일괄 시세 dict(market_data.download_market_history 형식)를 반환하고,
+    나머지는 값 하나(실패 시 None)를 반환한다. 호출 측은 자신의 동시성 제한을 씌워 넘긴다.
+    RSI 상태는 갱신기마다 하나씩 두어 주기마다 최신 봉만 반영한다.
+    fetch_buffett(실제 버핏 지수 스크래핑)는 시세와 따로 SCRAPE_INTERVAL마다 갱신해
+    느린 스크래핑이 시세 지표를 붙잡지 않게 한다. 값 선택은 buffett_field.
+    """
+    rsi_engine = RSIEngine(RSI_WINDOW, RSI_METHOD)
+    sources = {
+        "market": Source(lambda: market_fields(fetch_market() or {}, rsi_engine), MARKET_INTERVAL),
+        "fgi": Source(lambda: {"fgi": fetch_fgi()}, SCRAPE_INTERVAL),
+        "pci": Source(lambda: {"pci": fetch_pci()}, SCRAPE_INTERVAL),
+    }
+    if fetch_buffett is not None:
+        sources["buffett"] = Source(lambda: {"buffett_actual": _actual(fetch_buffett())}, SCRAPE_INTERVAL)
+    return IndicatorRefresher(sources, grace=grace)
+
+
+def _actual(ratio):
+    return None if ratio is None else (ratio, "actual")
+
+
+class IndicatorRefresher:
+    """Source마다 데몬 스레드 하나로 주기 갱신하고 최신 Snapshot을 원자적으로 게시."""
+
+    def __init__(self, sources: dict, grace: float = None):
+        self.sources = sources
+        self.grace = grace
+        self._snapshot = Snapshot(grace=grace)
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._wake = {name: threading.Event() for name in sources}
+        self._attempted = set()
+        self._last_attempt = {}  # 소스 → 마지막 갱신 시도 시각(monotonic)
+        self._fields = {}  # 소스 → 마지막으로 내보낸 필드 이름 (실패 시 stale 표시용)
+        self._stats = {name: {"runs": 0, "failures": 0, "last_sec": None} for name in sources}
+        self._threads = []
+
+    # ── 읽기 ──
+
+    def snapshot(self) -> Snapshot:
+        """최신 스냅샷 (참조 한 번 읽기라 잠금 없음)."""
+        return self._snapshot
+
+    def ready(self) -> bool:
+        """모든 소스가 첫 갱신 시도를 마쳤는지."""
+        return len(self._attempted) >= len(self.sources)
+
+    def wait_ready(self, timeout: float = None) -> Snapshot:
+        """모든 소스가 첫 갱신 시도를 마치거나 timeout이 지날 때까지 대기 (콜드 스타트용)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while not self.ready():
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            return self._snapshot
+
+    # ── 갱신 ──
+
+    def start(self):
+        with self._cond:
+            if self._threads:
+                return self
+            for name, source in self.sources.items():
+                t = threading.Thread(target=self._loop, args=(name, source), daemon=True,
+                                     name=f"refresh-{name}")
+                self._threads.append(t)
+                t.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        for wake in self._wake.values():
+            wake.set()
+
+    def sources_for(self, fields) -> list:
+        """지표 이름들을 그 값을 만드는 소스 이름으로 변환 (아직 모르는 지표는 제외)."""
+        return [name for name, produced in self._fields.items() if set(produced) & set(fields)]
+
+    def refresh_now(self, names=None, cooldown: float = 0) -> list:
+        """다음 주기를 기다리지 않고 해당 소스를 즉시 다시 갱신. 실제로 깨운 소스 목록 반환.
+
+        names가 None이면 전체 소스, 빈 목록이면 아무것도 깨우지 않는다.
+        마지막 시도 후 cooldown초가 지나지 않은 소스는 건너뛰어, 여러 사용자가 연달아
+        요청해도 원격 조회는 소스당 한 번으로 제한된다.
+        """
+        now = time.monotonic()
+        woken = []
+        for name in self.sources if names is None else names:
+            if name not in self._wake:
+                continue
+            last = self._last_attempt.get(name)
+            if last is not None and now - last < cooldown:
+                continue
+            self._wake[name].set()
+            woken.append(name)
+        return woken
+
+    def stats(self) -> dict:
+        """소스별 갱신 횟수, 실패 횟수(값을 하나도 못 받은 시도), 마지막 소요 시간(초)."""
+        return {name: dict(st) for name, st in self._stats.items()}
+
+    def _record(self, name, fields, elapsed):
+        st = self._stats[name]
+        st["runs"] += 1
+        st["last_sec"] = round(elapsed, 3)
+        if not fields or all(v is None for v in fields.values()):
+            st["failures"] += 1
+
+    def wait_newer(self, version: int, timeout: float = None) -> Snapshot:
+        """스냅샷 버전이 version보다 커지거나 timeout이 지날 때까지 대기."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._snapshot.version > version, timeout)
+            return self._snapshot
+
+    def _loop(self, name, source):
+        wake = self._wake[name]
+        while not self._stop.is_set():
+            wake.clear()
+            t0 = time.perf_counter()
+            try:
+                fields = source.fetch()
+            except Exception:
+                fields = None
+            self._record(name, fields, time.perf_counter() - t0)
+            if fields:
+                self._fields[name] = tuple(fields)
+            else:
+                fields = dict.fromkeys(self._fields.get(name, ()))
+            if fields:
+                self.publish(fields)
+            with self._cond:
+                self._attempted.add(name)
+                self._last_attempt[name] = time.monotonic()
+                self._cond.notify_all()
+            wake.wait(source.interval)
+
+    def publish(self, fields: dict):
+        """fields 중 None이 아닌 값만 반영한 새 스냅샷으로 교체 (None은 직전 값을 stale로 유지)."""
+        now = time.time()
+        with self._cond:
+            old = self._snapshot
+            values = dict(old.values)
+            updated_at = dict(old.updated_at)
+            stale = set(old.stale)
+            for name, value in fields.items():
+                if value is None:
+                    if name in values:
+                        stale.add(name)
+                    continue
+                values[name] = value
+                updated_at[name] = now
+                stale.discard(name)
+            self._snapshot = Snapshot(
+                version=old.version + 1,
+                values=MappingProxyType(values),
+                updated_at=MappingProxyType(updated_at),
+                stale=frozenset(stale),
+                grace=self.grace,
+            )
+            self._cond.notify_all()
+
+
+# ── 해석 ──────────────────────────────────────────────────────────────────────
+# 각 함수는 (설명, 신호) 반환. 신호는 bullish(매수) / bearish(매도) / neutral.
+
+NO_DATA = ("데이터 없음", "neutral")
+
+
+def interpret_fgi(fgi):
+    if fgi is None:
+        return NO_DATA
+    if fgi <= 25:
+        return "극심한 공포 (매수 신호)", "bullish"
+    if fgi <= 45:
+        return "공포 (매수 신호)", "bullish"
+    if fgi <= 55:
+        return "중립적 (유지 또는 관망)", "neutral"
+    if fgi <= 75:
+        return "탐욕적 (매도 신호)", "bearish"
+    return "극도로 탐욕적 (매도 신호)", "bearish"
+
+
+def interpret_vix(vix):
+    if vix is None:
+        return NO_DATA
+    if vix < 15:
+        return "변동성 낮음 (안정적 상승장)", "bullish"
+    if vix < 25:
+        return "변동성 중간 (중립)", "neutral"
+    return "변동성 높음 (불안정)", "bearish"
+
+
+def interpret_pci(pci):
+    if pci is None:
+        return NO_DATA
+    if pci > 0.95:
+        return "하락 베팅 증가 (역발상 매수 신호)", "bullish"   # 풋 많음 = 공포
+    if pci < 0.65:
+        return "상승 베팅 증가 (역발상 매도 신호)", "bearish"   # 콜 많음 = 탐욕
+    return "중립적 상태", "neutral"
+
+
+def interpret_rsi(rsi):
+    if rsi is None:
+        return NO_DATA
+    if rsi < 30:
+        return "과매도 (매수 신호)", "bullish"
+    if rsi > 70:
+        return "과매수 (매도 신호)", "bearish"
+    return "중립", "neutral"
+
+
+def interpret_qqq(price, sma):
+    if price is None or sma is None:
+        return NO_DATA
+    diff_pct = (price - sma) / sma * 100
+    if price > sma:
+        return f"상승 추세 ({diff_pct:+.1f}%)", "bullish"
+    return f"하락 추세 ({diff_pct:+.1f}%)", "bearish"
+
+
+def interpret_buffett(ratio, data_type):
+    if ratio is None:
+        return NO_DATA
+    suffix = {"wilshire": " (Wilshire 5000 기준)", "estimated": " (추정)"}.get(data_type, "")
+    if ratio <= 80:
+        return f"심각한 저평가{suffix} (강력한 매수 신호)", "bullish"
+    if ratio <= 100:
+        return f"저평가{suffix} (매수 신호)", "bullish"
+    if ratio <= 120:
+        return f"적정 가치{suffix} (중립)", "neutral"
+    if ratio <= 140:
+        return f"약간 고평가{suffix} (주의)", "neutral"
+    if ratio <= 180:
+        return f"고평가{suffix} (매도 신호)", "bearish"
+    return f"심각한 고평가{suffix} (강력한 매도 신호)", "bearish"
+
+
+def interpret_usd_krw(rate, change, change_pct):
+    """환율 상승(원화 약세)은 bearish, 하락(원화 강세)은 bullish."""
+    if rate is None:
+        return NO_DATA
+    if not change:
+        return "보합", "neutral"
+    if change > 0:
+        return f"전일 대비 ↗️ {change:.1f}원 (+{change_pct:.2f}%)", "bearish"
+    return f"전일 대비 ↘️ {abs(change):.1f}원 ({change_pct:.2f}%)", "bullish"
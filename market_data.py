@@ -0,0 +1,80 @@
+"""시장 지표용 시세 일괄 조회 (app.py / mcp_server.py 공용)."""
+import pandas as pd
+import yfinance as yf
+
+# 지표 계산에 필요한 심볼: QQQ 200MA, VIX, 원달러 환율, 버핏 지수(Wilshire 5000 / SPY 추정), RSI(SPY)
+MARKET_SYMBOLS = ("QQQ", "^VIX", "USDKRW=X", "^W5000", "SPY")
+# 버핏 지수 계산용 미국 GDP 추정치 (십억 달러)
+GDP_ESTIMATE = 29184
+
+
+def download_market_history(symbols=MARKET_SYMBOLS, period: str = "1y") -> dict:
+    """yf.download 한 번으로 여러 심볼 일봉을 받아 {심볼: DataFrame}으로 분리.
+
+    받지 못한 심볼은 결과에서 빠진다. 200일 이동평균을 위해 기본 기간은 1년.
+    """
+    data = yf.download(
+        list(symbols), period=period, group_by="ticker",
+        progress=False, auto_adjust=True, threads=True,
+    )
+    return split_by_symbol(data, symbols)
+
+
+def split_by_symbol(data: pd.DataFrame, symbols) -> dict:
+    """group_by="ticker"로 받은 yf.download 결과를 {심볼: DataFrame}으로 분리 (빈 심볼 제외)."""
+    frames = {}
+    if data.empty:
+        return frames
+    if not isinstance(data.columns, pd.MultiIndex):
+        data.columns = pd.MultiIndex.from_product([[symbols[0]], data.columns])
+    for symbol in symbols:
+        if symbol not in data.columns.get_level_values(0):
+            continue
+        df = data[symbol].dropna(how="all")
+        df.columns.name = None
+        if not df.empty:
+            frames[symbol] = df
+    return frames
+
+
+def closes(frames: dict, symbol: str) -> pd.Series:
+    df = frames.get(symbol)
+    if df is None or "Close" not in df:
+        return pd.Series(dtype=float)
+    return df["Close"].dropna()
+
+
+def qqq_vs_sma(frames: dict, window: int = 200):
+    """(QQQ 현재가, window일 이동평균). 데이터가 부족하면 (None, None)."""
+    hist = closes(frames, "QQQ")
+    if len(hist) < window:
+        return None, None
+    return float(hist.iloc[-1]), float(hist.iloc[-window:].mean())
+
+
+def latest_vix(frames: dict):
+    hist = closes(frames, "^VIX")
+    return float(hist.iloc[-1]) if not hist.empty else None
+
+
+def usd_krw_change(frames: dict):
+    """(환율, 전일 대비 변화량, 변화율%)."""
+    hist = closes(frames, "USDKRW=X")
+    if len(hist) < 2:
+        return None, None, None
+    cur = float(hist.iloc[-1])
+    prev = float(hist.iloc[-2])
+    chg = cur - prev
+    return cur, chg, (chg / prev) * 100
+
+
+def buffett_indicator(frames: dict):
+    """(버핏 지수 %, 'wilshire' | 'estimated'). Wilshire 5000이 없으면 SPY 기반 추정."""
+    wilshire = closes(frames, "^W5000")
+    if not wilshire.empty:
+        return float(wilshire.iloc[-1]) / GDP_ESTIMATE * 100, "wilshire"
+    spy = closes(frames, "SPY")
+    if not spy.empty:
+        # 역사적으로 SPY $400 수준에서 버핏 지수가 약 180%
+        return float(spy.iloc[-1]) / 400 * 180, "estimated"
+    return None, None
@@ -1,16 +1,30 @@
 import os
 import math
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 
 import yfinance as yf
-import pandas as pd
-import requests
-from bs4 import BeautifulSoup
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 from starlette.requests import Request
 from starlette.responses import JSONResponse, PlainTextResponse
 
-from stock_library import process_ticker_input, KOREAN_STOCKS, search_stocks
+from stock_library import process_ticker_input, search_stocks
+from analysis import (
+    CALENDAR_DAYS, HORIZON_UNITS, bootstrap_win_rate, drop_grid, drop_stats, horizon_text,
+)
+from cache import ttl_cache
+from price_store import get_history
+from scrapers import fetch_fgi, fetch_pci, fetch_buffett
+from market_data import download_market_history
+import scanner
+from indicators import (
+    buffett_field, build_refresher, interpret_buffett, interpret_fgi, interpret_pci, interpret_qqq,
+    interpret_rsi, interpret_usd_krw, interpret_vix,
+)
 
 
 def _safe(v):
@@ -25,12 +39,54 @@ def _safe(v):
 
 mcp = FastMCP("Stock Analyzer")
 
+# get_market_indicators 전체 응답 마감 시간(초). 넘긴 지표는 "데이터 없음"으로 반환
+INDICATOR_DEADLINE = float(os.getenv("INDICATOR_DEADLINE", 8))
+# 갱신 실패 시 직전 값을 계속 내보내는 최대 나이(초). 지나면 '데이터 없음'
+INDICATOR_GRACE = float(os.getenv("INDICATOR_GRACE", 3600))
+# 시세 캐시(60초)가 만료된 뒤에도 백그라운드 갱신 동안 직전 값을 반환하는 시간(초)
+QUOTE_GRACE = float(os.getenv("QUOTE_GRACE", 600))
+# 부트스트랩 재표본 상한과 시간 예산(초). 예산을 넘기면 그때까지의 재표본으로 계산
+MAX_RESAMPLES = 100_000
+BOOTSTRAP_BUDGET_SEC = float(os.getenv("BOOTSTRAP_BUDGET_SEC", 0.5))
+# 블로킹 I/O(yfinance, 스크래핑)를 실행할 스레드 수. 이벤트 루프는 막지 않음
+IO_WORKERS = int(os.getenv("MCP_IO_WORKERS", 32))
+# 업스트림 호스트별 동시 요청 상한
+UPSTREAM_CONCURRENCY = int(os.getenv("UPSTREAM_CONCURRENCY", 8))
+
+_io_pool = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="mcp-io")
+_upstream_limits = {
+    host: threading.BoundedSemaphore(UPSTREAM_CONCURRENCY)
+    for host in ("yahoo", "feargreedmeter.com", "ycharts.com", "longtermtrends.net")
+}
+
+
+@contextmanager
+def _upstream(host: str):
+    with _upstream_limits[host]:
+        yield
+
+
+async def _run_blocking(fn, *args, **kwargs):
+    """블로킹 함수를 I/O 스레드 풀에서 실행."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_io_pool, functools.partial(fn, *args, **kwargs))
+
 
 @mcp.custom_route("/health", methods=["GET"])
 async def health(request: Request) -> JSONResponse:
     return JSONResponse({"status": "ok"})
 
 
+@mcp.custom_route("/stats", methods=["GET"])
+async def stats(request: Request) -> JSONResponse:
+    """지표 소스별 갱신 통계와 시세 캐시 적중률."""
+    return JSONResponse({
+        "indicators": _refresher.stats(),
+        "snapshot_version": _refresher.snapshot().version,
+        "quote_cache": _get_quote.cache.stats(),
+    })
+
+
 @mcp.custom_route("/agents.md", methods=["GET"])
 async def agents_md(request: Request) -> PlainTextResponse:
     agents_path = os.path.join(os.path.dirname(__file__), "agents.md")
@@ -41,264 +97,139 @@ async def agents_md(request: Request) -> PlainTextResponse:
 
 # ── 데이터 수집 내부 함수 ──────────────────────────────────────────────────────
 
-def _get_qqq_data():
+def _get_market_history():
+    """지표용 심볼 전체를 한 번의 yfinance 요청으로 조회."""
     try:
-        qqq = yf.Ticker("QQQ")
-        hist = qqq.history(period="200d")["Close"]
-        if len(hist) < 200:
-            return None, None
-        return float(hist.iloc[-1]), float(hist.mean())
+        with _upstream("yahoo"):
+            return download_market_history() or None
     except Exception:
-        return None, None
-
-
-def _get_vix_data():
-    for symbol in ["^VIX", "VIX", "VIXY"]:
-        try:
-            data = yf.Ticker(symbol).history(period="5d")
-            if not data.empty:
-                return float(data["Close"].iloc[-1])
-        except Exception:
-            continue
-    return None
+        return None
 
 
-def _get_usd_krw_rate():
-    try:
-        data = yf.Ticker("USDKRW=X").history(period="5d")
-        if len(data) >= 2:
-            cur = float(data["Close"].iloc[-1])
-            prev = float(data["Close"].iloc[-2])
-            chg = cur - prev
-            return cur, chg, (chg / prev) * 100
-    except Exception:
-        pass
-    return None, None, None
+# 캐시 TTL은 대시보드(app.py)와 동일한 60초
+@ttl_cache(ttl=60, maxsize=256, grace=QUOTE_GRACE)
+def _get_quote(ticker: str):
+    """(최근 5일 일봉, 종목 info). yfinance 예외는 호출자에게 전달."""
+    t = yf.Ticker(ticker)
+    with _upstream("yahoo"):
+        hist = t.history(period="5d")
+        info = {}
+        if not hist.empty:
+            try:
+                info = t.info or {}
+            except Exception:
+                pass
+    return hist, info
 
 
 def _fetch_fgi():
-    try:
-        url = "https://feargreedmeter.com/"
-        headers = {"User-Agent": "Mozilla/5.0"}
-        r = requests.get(url, headers=headers, timeout=10)
-        soup = BeautifulSoup(r.text, "html.parser")
-        el = soup.find("div", class_="text-center text-4xl font-semibold mb-1 text-white")
-        if el:
-            t = el.text.strip()
-            return int(t) if t.isdigit() else None
-    except Exception:
-        pass
-    return None
+    with _upstream("feargreedmeter.com"):
+        return fetch_fgi()
 
 
 def _fetch_pci():
-    try:
-        url = "https://ycharts.com/indicators/cboe_equity_put_call_ratio"
-        headers = {"User-Agent": "Mozilla/5.0"}
-        r = requests.get(url, headers=headers, timeout=10)
-        soup = BeautifulSoup(r.text, "html.parser")
-        for td in soup.find_all("td", class_="col-6"):
-            try:
-                return float(td.text.strip().replace(",", ""))
-            except ValueError:
-                continue
-    except Exception:
-        pass
-    return None
+    with _upstream("ycharts.com"):
+        return fetch_pci()
 
 
 def _fetch_buffett():
-    try:
-        w = yf.Ticker("^W5000").history(period="1d")
-        if not w.empty:
-            ratio = float(w["Close"].iloc[-1]) / 29184 * 100
-            return ratio, "wilshire"
-    except Exception:
-        pass
-    try:
-        spy = yf.Ticker("SPY").history(period="1d")
-        if not spy.empty:
-            return float(spy["Close"].iloc[-1]) / 400 * 180, "estimated"
-    except Exception:
-        pass
-    return None, None
-
+    with _upstream("longtermtrends.net"):
+        return fetch_buffett()
 
-def _calculate_rsi(series: pd.Series, window: int = 14):
-    try:
-        delta = series.diff()
-        gain = delta.where(delta > 0, 0).rolling(window).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window).mean()
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        v = rsi.iloc[-1]
-        return None if pd.isna(v) else float(v)
-    except Exception:
-        return None
 
+def _build_refresher():
+    # 모듈 전역 조회를 호출 시점으로 미뤄 테스트의 monkeypatch가 그대로 적용되도록 함
+    return build_refresher(
+        lambda: _get_market_history(), lambda: _fetch_fgi(), lambda: _fetch_pci(), lambda: _fetch_buffett(),
+        grace=INDICATOR_GRACE,
+    )
 
-# ── 해석 함수 ─────────────────────────────────────────────────────────────────
 
-def _interpret_fgi(v):
-    if v is None:
-        return "데이터 없음", "neutral"
-    if v <= 25:
-        return "극심한 공포", "bullish"   # 공포 = 매수 기회
-    if v <= 45:
-        return "공포", "bullish"
-    if v <= 55:
-        return "중립", "neutral"
-    if v <= 75:
-        return "탐욕적", "bearish"        # 탐욕 = 매도 고려
-    return "극도로 탐욕적", "bearish"
-
-
-def _interpret_vix(v):
-    if v is None:
-        return "데이터 없음", "neutral"
-    if v < 15:
-        return "변동성 낮음 (상승장)", "bullish"
-    if v < 25:
-        return "변동성 중간", "neutral"
-    return "변동성 높음 (하락장)", "bearish"
+_refresher = _build_refresher()
 
 
-def _interpret_pci(v):
-    if v is None:
-        return "데이터 없음", "neutral"
-    if v > 0.95:
-        return "하락 베팅 증가", "bullish"  # 풋 많음 = 공포 = 역발상 매수
-    if v < 0.65:
-        return "상승 베팅 증가", "bearish"  # 콜 많음 = 탐욕 = 역발상 매도
-    return "중립적", "neutral"
+def _round_age(age):
+    return None if age is None else round(age, 1)
 
 
-def _interpret_rsi(v):
-    if v is None:
-        return "데이터 없음", "neutral"
-    if v < 30:
-        return "과매도", "bullish"   # 과매도 = 매수 신호
-    if v > 70:
-        return "과매수", "bearish"   # 과매수 = 매도 신호
-    return "중립", "neutral"
-
-
-def _interpret_buffett(ratio, dtype):
-    if ratio is None:
-        return "데이터 없음", "neutral"
-    suffix = " (Wilshire 5000)" if dtype == "wilshire" else " (추정)" if dtype == "estimated" else ""
-    if ratio <= 80:
-        return f"심각한 저평가{suffix}", "bullish"   # 저평가 = 매수 신호
-    if ratio <= 100:
-        return f"저평가{suffix}", "bullish"
-    if ratio <= 120:
-        return f"적정 가치{suffix}", "neutral"
-    if ratio <= 140:
-        return f"약간 고평가{suffix}", "neutral"
-    if ratio <= 180:
-        return f"고평가{suffix}", "bearish"           # 고평가 = 매도 신호
-    return f"심각한 고평가{suffix}", "bearish"
-
-
-def _interpret_usd_krw(rate, chg, chg_pct):
-    if rate is None:
-        return "데이터 없음", "neutral"
-    if chg is None or chg == 0:
-        return "보합", "neutral"
-    if chg > 0:
-        return f"전일 대비 +{chg:.1f}원 (+{chg_pct:.2f}%)", "bearish"
-    return f"전일 대비 {chg:.1f}원 ({chg_pct:.2f}%)", "bullish"
-
-
-# ── N일 분석 헬퍼 ─────────────────────────────────────────────────────────────
-
-def _trading_day_after(index, base_date, days_after):
-    target = base_date + pd.Timedelta(days=days_after)
-    future = index[index >= target]
-    return future[0] if len(future) > 0 else None
-
-
-def _add_nday_prices(signal_days: pd.DataFrame, data: pd.DataFrame, days_after: int) -> pd.DataFrame:
-    prices, actual_days = [], []
-    for sig_date in signal_days.index:
-        fd = _trading_day_after(data.index, sig_date, days_after)
-        if fd is not None and fd in data.index:
-            prices.append(data.loc[fd, "Close"])
-            actual_days.append((fd - sig_date).days)
-        else:
-            prices.append(None)
-            actual_days.append(None)
-    signal_days[f"Price_{days_after}D_Later"] = prices
-    signal_days["Actual_Days_Later"] = actual_days
-    return signal_days
+def _age(snap, name):
+    return _round_age(snap.age(name))
 
 
 # ── MCP 도구 ──────────────────────────────────────────────────────────────────
 
 @mcp.tool()
-def get_market_indicators() -> dict:
+async def get_market_indicators() -> dict:
     """현재 시장 심리 지표 전체 조회.
     Fear & Greed Index, VIX, Put/Call Ratio, RSI(S&P500), QQQ vs 200일 이동평균,
-    버핏 지수(시가총액/GDP), 원달러 환율을 반환합니다."""
-    qqq_price, qqq_sma = _get_qqq_data()
-    vix = _get_vix_data()
-    fgi = _fetch_fgi()
-    pci = _fetch_pci()
-    usd_krw, usd_krw_chg, usd_krw_chg_pct = _get_usd_krw_rate()
-    buffett_ratio, buffett_type = _fetch_buffett()
-
-    rsi = None
-    try:
-        spy_close = yf.Ticker("SPY").history(period="50d")["Close"]
-        rsi = _calculate_rsi(spy_close)
-    except Exception:
-        pass
-
-    fgi_label, fgi_signal = _interpret_fgi(fgi)
-    vix_label, vix_signal = _interpret_vix(vix)
-    pci_label, pci_signal = _interpret_pci(pci)
-    rsi_label, rsi_signal = _interpret_rsi(rsi)
-    buffett_label, buffett_signal = _interpret_buffett(buffett_ratio, buffett_type)
-    usd_label, usd_signal = _interpret_usd_krw(usd_krw, usd_krw_chg, usd_krw_chg_pct)
-
-    qqq_signal = "neutral"
-    qqq_label = "데이터 없음"
-    if qqq_price is not None and qqq_sma is not None:
-        diff_pct = (qqq_price - qqq_sma) / qqq_sma * 100
-        qqq_signal = "bullish" if qqq_price > qqq_sma else "bearish"
-        qqq_label = f"{'상승' if qqq_price > qqq_sma else '하락'} 추세 ({diff_pct:+.1f}%)"
+    버핏 지수(시가총액/GDP), 원달러 환율을 반환합니다.
+    지표는 백그라운드에서 주기적으로 갱신되며 age_sec은 각 값이 갱신된 뒤 지난 시간(초)입니다.
+    stale=true는 최근 갱신이 실패해 직전 값을 반환 중이라는 뜻입니다.
+    값을 한 번도 받지 못한 지표는 '데이터 없음'으로 반환합니다."""
+    # 첫 호출(콜드 스타트)만 최대 INDICATOR_DEADLINE초 대기, 이후는 최신 스냅샷을 즉시 반환
+    snap = _refresher.start().snapshot()
+    if not _refresher.ready():
+        snap = await _run_blocking(_refresher.wait_ready, INDICATOR_DEADLINE)
+    qqq_price, qqq_sma = snap.get("qqq", (None, None))
+    vix = snap.get("vix")
+    fgi = snap.get("fgi")
+    pci = snap.get("pci")
+    usd_krw, usd_krw_chg, usd_krw_chg_pct = snap.get("usd_krw", (None, None, None))
+    buffett_name = buffett_field(snap)
+    buffett_ratio, buffett_type = snap.get(buffett_name, (None, None))
+    rsi = snap.get("rsi")
+
+    fgi_label, fgi_signal = interpret_fgi(fgi)
+    vix_label, vix_signal = interpret_vix(vix)
+    pci_label, pci_signal = interpret_pci(pci)
+    rsi_label, rsi_signal = interpret_rsi(rsi)
+    qqq_label, qqq_signal = interpret_qqq(qqq_price, qqq_sma)
+    buffett_label, buffett_signal = interpret_buffett(buffett_ratio, buffett_type)
+    usd_label, usd_signal = interpret_usd_krw(usd_krw, usd_krw_chg, usd_krw_chg_pct)
 
     return {
         "fear_greed_index": {
             "value": fgi,
             "label": fgi_label,
             "signal": fgi_signal,
+            "age_sec": _age(snap, "fgi"),
+            "stale": snap.is_stale("fgi"),
         },
         "vix": {
             "value": vix,
             "label": vix_label,
             "signal": vix_signal,
+            "age_sec": _age(snap, "vix"),
+            "stale": snap.is_stale("vix"),
         },
         "put_call_ratio": {
             "value": pci,
             "label": pci_label,
             "signal": pci_signal,
+            "age_sec": _age(snap, "pci"),
+            "stale": snap.is_stale("pci"),
         },
         "rsi_sp500": {
             "value": rsi,
             "label": rsi_label,
             "signal": rsi_signal,
+            "age_sec": _age(snap, "rsi"),
+            "stale": snap.is_stale("rsi"),
         },
         "qqq_vs_200ma": {
             "current": qqq_price,
             "sma200": round(qqq_sma, 2) if qqq_sma else None,
             "label": qqq_label,
             "signal": qqq_signal,
+            "age_sec": _age(snap, "qqq"),
+            "stale": snap.is_stale("qqq"),
         },
         "buffett_indicator": {
             "value": round(buffett_ratio, 1) if buffett_ratio else None,
             "label": buffett_label,
             "signal": buffett_signal,
+            "age_sec": _age(snap, buffett_name),
+            "stale": snap.is_stale(buffett_name),
         },
         "usd_krw": {
             "rate": round(usd_krw, 2) if usd_krw else None,
@@ -306,41 +237,61 @@ def get_market_indicators() -> dict:
             "change_pct": round(usd_krw_chg_pct, 2) if usd_krw_chg_pct else None,
             "label": usd_label,
             "signal": usd_signal,
+            "age_sec": _age(snap, "usd_krw"),
+            "stale": snap.is_stale("usd_krw"),
         },
         "retrieved_at": datetime.now().isoformat(),
+        "snapshot_version": snap.version,
         "note": "가격/지수 데이터는 마지막 거래일 종가 기준입니다. 시장 휴장 중에는 직전 거래일 데이터가 반환됩니다.",
     }
 
 
 @mcp.tool()
-def analyze_stock_drops(
+async def analyze_stock_drops(
     ticker: str,
     drop_threshold_pct: float = 1.0,
     days_after: int = 3,
     start_date: str = "2020-01-01",
+    confidence_interval: bool = False,
+    resamples: int = 10000,
+    horizon_unit: str = CALENDAR_DAYS,
 ) -> dict:
     """특정 종목이 drop_threshold_pct% 이상 하락한 날 기준으로 days_after일 후 가격 방향을 통계 분석합니다.
     미국 주식(QQQ, AAPL), 한국 주식(삼성전자, 005930), 인덱스, 코인 지원.
-    strategy는 'sell'(즉시매도 유리), 'wait'(기다리기 유리), 'neutral' 중 하나입니다."""
+    strategy는 'sell'(즉시매도 유리), 'wait'(기다리기 유리), 'neutral' 중 하나입니다.
+    horizon_unit: 'calendar_days'(N 달력일 후 첫 거래일, 기본) 또는 'trading_days'(N 거래일 후).
+    confidence_interval=true이면 win_rate의 95% 신뢰구간(ci_method: 신호가 30개 이상이면 'bootstrap',
+    적거나 전부 한쪽 결과면 'wilson')과 50% 대비 정확한 이항검정 p-value를 함께 반환합니다."""
+    return await _run_blocking(
+        _analyze_stock_drops, ticker, drop_threshold_pct, days_after, start_date,
+        confidence_interval, resamples, horizon_unit,
+    )
+
+
+def _analyze_stock_drops(ticker: str, drop_threshold_pct: float, days_after: int, start_date: str,
+                         confidence_interval: bool = False, resamples: int = 10000,
+                         horizon_unit: str = CALENDAR_DAYS) -> dict:
     processed_ticker, company_name = process_ticker_input(ticker)
+    if horizon_unit not in HORIZON_UNITS:
+        return {"error": f"horizon_unit은 {', '.join(HORIZON_UNITS)} 중 하나여야 합니다.", "ticker": processed_ticker}
+    if days_after < 1:
+        return {"error": "days_after는 1 이상이어야 합니다.", "ticker": processed_ticker}
+    horizon = horizon_text(days_after, horizon_unit)
 
     try:
-        data = yf.download(processed_ticker, start=start_date, progress=False, auto_adjust=True)
+        with _upstream("yahoo"):
+            data = get_history(processed_ticker, start_date)
     except Exception as e:
         return {"error": f"데이터 다운로드 실패: {str(e)}", "ticker": processed_ticker}
 
     if data.empty:
         return {"error": f"'{processed_ticker}' 데이터를 찾을 수 없습니다.", "ticker": processed_ticker}
 
-    if isinstance(data.columns, pd.MultiIndex):
-        data.columns = data.columns.droplevel(1)
-
-    data = data[["Close"]].copy()
-    data["Pct_Change"] = data["Close"].pct_change() * 100
-
-    signal_days = data[data["Pct_Change"] <= -drop_threshold_pct].copy()
+    # 저장분 갱신이 늦어졌거나 실패해 직전 저장분으로 응답한 경우 그 나이
+    data_age = data.attrs.get("age_sec")
+    stats = drop_stats(data.index, data["Close"].to_numpy(), drop_threshold_pct, days_after, horizon_unit)
 
-    if len(signal_days) == 0:
+    if stats.signals == 0:
         return {
             "ticker": processed_ticker,
             "company_name": company_name,
@@ -348,67 +299,175 @@ def analyze_stock_drops(
             "total_signals": 0,
         }
 
-    signal_days["Price_Today"] = signal_days["Close"]
-    signal_days = _add_nday_prices(signal_days, data, days_after)
-    signal_days = signal_days.dropna(subset=[f"Price_{days_after}D_Later"])
-
-    if len(signal_days) == 0:
+    if stats.total == 0:
         return {
             "ticker": processed_ticker,
-            "error": f"{days_after}일 후 데이터가 있는 하락일이 없습니다.",
+            "error": f"{horizon} 후 데이터가 있는 하락일이 없습니다.",
             "total_signals": 0,
         }
 
-    signal_days["Result"] = signal_days.apply(
-        lambda r: "Win" if r["Price_Today"] > r[f"Price_{days_after}D_Later"] else "Lose",
-        axis=1,
-    )
-    signal_days[f"Change_{days_after}D"] = (
-        (signal_days[f"Price_{days_after}D_Later"] - signal_days["Price_Today"])
-        / signal_days["Price_Today"]
-        * 100
-    )
-
-    total = len(signal_days)
-    win = int(signal_days["Result"].value_counts().get("Win", 0))
-    lose = int(signal_days["Result"].value_counts().get("Lose", 0))
-    win_rate = round(win / total * 100, 1)
-    avg_change = round(float(signal_days[f"Change_{days_after}D"].mean()), 2)
-
-    if win_rate > 55:
-        strategy = "sell"
+    strategy = stats.strategy
+    if strategy == "sell":
         recommendation = f"{ticker} 종목이 {drop_threshold_pct}% 이상 하락하면 즉시 매도를 고려하세요."
-    elif win_rate < 45:
-        strategy = "wait"
-        recommendation = f"{ticker} 종목이 {drop_threshold_pct}% 이상 하락해도 {days_after}일 정도는 기다려보세요."
+    elif strategy == "wait":
+        recommendation = f"{ticker} 종목이 {drop_threshold_pct}% 이상 하락해도 {horizon} 정도는 기다려보세요."
     else:
-        strategy = "neutral"
         recommendation = "즉시 매도와 대기 전략의 성공률이 비슷합니다. 다른 지표와 함께 판단하세요."
 
-    return {
+    result = {
         "ticker": processed_ticker,
         "company_name": company_name,
         "drop_threshold_pct": drop_threshold_pct,
         "days_after": days_after,
+        "horizon_unit": horizon_unit,
         "period_start": start_date,
-        "total_signals": total,
-        "win_count": win,
-        "lose_count": lose,
-        "win_rate": win_rate,
-        "avg_change_pct": avg_change,
+        "total_signals": stats.total,
+        "win_count": stats.win,
+        "lose_count": stats.lose,
+        "win_rate": round(stats.win_rate, 1),
+        "avg_change_pct": round(stats.avg_change, 2),
+        "median_change_pct": round(stats.median_change, 2),
         "strategy": strategy,
         "recommendation": recommendation,
+        "data_age_sec": _round_age(data_age),
+    }
+    if confidence_interval:
+        boot = bootstrap_win_rate(
+            stats.wins,
+            resamples=max(100, min(int(resamples), MAX_RESAMPLES)),
+            budget_sec=BOOTSTRAP_BUDGET_SEC,
+        )
+        result["win_rate_ci95"] = [round(boot["ci_low"], 1), round(boot["ci_high"], 1)]
+        result["p_value"] = round(boot["p_value"], 4)
+        result["ci_method"] = boot["method"]
+        result["resamples_used"] = boot["resamples"]
+    return result
+
+
+# 대시보드 분석 기간 선택지와 동일
+GRID_HORIZONS = [1, 3, 5, 7, 14, 30, 90, 180, 365]
+GRID_THRESHOLDS = [1.0, 2.0, 3.0, 5.0]
+
+
+@mcp.tool()
+async def analyze_drop_grid(
+    ticker: str,
+    drop_thresholds_pct: list[float] = GRID_THRESHOLDS,
+    days_after_list: list[int] = GRID_HORIZONS,
+    start_date: str = "2020-01-01",
+    horizon_unit: str = CALENDAR_DAYS,
+) -> dict:
+    """analyze_stock_drops를 여러 하락 기준 × 여러 기간 조합으로 한 번에 계산합니다.
+    행렬은 [하락 기준][기간] 순서이며 win_rate는 즉시 매도가 유리했던 비율(%)입니다.
+    horizon_unit은 analyze_stock_drops와 같습니다. 신호가 없는 칸은 null입니다."""
+    return await _run_blocking(
+        _analyze_drop_grid, ticker, drop_thresholds_pct, days_after_list, start_date, horizon_unit,
+    )
+
+
+def _analyze_drop_grid(ticker: str, thresholds, horizons, start_date: str,
+                       horizon_unit: str = CALENDAR_DAYS) -> dict:
+    processed_ticker, company_name = process_ticker_input(ticker)
+    if horizon_unit not in HORIZON_UNITS:
+        return {"error": f"horizon_unit은 {', '.join(HORIZON_UNITS)} 중 하나여야 합니다.", "ticker": processed_ticker}
+    thresholds = sorted({float(t) for t in thresholds})
+    horizons = sorted({int(h) for h in horizons})
+    if not thresholds or not horizons:
+        return {"error": "하락 기준과 기간을 하나 이상 지정하세요.", "ticker": processed_ticker}
+    if horizons[0] < 1:
+        return {"error": "days_after_list의 기간은 모두 1 이상이어야 합니다.", "ticker": processed_ticker}
+
+    try:
+        with _upstream("yahoo"):
+            data = get_history(processed_ticker, start_date)
+    except Exception as e:
+        return {"error": f"데이터 다운로드 실패: {str(e)}", "ticker": processed_ticker}
+
+    if data.empty:
+        return {"error": f"'{processed_ticker}' 데이터를 찾을 수 없습니다.", "ticker": processed_ticker}
+
+    grid = drop_grid(data, thresholds, horizons, horizon_unit)
+
+    def matrix(frame, digits):
+        return [[None if _safe(v) is None else round(v, digits) for v in row] for row in frame.to_numpy()]
+
+    return {
+        "ticker": processed_ticker,
+        "company_name": company_name,
+        "period_start": start_date,
+        "drop_thresholds_pct": thresholds,
+        "days_after_list": horizons,
+        "horizon_unit": horizon_unit,
+        "total_signals": grid["count"].to_numpy().tolist(),
+        "win_rate": matrix(grid["win_rate"], 1),
+        "avg_change_pct": matrix(grid["avg_change"], 2),
+        "median_change_pct": matrix(grid["median_change"], 2),
+        "data_age_sec": _round_age(data.attrs.get("age_sec")),
     }
 
 
 @mcp.tool()
-def get_stock_price(ticker_or_name: str) -> dict:
+async def scan_drop_signals(
+    sector: str = scanner.ALL,
+    drop_threshold_pct: float = 3.0,
+    days_after: int = 7,
+    start_date: str = "2020-01-01",
+    sort_by: str = "win_rate",
+    min_signals: int = 5,
+    limit: int = 20,
+    ctx: Context = None,
+) -> dict:
+    """한국 주식 여러 종목에 analyze_stock_drops 통계를 한 번에 적용해 순위를 매깁니다.
+    sector는 '전체'(한국 주식 전체) 또는 섹터 이름(예: '바이오', '금융').
+    sort_by는 'win_rate'(즉시 매도 유리 비율) 또는 'avg_change_pct'(평균 N일 변화율) 내림차순.
+    신호가 min_signals개 미만인 종목은 순위에서 제외합니다. 진행 상황은 progress로 전달됩니다."""
+    if sort_by not in scanner.SORT_KEYS:
+        return {"error": f"sort_by는 {', '.join(scanner.SORT_KEYS)} 중 하나여야 합니다."}
+    if days_after < 1:
+        return {"error": "days_after는 1 이상이어야 합니다."}
+    try:
+        codes = scanner.universe(sector)
+    except ValueError as e:
+        return {"error": str(e)}
+
+    def step(chunks):
+        with _upstream("yahoo"):
+            return next(chunks, None)
+
+    chunks = scanner.scan(codes, drop_threshold_pct, days_after, start_date)
+    results = []
+    while (item := await _run_blocking(step, chunks)) is not None:
+        done, partial = item
+        results.extend(partial)
+        if ctx is not None:
+            # 부분 결과: 지금까지의 1위를 진행 메시지로 전달
+            leader = scanner.rank(results, sort_by, min_signals, 1)
+            message = f"현재 1위 {leader[0]['name']} ({leader[0][sort_by]})" if leader else None
+            await ctx.report_progress(done, len(codes), message)
+
+    return {
+        "sector": sector,
+        "drop_threshold_pct": drop_threshold_pct,
+        "days_after": days_after,
+        "period_start": start_date,
+        "sort_by": sort_by,
+        "scanned": len(codes),
+        "with_signals": len(results),
+        "ranking": scanner.rank(results, sort_by, min_signals, limit),
+    }
+
+
+@mcp.tool()
+async def get_stock_price(ticker_or_name: str) -> dict:
     """미국 주식(AAPL), 한국 주식(삼성전자 또는 005930), 인덱스(^GSPC), 코인(BTC-USD) 현재가 조회."""
+    return await _run_blocking(_get_stock_price, ticker_or_name)
+
+
+def _get_stock_price(ticker_or_name: str) -> dict:
     processed_ticker, company_name = process_ticker_input(ticker_or_name)
 
     try:
-        t = yf.Ticker(processed_ticker)
-        hist = t.history(period="5d")
+        hist, info = _get_quote(processed_ticker)
         if hist.empty:
             return {"error": f"'{processed_ticker}' 데이터를 찾을 수 없습니다.", "ticker": processed_ticker}
 
@@ -420,12 +479,6 @@ def get_stock_price(ticker_or_name: str) -> dict:
         prev_price = float(close_series.iloc[-2]) if len(close_series) >= 2 else current_price
         change_pct = round((current_price - prev_price) / prev_price * 100, 2) if prev_price else 0.0
 
-        info = {}
-        try:
-            info = t.info or {}
-        except Exception:
-            pass
-
         _kr_ticker = processed_ticker.upper()
         is_korean = (
             processed_ticker.endswith(".KS")
@@ -444,6 +497,8 @@ def get_stock_price(ticker_or_name: str) -> dict:
 
         last_date = close_series.index[-1]
         data_as_of = last_date.strftime("%Y-%m-%d") if hasattr(last_date, "strftime") else str(last_date)[:10]
+        # 캐시 TTL이 지난 값이면 백그라운드 갱신 중에 반환된 직전 시세
+        quote_age = _get_quote.age(processed_ticker)
 
         return {
             "ticker": processed_ticker,
@@ -454,13 +509,15 @@ def get_stock_price(ticker_or_name: str) -> dict:
             "volume": vol,
             "market": "KRX" if is_korean else "US",
             "data_as_of": data_as_of,
+            "age_sec": _round_age(quote_age),
+            "stale": quote_age is not None and quote_age >= _get_quote.cache.ttl,
         }
     except Exception as e:
         return {"error": str(e), "ticker": processed_ticker}
 
 
 @mcp.tool()
-def search_korean_stock(query: str) -> list:
+async def search_korean_stock(query: str) -> list:
     """한국 주식 종목명 부분 검색. 최대 20개 반환.
     예: '삼성' → 삼성전자, 삼성SDI 등 / 'SK' → SK하이닉스, SK텔레콤 등"""
     results = search_stocks(query)
@@ -0,0 +1,63 @@
+"""메모리 매핑 가격 아레나: 종목별 압축 배열(analysis.PriceArrays)을 Arrow IPC 파일로 보관.
+
+price_store가 저장분을 쓸 때마다 같은 디렉터리에 비압축 Arrow IPC 파일을 함께 쓰고,
+읽을 때는 mmap으로 열어 numpy 배열을 파일 페이지 위의 뷰로 만든다(복사 없음).
+Streamlit 앱, MCP 서버, 스캔 워커 프로세스가 같은 파일을 열면 OS 페이지 캐시를
+공유하므로 같은 종목 히스토리는 호스트당 한 번만 메모리에 올라간다.
+"""
+import os
+import tempfile
+
+import numpy as np
+import pyarrow as pa
+
+from analysis import PriceArrays
+
+_COLUMNS = ("days", "close", "volume")
+
+
+def write(path: str, arrays: PriceArrays, metadata: dict):
+    """arrays를 레코드 배치 하나짜리 Arrow IPC 파일로 원자적으로 저장. metadata는 {bytes: bytes}."""
+    volume = arrays.volume if arrays.volume is not None else np.full(len(arrays), np.nan, np.float32)
+    table = pa.table({"days": arrays.days, "close": arrays.close, "volume": volume})
+    table = table.replace_schema_metadata(metadata)
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    # 다른 프로세스가 옛 파일을 매핑 중이어도 교체 후 그 매핑은 옛 내용을 그대로 유지
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    os.close(fd)
+    try:
+        with pa.OSFile(tmp, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table, max_chunksize=max(len(table), 1))
+        os.replace(tmp, path)
+    except Exception:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def open_arrays(path: str, from_day: int = None):
+    """(PriceArrays, metadata). 배열은 mmap 위의 읽기 전용 뷰로, from_day(day_numbers 일수) 이후만.
+
+    없거나 손상되면 None. 반환한 PriceArrays를 다른 프로세스로 피클하면 배열 대신
+    (경로, from_day)만 넘어가고 받는 쪽에서 같은 파일을 다시 매핑한다.
+    """
+    try:
+        reader = pa.ipc.open_file(pa.memory_map(path))
+        if reader.num_record_batches != 1:
+            return None
+        batch = reader.get_batch(0)
+        days, close, volume = (batch.column(name).to_numpy(zero_copy_only=True) for name in _COLUMNS)
+    except (FileNotFoundError, pa.ArrowInvalid, OSError, KeyError):
+        return None
+    start = 0 if from_day is None else int(np.searchsorted(days, from_day))
+    arrays = PriceArrays(days[start:], close[start:], volume[start:], source=(path, from_day))
+    return arrays, dict(reader.schema.metadata or {})
+
+
+def remap(path: str, from_day: int = None) -> PriceArrays:
+    """피클된 아레나 PriceArrays 복원용. 파일이 사라졌으면 FileNotFoundError."""
+    opened = open_arrays(path, from_day)
+    if opened is None:
+        raise FileNotFoundError(path)
+    return opened[0]
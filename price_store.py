@@ -0,0 +1,341 @@
+"""yfinance 일봉 히스토리 로컬 저장소.
+
+티커 × 수정주가 모드별로 Parquet 파일 하나씩 저장하고, 이후 호출에서는
+마지막 저장일 이후 구간만 네트워크에서 받아 이어 붙인다.
+저장할 때마다 압축 배열 아레나(price_arena, mmap용 Arrow IPC)도 함께 갱신한다.
+"""
+import os
+import tempfile
+import threading
+import time
+from urllib.parse import quote
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import yfinance as yf
+
+import price_arena
+from analysis import PriceArrays, day_numbers
+from cache import SingleFlight
+from market_data import split_by_symbol
+
+STORE_DIR = os.getenv(
+    "PRICE_STORE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".price_store"),
+)
+# 이 시간(초) 안에 갱신한 파일은 네트워크 조회 없이 그대로 사용
+MAX_AGE = int(os.getenv("PRICE_STORE_MAX_AGE", 900))
+# MAX_AGE가 지난 저장분도 이 시간(초) 동안은 즉시 반환하고 뒷부분 갱신은 백그라운드에서 수행
+STALE_GRACE = int(os.getenv("PRICE_STORE_STALE_GRACE", 3600))
+# 이어 붙일 때 겹치는 날 종가가 이 비율 이상 다르면 (배당/분할 재조정) 전체 재다운로드
+_ADJUST_TOLERANCE = 1e-4
+
+_flights = SingleFlight()
+_refreshing = set()
+_refreshing_lock = threading.Lock()
+
+# get_price_arrays가 저장분에서 읽는 열
+_COMPACT_COLUMNS = ["Close", "Volume"]
+
+_META_FROM = b"covered_from"
+_META_FETCHED = b"fetched_at"
+
+
+def _path(ticker: str, auto_adjust: bool) -> str:
+    mode = "adj" if auto_adjust else "raw"
+    return os.path.join(STORE_DIR, f"{quote(ticker.upper(), safe='')}.{mode}.parquet")
+
+
+def _arena_path(path: str) -> str:
+    return path[:-len(".parquet")] + ".arrow"
+
+
+def _read(path, columns=None):
+    """저장된 (DataFrame, covered_from, fetched_at). 없거나 손상되면 None.
+
+    columns를 주면 날짜 인덱스와 그중 저장된 열만 읽는다.
+    """
+    try:
+        if columns is not None:
+            names = pq.read_schema(path).names
+            columns = [c for c in columns if c in names]
+        table = pq.read_table(path, columns=columns, use_pandas_metadata=True)
+    except (FileNotFoundError, pa.ArrowInvalid, OSError):
+        return None
+    meta = table.schema.metadata or {}
+    try:
+        covered_from = pd.Timestamp(meta[_META_FROM].decode())
+        fetched_at = float(meta[_META_FETCHED])
+    except (KeyError, ValueError):
+        return None
+    return table.to_pandas(), covered_from, fetched_at
+
+
+def _write(path, data: pd.DataFrame, covered_from: pd.Timestamp):
+    os.makedirs(STORE_DIR, exist_ok=True)
+    table = pa.Table.from_pandas(data)
+    meta = dict(table.schema.metadata or {})
+    meta[_META_FROM] = covered_from.isoformat().encode()
+    meta[_META_FETCHED] = str(time.time()).encode()
+    table = table.replace_schema_metadata(meta)
+    # 같은 파일을 여러 프로세스가 읽으므로 임시 파일에 쓰고 원자적으로 교체
+    fd, tmp = tempfile.mkstemp(dir=STORE_DIR, suffix=".tmp")
+    os.close(fd)
+    try:
+        pq.write_table(table, tmp)
+        os.replace(tmp, path)
+    except Exception:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    try:
+        price_arena.write(_arena_path(path), PriceArrays.from_frame(data),
+                          {_META_FROM: meta[_META_FROM], _META_FETCHED: meta[_META_FETCHED]})
+    except (OSError, pa.ArrowException):
+        pass  # 아레나는 파생 캐시라 실패해도 Parquet 저장분으로 응답 가능
+
+
+def _download(ticker: str, start, auto_adjust: bool) -> pd.DataFrame:
+    data = yf.download(ticker, start=start, progress=False, auto_adjust=auto_adjust)
+    if isinstance(data.columns, pd.MultiIndex):
+        data.columns = data.columns.droplevel(1)
+    data.columns.name = None
+    return data
+
+
+def get_history(ticker: str, start, auto_adjust: bool = True) -> pd.DataFrame:
+    """start 이후 일봉 OHLCV. 로컬 저장분을 우선 사용하고 빠진 뒷부분만 다운로드.
+
+    네트워크 오류 시 저장분이 있으면 그것을 반환하고, 없으면 예외를 그대로 올린다.
+    같은 요청의 동시 호출은 한 번의 조회로 합친다.
+    반환 DataFrame의 attrs["age_sec"]는 저장분을 마지막으로 갱신한 뒤 지난 시간(초).
+    """
+    start = pd.Timestamp(start)
+    data = _flights.do((ticker.upper(), auto_adjust, start), _load, ticker, start, auto_adjust)
+    return data if data.empty else data[data.index >= start]
+
+
+def get_price_arrays(tickers, start, auto_adjust: bool = True) -> dict:
+    """여러 티커의 start 이후 일봉을 {티커: analysis.PriceArrays}로 (종가·거래량만 압축 보관).
+
+    데이터가 없는 티커는 제외. 유니버스 스캔처럼 티커가 많을 때 티커별 get_history 대신 사용한다.
+    grace 안의 저장분은 아레나 파일을 mmap으로 열어 복사 없이 반환하고(아레나가 없는 옛 저장분은
+    Parquet에서 종가·거래량 열만 읽음), 나머지는 yf.download 한 번으로 묶어 받아 저장한다.
+    """
+    start = pd.Timestamp(start)
+    result, aging = {}, []
+    for ticker in tickers:
+        arrays = _map_fresh(ticker, start, auto_adjust, aging)
+        if arrays is not None:
+            result[ticker] = arrays
+    _revalidate_in_background(aging, auto_adjust)
+    rest = [ticker for ticker in tickers if ticker not in result]
+    if rest:
+        for ticker, frame in _collect(rest, start, auto_adjust, _COMPACT_COLUMNS).items():
+            # 방금 받아 저장했으면 아레나 매핑으로
+            result[ticker] = _map_fresh(ticker, start, auto_adjust, []) or PriceArrays.from_frame(frame)
+    return result
+
+
+def _map_fresh(ticker, start, auto_adjust, aging: list):
+    """grace 안이고 start부터 덮는 아레나의 start 이후 배열. 아니면 None.
+
+    MAX_AGE가 지난 저장분이면 ticker를 aging에 추가한다 (백그라운드 갱신 대상).
+    """
+    opened = price_arena.open_arrays(_arena_path(_path(ticker, auto_adjust)), int(day_numbers([start])[0]))
+    if opened is None:
+        return None
+    arrays, meta = opened
+    try:
+        covered_from = pd.Timestamp(meta[_META_FROM].decode())
+        fetched_at = float(meta[_META_FETCHED])
+    except (KeyError, ValueError):
+        return None
+    now = time.time()
+    if not _usable(covered_from, fetched_at, start, now) or len(arrays) == 0:
+        return None
+    if now - fetched_at >= MAX_AGE:
+        aging.append(ticker)
+    return arrays
+
+
+def _usable(covered_from, fetched_at, start, now) -> bool:
+    return covered_from <= start and now - fetched_at < MAX_AGE + STALE_GRACE
+
+
+def _collect(tickers, start, auto_adjust, columns=None) -> dict:
+    now = time.time()
+    result, missing, stale, aging = {}, [], {}, []
+    for ticker in tickers:
+        cached = _read(_path(ticker, auto_adjust), columns)
+        if cached is None or cached[0].empty or cached[1] > start:
+            missing.append(ticker)
+        elif _usable(cached[1], cached[2], start, now):
+            data = cached[0]
+            data.attrs["age_sec"] = now - cached[2]
+            result[ticker] = data[data.index >= start]
+            if data.attrs["age_sec"] >= MAX_AGE:
+                aging.append(ticker)
+        else:
+            # 이어 붙여 다시 저장하므로 일부 열만 읽었으면 전체 열로 다시 읽음
+            cached = cached if columns is None else _read(_path(ticker, auto_adjust))
+            if cached is None:
+                missing.append(ticker)
+            else:
+                stale[ticker] = cached
+
+    _revalidate_in_background(aging, auto_adjust)
+    if stale:
+        for ticker, data in _extend_stored(stale, auto_adjust, now).items():
+            result[ticker] = data[data.index >= start]
+    if missing:
+        data = yf.download(missing, start=start, group_by="ticker", progress=False,
+                           auto_adjust=auto_adjust, threads=True)
+        for ticker, frame in split_by_symbol(data, missing).items():
+            try:
+                _write(_path(ticker, auto_adjust), frame, start)
+            except OSError:
+                pass  # 저장 실패는 이번 응답에 영향 없음
+            frame.attrs["age_sec"] = 0.0
+            result[ticker] = frame
+    return result
+
+
+def _extend_stored(stored: dict, auto_adjust: bool, now: float) -> dict:
+    """{티커: 오래된 저장분 _read 결과}의 뒷부분만 yf.download 한 번으로 받아 이어 붙이고 저장.
+
+    저장 구간 시작일(covered_from)은 그대로 두어 저장분이 줄어들지 않는다.
+    뒷부분을 받지 못한 티커는 저장분을 그대로 반환한다.
+    """
+    anchors = {ticker: _anchor(cached[0]) for ticker, cached in stored.items()}
+    tickers = list(stored)
+    tails = split_by_symbol(
+        yf.download(tickers, start=min(anchors.values()), group_by="ticker", progress=False,
+                    auto_adjust=auto_adjust, threads=True),
+        tickers,
+    )
+    result = {}
+    for ticker, (data, covered_from, fetched_at) in stored.items():
+        tail = tails.get(ticker)
+        if tail is None:
+            data.attrs["age_sec"] = now - fetched_at
+        else:
+            data = _extend(ticker, data, covered_from, auto_adjust, tail[tail.index >= anchors[ticker]])
+            try:
+                _write(_path(ticker, auto_adjust), data, covered_from)
+            except OSError:
+                pass
+            data.attrs["age_sec"] = 0.0
+        result[ticker] = data
+    return result
+
+
+def _load(ticker: str, start: pd.Timestamp, auto_adjust: bool) -> pd.DataFrame:
+    path = _path(ticker, auto_adjust)
+    cached = _read(path)
+
+    if cached is None or cached[1] > start or cached[0].empty:
+        data = _download(ticker, start, auto_adjust)
+        if data.empty:
+            return data
+        try:
+            _write(path, data, start)
+        except OSError:
+            pass  # 저장 실패는 이번 응답에 영향 없음
+        data.attrs["age_sec"] = 0.0
+        return data
+
+    data, covered_from, fetched_at = cached
+    age = time.time() - fetched_at
+    if age >= MAX_AGE + STALE_GRACE:
+        refreshed = _refresh(ticker, data, covered_from, auto_adjust)
+        if refreshed is not None:
+            data, age = refreshed, 0.0
+    elif age >= MAX_AGE:
+        _refresh_in_background(ticker, data, covered_from, auto_adjust)
+
+    data.attrs["age_sec"] = age
+    return data
+
+
+def _refresh(ticker: str, data: pd.DataFrame, covered_from, auto_adjust: bool):
+    """저장분을 이어 받아 다시 저장. 네트워크 실패 시 None (저장분 유지)."""
+    try:
+        data = _extend(ticker, data, covered_from, auto_adjust)
+        _write(_path(ticker, auto_adjust), data, covered_from)
+        return data
+    except Exception:
+        return None
+
+
+def _refresh_in_background(ticker: str, data: pd.DataFrame, covered_from, auto_adjust: bool):
+    key = (ticker.upper(), auto_adjust)
+    with _refreshing_lock:
+        if key in _refreshing:
+            return
+        _refreshing.add(key)
+
+    def run():
+        try:
+            _refresh(ticker, data, covered_from, auto_adjust)
+        finally:
+            with _refreshing_lock:
+                _refreshing.discard(key)
+
+    threading.Thread(target=run, daemon=True, name=f"price-store-{ticker}").start()
+
+
+def _revalidate_in_background(tickers, auto_adjust: bool):
+    """MAX_AGE가 지난(grace 안) 저장분들의 뒷부분을 백그라운드 스레드 하나에서 일괄 갱신.
+
+    일괄 조회(get_price_arrays 등)용 _refresh_in_background. 이미 갱신 중인 티커는 건너뛴다.
+    """
+    with _refreshing_lock:
+        keys = {ticker: (ticker.upper(), auto_adjust) for ticker in tickers}
+        keys = {ticker: key for ticker, key in keys.items() if key not in _refreshing}
+        _refreshing.update(keys.values())
+    if not keys:
+        return
+
+    def run():
+        try:
+            stored = {}
+            for ticker in keys:
+                cached = _read(_path(ticker, auto_adjust))
+                if cached is not None and not cached[0].empty:
+                    stored[ticker] = cached
+            if stored:
+                _extend_stored(stored, auto_adjust, time.time())
+        except Exception:
+            pass  # 실패 시 grace가 끝날 때까지 저장분 유지
+        finally:
+            with _refreshing_lock:
+                _refreshing.difference_update(keys.values())
+
+    threading.Thread(target=run, daemon=True, name="price-store-batch").start()
+
+
+def _anchor(data: pd.DataFrame) -> pd.Timestamp:
+    # 마지막 봉은 장중 미완성일 수 있으므로 그 직전 확정 봉부터 겹쳐 받아 검증
+    return data.index[-2] if len(data) >= 2 else data.index[-1]
+
+
+def _extend(ticker: str, data: pd.DataFrame, covered_from, auto_adjust: bool, tail=None) -> pd.DataFrame:
+    """저장분 뒤에 새 봉을 이어 붙인 DataFrame. tail은 미리 받은 _anchor 이후 봉 (생략 시 다운로드)."""
+    anchor = _anchor(data)
+    if tail is None:
+        tail = _download(ticker, anchor, auto_adjust)
+    if tail.empty:
+        return data
+    if anchor in tail.index and not _same_close(data.loc[anchor, "Close"], tail.loc[anchor, "Close"]):
+        # 수정주가가 재계산됨 → 과거 구간도 달라졌으므로 전체 재다운로드
+        full = _download(ticker, covered_from, auto_adjust)
+        return full if not full.empty else data
+    return pd.concat([data[data.index < tail.index[0]], tail])
+
+
+def _same_close(a, b) -> bool:
+    if pd.isna(a) or pd.isna(b):
+        return pd.isna(a) and pd.isna(b)
+    return abs(float(a) - float(b)) <= _ADJUST_TOLERANCE * max(abs(float(a)), 1.0)
@@ -0,0 +1,189 @@
+"""증분 RSI 엔진과 패널 일괄 RSI (analysis.py / indicators.py 공용).
+
+RSIEngine은 심볼별 평균 상승/하락 상태를 보관해 새 봉 하나를 O(1)로 반영한다.
+일봉의 마지막 봉은 장중에 계속 바뀌므로 '확정 상태 + 잠정 봉 하나'로 나눠 두고,
+같은 날짜의 봉이 다시 들어오면 잠정 봉만 바꾸고 다음 날짜가 오면 그때 확정한다.
+"""
+import threading
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+SMA = "sma"        # 최근 window개 변화량의 단순 평균
+WILDER = "wilder"  # 첫 window개 단순 평균 후 (이전 평균 × (n-1) + 새 값) / n
+METHODS = (SMA, WILDER)
+# extend에서 마지막 확정 봉 종가가 이 비율 이상 다르면 상태를 다시 만든다
+_ADJUST_TOLERANCE = 1e-4
+
+
+def _check_method(method):
+    if method not in METHODS:
+        raise ValueError(f"method는 {', '.join(METHODS)} 중 하나여야 합니다.")
+
+
+def _rsi(avg_gain, avg_loss):
+    if avg_loss == 0:
+        return None if avg_gain == 0 else 100.0
+    return 100 - 100 / (1 + avg_gain / avg_loss)
+
+
+class _State:
+    """심볼 하나의 확정 상태와 잠정(마지막) 봉."""
+    __slots__ = ("prev_ts", "prev_close", "count", "sum_gain", "sum_loss", "avg_gain", "avg_loss",
+                 "deltas", "pending_ts", "pending_close")
+
+    def __init__(self, window):
+        self.prev_ts = None
+        self.prev_close = None    # 마지막 확정 봉 종가
+        self.count = 0            # 확정된 변화량 개수
+        self.sum_gain = 0.0       # SMA: 최근 window개 합 / Wilder: 시드용 첫 window개 합
+        self.sum_loss = 0.0
+        self.avg_gain = None      # Wilder 평활 평균 (count >= window부터)
+        self.avg_loss = None
+        self.deltas = deque(maxlen=window)  # SMA: 최근 window개 (상승, 하락)
+        self.pending_ts = None
+        self.pending_close = None
+
+
+class RSIEngine:
+    """심볼별 상태를 두고 봉 단위로 갱신하는 RSI 계산기 (스레드 안전).
+
+    update는 봉 하나, extend는 시계열에서 아직 반영하지 않은 봉만 반영한다.
+    처음 한 번 히스토리로 상태를 만든 뒤에는 최신 봉만 넘기면 된다.
+    """
+
+    def __init__(self, window: int = 14, method: str = WILDER):
+        _check_method(method)
+        self.window = window
+        self.method = method
+        self._states = {}
+        self._lock = threading.Lock()
+
+    def update(self, symbol, close: float, ts=None):
+        """봉 하나 반영 후 현재 RSI (계산 불가 시 None).
+
+        ts가 잠정 봉과 같으면 그 봉을 교체하고, 더 이르면 무시한다. ts=None은 항상 새 봉.
+        """
+        with self._lock:
+            state = self._states.get(symbol)
+            if state is None:
+                state = self._states[symbol] = _State(self.window)
+            self._apply(state, float(close), ts)
+            return self._value(state)
+
+    def extend(self, symbol, closes: pd.Series):
+        """날짜 인덱스 종가 시계열 중 잠정 봉 날짜 이후(같은 날 포함)만 반영 후 현재 RSI.
+
+        반영할 봉이 없으면 (다운로드 실패 등) 직전 값을 새 값처럼 내보내지 않도록 None.
+        마지막 확정 봉의 종가가 보관한 값과 다르면 (배당/분할로 수정주가 재계산)
+        상태를 버리고 시계열 전체로 다시 만든다.
+        """
+        closes = closes.dropna()
+        with self._lock:
+            state = self._states.get(symbol)
+            if state is not None and state.prev_ts in closes.index:
+                if not np.isclose(closes[state.prev_ts], state.prev_close, rtol=_ADJUST_TOLERANCE):
+                    state = None
+            if state is None:
+                state = self._states[symbol] = _State(self.window)
+            start = 0 if state.pending_ts is None else closes.index.searchsorted(state.pending_ts)
+            if start >= len(closes):
+                return None
+            for ts, close in zip(closes.index[start:], closes.to_numpy(dtype=float)[start:]):
+                self._apply(state, close, ts)
+            return self._value(state)
+
+    def value(self, symbol):
+        """symbol의 현재 RSI. 상태가 없거나 봉이 부족하면 None."""
+        with self._lock:
+            state = self._states.get(symbol)
+            return None if state is None else self._value(state)
+
+    def _apply(self, state, close, ts):
+        if state.pending_ts is not None and ts is not None:
+            if ts < state.pending_ts:
+                return
+            if ts == state.pending_ts:
+                state.pending_close = close
+                return
+        if state.pending_close is not None:
+            self._commit(state, state.pending_close)
+            state.prev_ts = state.pending_ts
+        state.pending_ts = ts
+        state.pending_close = close
+
+    def _commit(self, state, close):
+        if state.prev_close is not None:
+            gain, loss = _split(close - state.prev_close)
+            if self.method == SMA:
+                if len(state.deltas) == self.window:
+                    old_gain, old_loss = state.deltas[0]
+                    state.sum_gain -= old_gain
+                    state.sum_loss -= old_loss
+                state.deltas.append((gain, loss))
+                state.sum_gain += gain
+                state.sum_loss += loss
+            else:
+                state.avg_gain, state.avg_loss = self._wilder_avg(state, gain, loss)
+                if state.count < self.window:
+                    state.sum_gain += gain
+                    state.sum_loss += loss
+            state.count += 1
+        state.prev_close = close
+
+    def _wilder_avg(self, state, gain, loss):
+        """확정 상태에 변화량 하나를 더했을 때의 Wilder 평균 (변화량이 부족하면 None, None)."""
+        n = self.window
+        if state.count + 1 < n:
+            return None, None
+        if state.count + 1 == n:
+            return (state.sum_gain + gain) / n, (state.sum_loss + loss) / n
+        return (state.avg_gain * (n - 1) + gain) / n, (state.avg_loss * (n - 1) + loss) / n
+
+    def _value(self, state):
+        # 잠정 봉까지 포함한 값. 확정 상태는 바꾸지 않는다
+        if state.pending_close is None or state.prev_close is None:
+            return None
+        gain, loss = _split(state.pending_close - state.prev_close)
+        n = self.window
+        if state.count + 1 < n:
+            return None
+        if self.method == SMA:
+            if len(state.deltas) == n:
+                old_gain, old_loss = state.deltas[0]
+                return _rsi((state.sum_gain - old_gain + gain) / n, (state.sum_loss - old_loss + loss) / n)
+            return _rsi((state.sum_gain + gain) / n, (state.sum_loss + loss) / n)
+        return _rsi(*self._wilder_avg(state, gain, loss))
+
+
+def _split(delta):
+    return (delta, 0.0) if delta > 0 else (0.0, -delta)
+
+
+def rsi_panel(closes: pd.DataFrame, window: int = 14, method: str = WILDER) -> pd.DataFrame:
+    """열마다 종목 하나인 종가 패널의 전체 RSI를 한 번에 계산 (열 단위 벡터 연산).
+
+    종목별 상장일이 달라 앞쪽이 비어 있어도 되고, 중간 결측은 직전 종가로 채운다.
+    평균 하락이 0이면 100, 상승·하락이 모두 0이면 NaN.
+    """
+    _check_method(method)
+    delta = closes.ffill().diff()
+    gain = delta.clip(lower=0)
+    loss = (-delta).clip(lower=0)
+    avg_gain = gain.rolling(window).mean()
+    avg_loss = loss.rolling(window).mean()
+    if method == WILDER:
+        avg_gain = _wilder_smooth(gain, avg_gain, window)
+        avg_loss = _wilder_smooth(loss, avg_loss, window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100 - 100 / (1 + avg_gain / avg_loss)
+    return rsi.where(~((avg_loss == 0) & (avg_gain == 0)))
+
+
+def _wilder_smooth(values, sma, window):
+    # 열마다 첫 SMA 값을 시드로 두고 이후는 alpha=1/window 지수 평활 (= Wilder 평활)
+    valid = sma.notna()
+    seed = valid & ~valid.shift(fill_value=False)
+    seeded = values.where(valid).mask(seed, sma)
+    return seeded.ewm(alpha=1 / window, adjust=False).mean()
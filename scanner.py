@@ -0,0 +1,113 @@
+"""종목 유니버스(섹터 또는 한국 주식 전체) 일괄 하락 신호 스캔 (app.py / mcp_server.py 공용).
+
+티커를 청크로 나눠 청크마다 yf.download 한 번으로 받고, 종목별 통계는 프로세스 풀에서 계산한다.
+가격은 압축 배열(analysis.PriceArrays)로만 들고 다닌다.
+다음 청크를 받는 동안 앞 청크를 계산하며, 청크가 끝날 때마다 부분 결과를 내보낸다.
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from analysis import drop_stats
+from price_store import get_price_arrays
+from stock_library import get_all_sectors, get_all_stocks, get_sector_stocks
+
+ALL = "전체"
+# 청크당 티커 수 (yf.download 한 번의 크기)
+CHUNK_SIZE = int(os.getenv("SCAN_CHUNK_SIZE", 50))
+# 종목별 통계 계산 프로세스 수. 1이면 현재 프로세스에서 계산
+PROCESSES = int(os.getenv("SCAN_PROCESSES", min(4, os.cpu_count() or 1)))
+SORT_KEYS = ("win_rate", "avg_change_pct")
+
+_pool = None
+
+
+def universe(target: str = ALL) -> list:
+    """스캔 대상 6자리 종목 코드. target은 '전체' 또는 stock_library의 섹터 이름."""
+    if target == ALL:
+        return list(get_all_stocks())
+    sectors = get_all_sectors()
+    if target not in sectors:
+        raise ValueError(f"알 수 없는 섹터: {target} (가능: {ALL}, {', '.join(sectors)})")
+    return list(get_sector_stocks(target))
+
+
+def _get_pool():
+    # 스레드가 있는 서버 프로세스에서 fork하지 않도록 spawn 사용. 시작 비용이 커서 한 번 만들어 재사용
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(PROCESSES, mp_context=multiprocessing.get_context("spawn"))
+    return _pool
+
+
+def _ticker_stats(code, prices, drop_threshold_pct, days_after):
+    stats = drop_stats(prices.days, prices.close, drop_threshold_pct, days_after)
+    if stats.total == 0:
+        return None
+    return {
+        "code": code,
+        "name": get_all_stocks().get(code),
+        "total_signals": stats.total,
+        "win_rate": round(stats.win_rate, 1),
+        "avg_change_pct": round(stats.avg_change, 2),
+        "strategy": stats.strategy,
+    }
+
+
+def _chunk_stats(items, drop_threshold_pct, days_after):
+    """[(코드, PriceArrays)] → 신호가 있는 종목의 통계 목록."""
+    results = []
+    for code, prices in items:
+        stats = _ticker_stats(code, prices, drop_threshold_pct, days_after)
+        if stats is not None:
+            results.append(stats)
+    return results
+
+
+def _payload(codes, prices):
+    # 프로세스 간에는 압축 배열만 넘겨 직렬화 비용을 줄임 (봉당 12바이트)
+    items = []
+    for code in codes:
+        arrays = prices.get(f"{code}.KS")
+        if arrays is not None and len(arrays) >= 2:
+            items.append((code, arrays))
+    return items
+
+
+def scan(codes, drop_threshold_pct: float, days_after: int, start_date,
+         chunk_size: int = None, processes: int = None):
+    """청크마다 (지금까지 처리한 종목 수, 이번 청크 결과 목록)을 내보내는 제너레이터.
+
+    chunk_size/processes를 생략하면 CHUNK_SIZE/PROCESSES 설정을 따른다.
+    """
+    chunk_size = chunk_size or CHUNK_SIZE
+    processes = processes or PROCESSES
+    chunks = [codes[i:i + chunk_size] for i in range(0, len(codes), chunk_size)]
+    pool = _get_pool() if processes > 1 else None
+    pending = None  # (처리한 종목 수, 계산 중인 앞 청크)
+    done = 0
+    for chunk in chunks:
+        prices = get_price_arrays([f"{code}.KS" for code in chunk], start_date)
+        items = _payload(chunk, prices)
+        if pool is not None:
+            computed = pool.submit(_chunk_stats, items, drop_threshold_pct, days_after)
+        else:
+            computed = _chunk_stats(items, drop_threshold_pct, days_after)
+        if pending is not None:
+            yield pending[0], _result(pending[1])
+        done += len(chunk)
+        pending = (done, computed)
+    if pending is not None:
+        yield pending[0], _result(pending[1])
+
+
+def _result(computed):
+    return computed if isinstance(computed, list) else computed.result()
+
+
+def rank(results, sort_by: str = "win_rate", min_signals: int = 5, limit: int = 20) -> list:
+    """신호 수가 min_signals 이상인 종목을 sort_by 내림차순으로 상위 limit개."""
+    if sort_by not in SORT_KEYS:
+        raise ValueError(f"sort_by는 {', '.join(SORT_KEYS)} 중 하나여야 합니다.")
+    eligible = [r for r in results if r["total_signals"] >= min_signals]
+    return sorted(eligible, key=lambda r: r[sort_by], reverse=True)[:limit]
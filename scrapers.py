@@ -0,0 +1,120 @@
+"""웹 스크래핑 지표 (공포&탐욕 지수, Put/Call 비율, 버핏 지수) 조회 및 파싱.
+
+페이지 전체 DOM을 만들지 않고 미리 컴파일한 정규식으로 첫 번째 대상 요소만 찾는다.
+마크업이 바뀌어 정규식이 요소를 못 찾을 때만 BeautifulSoup 파싱으로 넘어간다.
+"""
+import html
+import re
+
+from bs4 import BeautifulSoup
+
+import http_client
+
+try:
+    import lxml  # noqa: F401
+    _SOUP_PARSER = "lxml"
+except ImportError:
+    _SOUP_PARSER = "html.parser"
+
+FGI_URL = "https://feargreedmeter.com/"
+PCI_URL = "https://ycharts.com/indicators/cboe_equity_put_call_ratio"
+BUFFETT_URL = "https://www.longtermtrends.net/market-cap-to-gdp-the-buffett-indicator/"
+
+_FGI_CLASS = "text-center text-4xl font-semibold mb-1 text-white"
+_FGI_RE = re.compile(
+    r'<div\b[^>]*\bclass="' + re.escape(_FGI_CLASS) + r'"[^>]*>(.*?)</div>',
+    re.IGNORECASE | re.DOTALL,
+)
+# class 속성에 col-6 토큰이 있는 td (BeautifulSoup class_="col-6"과 같은 조건)
+_PCI_TD_RE = re.compile(
+    r'<td\b[^>]*\bclass="(?:[^"]*\s)?col-6(?:\s[^"]*)?"[^>]*>(.*?)</td>',
+    re.IGNORECASE | re.DOTALL,
+)
+_BUFFETT_RE = re.compile(
+    r'<span\b[^>]*\bclass="(?:[^"]*\s)?indicator-value(?:\s[^"]*)?"[^>]*>(.*?)</span>',
+    re.IGNORECASE | re.DOTALL,
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def _text(fragment: str) -> str:
+    return html.unescape(_TAG_RE.sub("", fragment)).strip()
+
+
+def _fgi_value(text: str):
+    return int(text) if text.isdigit() else None
+
+
+def _pci_value(text: str):
+    try:
+        return float(text.replace(",", ""))
+    except ValueError:
+        return None
+
+
+def parse_fgi(page: str):
+    """feargreedmeter.com 페이지에서 공포&탐욕 지수(0~100). 없으면 None."""
+    m = _FGI_RE.search(page)
+    if m:
+        return _fgi_value(_text(m.group(1)))
+    el = BeautifulSoup(page, _SOUP_PARSER).find("div", class_=_FGI_CLASS)
+    return _fgi_value(el.text.strip()) if el else None
+
+
+def parse_pci(page: str):
+    """ycharts 페이지에서 숫자로 읽히는 첫 번째 td.col-6 값. 없으면 None."""
+    found = False
+    for m in _PCI_TD_RE.finditer(page):
+        found = True
+        value = _pci_value(_text(m.group(1)))
+        if value is not None:
+            return value
+    if found:
+        return None
+    for td in BeautifulSoup(page, _SOUP_PARSER).find_all("td", class_="col-6"):
+        value = _pci_value(td.text.strip())
+        if value is not None:
+            return value
+    return None
+
+
+def fetch_fgi():
+    try:
+        r = http_client.get(FGI_URL)
+        r.raise_for_status()
+        return parse_fgi(r.text)
+    except Exception:
+        return None
+
+
+def fetch_pci():
+    try:
+        r = http_client.get(PCI_URL)
+        r.raise_for_status()
+        return parse_pci(r.text)
+    except Exception:
+        return None
+
+
+def parse_buffett(page: str):
+    """longtermtrends 페이지에서 '%'가 붙은 첫 번째 span.indicator-value 값. 없으면 None."""
+    texts = [_text(m.group(1)) for m in _BUFFETT_RE.finditer(page)]
+    if not texts:
+        texts = [el.text.strip() for el in BeautifulSoup(page, _SOUP_PARSER).find_all("span", class_="indicator-value")]
+    for text in texts:
+        if "%" in text:
+            try:
+                return float(text.replace("%", "").strip())
+            except ValueError:
+                continue
+    return None
+
+
+def fetch_buffett():
+    """실제 버핏 지수(%). 실패 시 None."""
+    try:
+        r = http_client.get(BUFFETT_URL, timeout=15)
+        r.raise_for_status()
+        return parse_buffett(r.text)
+    except Exception:
+        return None
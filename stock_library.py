@@ -1,2724 +1,241 @@
 # korean_stocks.py
+"""한국 주식 종목코드/종목명/섹터 조회.
 
+종목 목록은 data/korean_stocks.tsv(종목코드<TAB>종목명 줄들, 빈 줄, 섹터<TAB>공백으로 구분한 코드 줄들)에
+있고 첫 조회 때 읽는다. 부분 검색용 n-gram 인덱스는 첫 검색 때 만든다.
+파일이 바뀌면 RELOAD_CHECK_SEC 안에 자동으로, refresh()를 부르면 즉시 새 목록으로 교체된다.
+"""
+import os
+import re
+import threading
+import time
+from array import array
+from functools import lru_cache
 
+DATA_PATH = os.getenv(
+    "KOREAN_STOCKS_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "korean_stocks.tsv"),
+)
+# 이 간격(초)마다 종목 파일 수정 시각을 확인해 바뀌었으면 다시 읽음 (0이면 자동 확인 안 함)
+RELOAD_CHECK_SEC = float(os.getenv("KOREAN_STOCKS_RELOAD_SEC", 60))
 
-KOREAN_STOCKS = {
-    "000020": "동화약품",
-    "000040": "KR모터스",
-    "000050": "경방",
-    "000070": "삼양홀딩스",
-    "000075": "삼양홀딩스우",
-    "000080": "하이트진로",
-    "000087": "하이트진로2우B",
-    "000100": "유한양행",
-    "000105": "유한양행우",
-    "000120": "CJ대한통운",
-    "000140": "하이트진로홀딩스",
-    "000145": "하이트진로홀딩스우",
-    "000150": "두산",
-    "000155": "두산우",
-    "000157": "두산2우B",
-    "000180": "성창기업지주",
-    "000210": "DL",
-    "000215": "DL우",
-    "000220": "유유제약",
-    "000225": "유유제약1우",
-    "000227": "유유제약2우B",
-    "000230": "일동홀딩스",
-    "000240": "한국앤컴퍼니",
-    "000250": "삼천당제약",
-    "000270": "기아",
-    "000300": "DH오토넥스",
-    "000320": "노루홀딩스",
-    "000325": "노루홀딩스우",
-    "000370": "한화손해보험",
-    "000390": "삼화페인트",
-    "000400": "롯데손해보험",
-    "000430": "대원강업",
-    "000440": "중앙에너비스",
-    "000480": "CR홀딩스",
-    "000490": "대동",
-    "000500": "가온전선",
-    "000520": "삼일제약",
-    "000540": "흥국화재",
-    "000545": "흥국화재우",
-    "000590": "CS홀딩스",
-    "000640": "동아쏘시오홀딩스",
-    "000650": "천일고속",
-    "000660": "SK하이닉스",
-    "000670": "영풍",
-    "000680": "LS네트웍스",
-    "000700": "유수홀딩스",
-    "000720": "현대건설",
-    "000725": "현대건설우",
-    "000760": "이화산업",
-    "000810": "삼성화재",
-    "000815": "삼성화재우",
-    "000850": "화천기공",
-    "000860": "강남제비스코",
-    "000880": "한화",
-    "000890": "보해양조",
-    "000910": "유니온",
-    "000950": "전방",
-    "000970": "한국주철관",
-    "000990": "DB하이텍",
-    "001000": "신라섬유",
-    "001020": "페이퍼코리아",
-    "001040": "CJ",
-    "001045": "CJ우",
-    "001060": "JW중외제약",
-    "001065": "JW중외제약우",
-    "001067": "JW중외제약2우B",
-    "001070": "대한방직",
-    "001080": "만호제강",
-    "001120": "LX인터내셔널",
-    "001130": "대한제분",
-    "001140": "국보",
-    "001200": "유진투자증권",
-    "001210": "금호전기",
-    "001230": "동국홀딩스",
-    "001250": "GS글로벌",
-    "001260": "남광토건",
-    "001270": "부국증권",
-    "001275": "부국증권우",
-    "001290": "상상인증권",
-    "001340": "PKC",
-    "001360": "삼성제약",
-    "001380": "SG글로벌",
-    "001390": "KG케미칼",
-    "001420": "태원물산",
-    "001430": "세아베스틸지주",
-    "001440": "대한전선",
-    "001450": "현대해상",
-    "001460": "BYC",
-    "001465": "BYC우",
-    "001470": "삼부토건",
-    "001500": "현대차증권",
-    "001510": "SK증권",
-    "001515": "SK증권우",
-    "001520": "동양",
-    "001525": "동양우",
-    "001527": "동양2우B",
-    "001530": "DI동일",
-    "001540": "안국약품",
-    "001550": "조비",
-    "001560": "제일연마",
-    "001570": "금양",
-    "001620": "케이비아이동국실업",
-    "001630": "종근당홀딩스",
-    "001680": "대상",
-    "001685": "대상우",
-    "001720": "신영증권",
-    "001740": "SK네트웍스",
-    "001750": "한양증권",
-    "001755": "한양증권우",
-    "001770": "SHD",
-    "001780": "알루코",
-    "001790": "대한제당",
-    "001795": "대한제당우",
-    "001800": "오리온홀딩스",
-    "001810": "무림SP",
-    "001820": "삼화콘덴서",
-    "001840": "이화공영",
-    "001940": "KISCO홀딩스",
-    "002020": "코오롱",
-    "002025": "코오롱우",
-    "002030": "아세아",
-    "002070": "비비안",
-    "002100": "경농",
-    "002140": "고려산업",
-    "002150": "도화엔지니어링",
-    "002170": "삼양통상",
-    "002200": "한국수출포장",
-    "002210": "동성제약",
-    "002220": "한일철강",
-    "002230": "피에스텍",
-    "002240": "고려제강",
-    "002290": "삼일기업공사",
-    "002310": "아세아제지",
-    "002320": "한진",
-    "002350": "넥센타이어",
-    "002355": "넥센타이어1우B",
-    "002360": "SH에너지화학",
-    "002380": "KCC",
-    "002390": "한독",
-    "002410": "범양건영",
-    "002420": "세기상사",
-    "002450": "삼익악기",
-    "002460": "HS화성",
-    "002600": "조흥",
-    "002620": "제일파마홀딩스",
-    "002630": "오리엔트바이오",
-    "002680": "한탑",
-    "002690": "동일제강",
-    "002700": "신일전자",
-    "002710": "TCC스틸",
-    "002720": "국제약품",
-    "002760": "보락",
-    "002780": "진흥기업",
-    "002785": "진흥기업우B",
-    "002787": "진흥기업2우B",
-    "002790": "아모레퍼시픽홀딩스",
-    "002795": "아모레퍼시픽홀딩스우",
-    "002800": "신신제약",
-    "002810": "삼영무역",
-    "002820": "SUN&L",
-    "002840": "미원상사",
-    "002870": "신풍",
-    "002880": "대유에이텍",
-    "002900": "TYM",
-    "002920": "유성기업",
-    "002960": "한국쉘석유",
-    "002990": "금호건설",
-    "002995": "금호건설우",
-    "003000": "부광약품",
-    "003010": "혜인",
-    "003030": "세아제강지주",
-    "003060": "에이프로젠바이오로직스",
-    "003070": "코오롱글로벌",
-    "003075": "코오롱글로벌우",
-    "003080": "SB성보",
-    "003090": "대웅",
-    "003100": "선광",
-    "003120": "일성아이에스",
-    "003160": "디아이",
-    "003200": "일신방직",
-    "003220": "대원제약",
-    "003230": "삼양식품",
-    "003240": "태광산업",
-    "003280": "흥아해운",
-    "003300": "한일홀딩스",
-    "003310": "대주산업",
-    "003350": "한국화장품제조",
-    "003380": "하림지주",
-    "003460": "유화증권",
-    "003465": "유화증권우",
-    "003470": "유안타증권",
-    "003475": "유안타증권우",
-    "003480": "한진중공업홀딩스",
-    "003490": "대한항공",
-    "003495": "대한항공우",
-    "003520": "영진약품",
-    "003530": "한화투자증권",
-    "003535": "한화투자증권우",
-    "003540": "대신증권",
-    "003545": "대신증권우",
-    "003547": "대신증권2우B",
-    "003550": "LG",
-    "003555": "LG우",
-    "003560": "IHQ",
-    "003570": "SNT다이내믹스",
-    "003580": "HLB글로벌",
-    "003610": "방림",
-    "003620": "KG모빌리티",
-    "003650": "미창석유",
-    "003670": "포스코퓨처엠",
-    "003680": "한성기업",
-    "003690": "코리안리",
-    "003720": "삼영",
-    "003780": "진양산업",
-    "003800": "에이스침대",
-    "003830": "대한화섬",
-    "003850": "보령",
-    "003920": "남양유업",
-    "003925": "남양유업우",
-    "003960": "사조대림",
-    "004000": "롯데정밀화학",
-    "004020": "현대제철",
-    "004060": "SG세계물산",
-    "004080": "신흥",
-    "004090": "한국석유",
-    "004100": "태양금속",
-    "004105": "태양금속우",
-    "004140": "동방",
-    "004150": "한솔홀딩스",
-    "004170": "신세계",
-    "004250": "NPC",
-    "004255": "NPC우",
-    "004270": "남성",
-    "004310": "현대약품",
-    "004360": "세방",
-    "004365": "세방우",
-    "004370": "농심",
-    "004380": "삼익THK",
-    "004410": "서울식품",
-    "004415": "서울식품우",
-    "004430": "송원산업",
-    "004440": "삼일씨엔에스",
-    "004450": "삼화왕관",
-    "004490": "세방전지",
-    "004540": "깨끗한나라",
-    "004545": "깨끗한나라우",
-    "004560": "현대비앤지스틸",
-    "004590": "한국가구",
-    "004650": "창해에탄올",
-    "004690": "삼천리",
-    "004700": "조광피혁",
-    "004710": "한솔테크닉스",
-    "004720": "팜젠사이언스",
-    "004770": "써니전자",
-    "004780": "대륙제관",
-    "004800": "효성",
-    "004830": "덕성",
-    "004835": "덕성우",
-    "004840": "DRB동일",
-    "004870": "티웨이홀딩스",
-    "004890": "동일산업",
-    "004910": "조광페인트",
-    "004920": "씨아이테크",
-    "004960": "한신공영",
-    "004970": "신라교역",
-    "004980": "성신양회",
-    "004985": "성신양회우",
-    "004990": "롯데지주",
-    "005010": "휴스틸",
-    "005030": "부산주공",
-    "005070": "코스모신소재",
-    "005090": "SGC에너지",
-    "005110": "한창",
-    "005160": "동국산업",
-    "005180": "빙그레",
-    "005250": "녹십자홀딩스",
-    "005257": "녹십자홀딩스2우",
-    "005290": "동진쎄미켐",
-    "005300": "롯데칠성",
-    "005305": "롯데칠성우",
-    "005320": "온타이드",
-    "005360": "모나미",
-    "005380": "현대차",
-    "005385": "현대차우",
-    "005387": "현대차2우B",
-    "005389": "현대차3우B",
-    "005390": "신성통상",
-    "005420": "코스모화학",
-    "005430": "한국공항",
-    "005440": "현대지에프홀딩스",
-    "005490": "POSCO홀딩스",
-    "005500": "삼진제약",
-    "005610": "SPC삼립",
-    "005670": "푸드웰",
-    "005680": "삼영전자",
-    "005690": "파미셀",
-    "005710": "대원산업",
-    "005720": "넥센",
-    "005725": "넥센우",
-    "005740": "크라운해태홀딩스",
-    "005745": "크라운해태홀딩스우",
-    "005750": "대림바스",
-    "005800": "신영와코루",
-    "005810": "풍산홀딩스",
-    "005820": "원림",
-    "005830": "DB손해보험",
-    "005850": "에스엘",
-    "005860": "한일사료",
-    "005870": "휴니드",
-    "005880": "대한해운",
-    "005930": "삼성전자",
-    "005935": "삼성전자우",
-    "005940": "NH투자증권",
-    "005945": "NH투자증권우",
-    "005950": "이수화학",
-    "005960": "동부건설",
-    "005965": "동부건설우",
-    "005990": "매일홀딩스",
-    "006040": "동원산업",
-    "006050": "국영지앤엠",
-    "006060": "화승인더",
-    "006090": "사조오양",
-    "006110": "삼아알미늄",
-    "006120": "SK디스커버리",
-    "006125": "SK디스커버리우",
-    "006140": "피제이전자",
-    "006200": "한국전자홀딩스",
-    "006220": "제주은행",
-    "006260": "LS",
-    "006280": "녹십자",
-    "006340": "대원전선",
-    "006345": "대원전선우",
-    "006360": "GS건설",
-    "006370": "대구백화점",
-    "006380": "카프로",
-    "006390": "한일현대시멘트",
-    "006400": "삼성SDI",
-    "006405": "삼성SDI우",
-    "006490": "인스코비",
-    "006570": "대림통상",
-    "006620": "동구바이오제약",
-    "006650": "대한유화",
-    "006660": "삼성공조",
-    "006730": "서부T&D",
-    "006740": "영풍제지",
-    "006800": "미래에셋증권",
-    "006805": "미래에셋증권우",
-    "006840": "AK홀딩스",
-    "006880": "신송홀딩스",
-    "006890": "태경케미컬",
-    "006910": "보성파워텍",
-    "006920": "모헨즈",
-    "006980": "우성",
-    "007070": "GS리테일",
-    "007110": "일신석재",
-    "007120": "미래아이앤지",
-    "007160": "사조산업",
-    "007210": "벽산",
-    "007280": "한국특강",
-    "007310": "오뚜기",
-    "007330": "푸른저축은행",
-    "007340": "DN오토모티브",
-    "007370": "진양제약",
-    "007390": "네이처셀",
-    "007460": "에이프로젠",
-    "007530": "와이엠",
-    "007540": "샘표",
-    "007570": "일양약품",
-    "007575": "일양약품우",
-    "007590": "동방아그로",
-    "007610": "선도전기",
-    "007660": "이수페타시스",
-    "007680": "대원",
-    "007690": "국도화학",
-    "007700": "F&F홀딩스",
-    "007720": "소노스퀘어",
-    "007770": "한일화학",
-    "007810": "코리아써키트",
-    "007815": "코리아써우",
-    "007820": "에스엠코어",
-    "007860": "서연",
-    "007980": "TP",
-    "008040": "사조동아원",
-    "008060": "대덕",
-    "008110": "대동전자",
-    "008250": "이건산업",
-    "008260": "NI스틸",
-    "008290": "원풍물산",
-    "008350": "남선알미늄",
-    "008355": "남선알미우",
-    "008370": "원풍",
-    "008420": "문배철강",
-    "008470": "부스타",
-    "008490": "서흥",
-    "008500": "일정실업",
-    "008600": "윌비스",
-    "008700": "아남전자",
-    "008730": "율촌화학",
-    "008770": "호텔신라",
-    "008775": "호텔신라우",
-    "008830": "대동기어",
-    "008870": "금비",
-    "008930": "한미사이언스",
-    "008970": "동양철관",
-    "009070": "KCTC",
-    "009140": "경인전자",
-    "009150": "삼성전기",
-    "009155": "삼성전기우",
-    "009160": "SIMPAC",
-    "009180": "한솔로지스틱스",
-    "009190": "대양금속",
-    "009200": "무림페이퍼",
-    "009240": "한샘",
-    "009270": "신원",
-    "009290": "광동제약",
-    "009300": "삼아제약",
-    "009310": "참엔지니어링",
-    "009320": "아진전자부품",
-    "009410": "태영건설",
-    "009415": "태영건설우",
-    "009420": "한올바이오파마",
-    "009440": "KC그린홀딩스",
-    "009450": "경동나비엔",
-    "009460": "한창제지",
-    "009470": "삼화전기",
-    "009520": "포스코엠텍",
-    "009540": "HD한국조선해양",
-    "009580": "무림P&P",
-    "009620": "삼보산업",
-    "009680": "모토닉",
-    "009730": "이렘",
-    "009770": "삼정펄프",
-    "009780": "엠에스씨",
-    "009810": "플레이그램",
-    "009830": "한화솔루션",
-    "009835": "한화솔루션우",
-    "009900": "명신산업",
-    "009970": "영원무역홀딩스",
-    "010040": "한국내화",
-    "010060": "OCI홀딩스",
-    "010100": "한국무브넥스",
-    "010120": "LS ELECTRIC",
-    "010130": "고려아연",
-    "010140": "삼성중공업",
-    "010170": "대한광통신",
-    "010240": "흥국",
-    "010280": "아이티센엔텍",
-    "010400": "우진아이엔에스",
-    "010420": "한솔PNS",
-    "010470": "오리콤",
-    "010580": "에스엠벡셀",
-    "010600": "웰바이오텍",
-    "010620": "HD현대미포",
-    "010640": "진양폴리",
-    "010660": "화천기계",
-    "010690": "화신",
-    "010770": "평화홀딩스",
-    "010780": "아이에스동서",
-    "010820": "퍼스텍",
-    "010950": "S-Oil",
-    "010955": "S-Oil우",
-    "010960": "삼호개발",
-    "011000": "진원생명과학",
-    "011040": "경동제약",
-    "011070": "LG이노텍",
-    "011080": "형지I&C",
-    "011090": "에넥스",
-    "011150": "CJ씨푸드",
-    "011155": "CJ씨푸드1우",
-    "011170": "롯데케미칼",
-    "011200": "HMM",
-    "011210": "현대위아",
-    "011230": "삼화전자",
-    "011280": "태림포장",
-    "011300": "성안머티리얼스",
-    "011320": "유니크",
-    "011330": "유니켐",
-    "011370": "서한",
-    "011390": "부산산업",
-    "011420": "갤럭시아에스엠",
-    "011500": "한농화성",
-    "011560": "세보엠이씨",
-    "011690": "와이투솔루션",
-    "011700": "한신기계",
-    "011760": "현대코퍼레이션",
-    "011780": "금호석유화학",
-    "011785": "금호석유화학우",
-    "011790": "SKC",
-    "011810": "STX",
-    "011930": "신성이엔지",
-    "012030": "DB",
-    "012160": "영흥",
-    "012170": "아센디오",
-    "012200": "계양전기",
-    "012205": "계양전기우",
-    "012280": "영화금속",
-    "012320": "경동인베스트",
-    "012330": "현대모비스",
-    "012340": "뉴인텍",
-    "012450": "한화에어로스페이스",
-    "012510": "더존비즈온",
-    "012610": "경인양행",
-    "012620": "원일특강",
-    "012630": "HDC",
-    "012690": "모나리자",
-    "012700": "리드코프",
-    "012750": "에스원",
-    "012790": "신일제약",
-    "012800": "대창",
-    "012860": "모베이스전자",
-    "013000": "세우글로벌",
-    "013030": "하이록코리아",
-    "013120": "동원개발",
-    "013310": "아진산업",
-    "013360": "일성건설",
-    "013520": "화승코퍼레이션",
-    "013570": "디와이",
-    "013580": "계룡건설",
-    "013700": "까뮤이앤씨",
-    "013720": "THE CUBE&",
-    "013810": "스페코",
-    "013870": "지엠비코리아",
-    "013890": "지누스",
-    "013990": "아가방컴퍼니",
-    "014100": "메디앙스",
-    "014130": "한익스프레스",
-    "014160": "대영포장",
-    "014190": "원익큐브",
-    "014200": "광림",
-    "014280": "금강공업",
-    "014285": "금강공업우",
-    "014440": "영보화학",
-    "014470": "부방",
-    "014530": "극동유화",
-    "014570": "고려제약",
-    "014580": "태경비케이",
-    "014620": "성광벤드",
-    "014680": "한솔케미칼",
-    "014710": "사조씨푸드",
-    "014790": "HL D&I",
-    "014820": "동원시스템즈",
-    "014825": "동원시스템즈우",
-    "014830": "유니드",
-    "014910": "성문전자",
-    "014915": "성문전자우",
-    "014940": "오리엔탈정공",
-    "014970": "삼륭물산",
-    "014990": "인디에프",
-    "015020": "이스타코",
-    "015230": "대창단조",
-    "015260": "에이엔피",
-    "015360": "INVENI",
-    "015590": "DKME",
-    "015710": "코콤",
-    "015750": "성우하이텍",
-    "015760": "한국전력",
-    "015860": "일진홀딩스",
-    "015890": "태경산업",
-    "016090": "대현",
-    "016100": "리더스코스메틱",
-    "016250": "SGC E&C",
-    "016360": "삼성증권",
-    "016380": "KG스틸",
-    "016450": "한세예스24홀딩스",
-    "016580": "환인제약",
-    "016590": "신대양제지",
-    "016600": "큐캐피탈",
-    "016610": "DB증권",
-    "016670": "디모아",
-    "016710": "대성홀딩스",
-    "016740": "두올",
-    "016790": "현대사료",
-    "016800": "퍼시스",
-    "016880": "웅진",
-    "016920": "카스",
-    "017000": "신원종합개발",
-    "017040": "광명전기",
-    "017180": "명문제약",
-    "017250": "인터엠",
-    "017370": "우신시스템",
-    "017390": "서울가스",
-    "017480": "삼현철강",
-    "017510": "세명전기",
-    "017550": "수산세보틱스",
-    "017650": "대림제지",
-    "017670": "SK텔레콤",
-    "017800": "현대엘리베이터",
-    "017810": "풀무원",
-    "017860": "DS단석",
-    "017890": "한국알콜",
-    "017900": "광전자",
-    "017940": "E1",
-    "017960": "한국카본",
-    "018000": "유니슨",
-    "018120": "진로발효",
-    "018250": "애경산업",
-    "018260": "삼성에스디에스",
-    "018290": "브이티",
-    "018310": "삼목에스폼",
-    "018470": "조일알미늄",
-    "018500": "동원금속",
-    "018620": "우진비앤지",
-    "018670": "SK가스",
-    "018680": "서울제약",
-    "018700": "바른손",
-    "018880": "한온시스템",
-    "019010": "베뉴지",
-    "019170": "신풍제약",
-    "019175": "신풍제약우",
-    "019180": "티에이치엔",
-    "019210": "와이지-원",
-    "019440": "세아특수강",
-    "019490": "엑시큐어하이트론",
-    "019540": "일지테크",
-    "019550": "SBI인베스트먼트",
-    "019570": "플루토스",
-    "019590": "에스유앤피",
-    "019660": "글로본",
-    "019680": "대교",
-    "019685": "대교우B",
-    "019770": "서연탑메탈",
-    "019990": "에너토크",
-    "020000": "한섬",
-    "020120": "키다리스튜디오",
-    "020150": "롯데에너지머티리얼즈",
-    "020180": "대신정보통신",
-    "020400": "대동금속",
-    "020560": "아시아나항공",
-    "020710": "시공테크",
-    "020760": "일진디스플",
-    "021040": "대호특수강",
-    "021045": "대호특수강우",
-    "021050": "서원",
-    "021080": "에이티넘인베스트",
-    "021240": "코웨이",
-    "021320": "KCC건설",
-    "021650": "한국큐빅",
-    "021820": "세원정공",
-    "021880": "메이슨캐피탈",
-    "022100": "포스코DX",
-    "022220": "티케이지애강",
-    "023000": "삼원강재",
-    "023150": "MH에탄올",
-    "023160": "태광",
-    "023350": "한국종합기술",
-    "023410": "유진기업",
-    "023440": "제이스코홀딩스",
-    "023450": "동남합성",
-    "023530": "롯데쇼핑",
-    "023590": "다우기술",
-    "023600": "삼보판지",
-    "023760": "한국캐피탈",
-    "023770": "플레이위드",
-    "023790": "동일스틸럭스",
-    "023800": "인지컨트롤스",
-    "023810": "인팩",
-    "023900": "풍국주정",
-    "023910": "대한약품",
-    "023960": "에쓰씨엔지니어링",
-    "024060": "흥구석유",
-    "024070": "WISCOM",
-    "024090": "디씨엠",
-    "024110": "기업은행",
-    "024120": "KB오토시스",
-    "024720": "콜마홀딩스",
-    "024740": "한일단조",
-    "024800": "유성티엔에스",
-    "024810": "이화전기",
-    "024830": "세원물산",
-    "024840": "KBI메탈",
-    "024850": "HLB이노베이션",
-    "024880": "케이피에프",
-    "024890": "대원화성",
-    "024900": "디와이덕양",
-    "024910": "경창산업",
-    "024940": "PN풍년",
-    "024950": "삼천리자전거",
-    "025000": "KPX케미칼",
-    "025320": "시노펙스",
-    "025440": "DH오토웨어",
-    "025530": "SJM홀딩스",
-    "025540": "한국단자",
-    "025550": "한국선재",
-    "025560": "미래산업",
-    "025620": "제이준코스메틱",
-    "025750": "한솔홈데코",
-    "025770": "한국정보통신",
-    "025820": "이구산업",
-    "025860": "남해화학",
-    "025870": "신라에스지",
-    "025880": "케이씨피드",
-    "025890": "한국주강",
-    "025900": "동화기업",
-    "025950": "동신건설",
-    "025980": "아난티",
-    "026040": "제이에스티나",
-    "026150": "특수건설",
-    "026890": "스틱인베스트먼트",
-    "026910": "광진실업",
-    "026940": "부국철강",
-    "026960": "동서",
-    "027040": "서울전자통신",
-    "027050": "코리아나",
-    "027360": "아주IB투자",
-    "027410": "BGF",
-    "027580": "상보",
-    "027710": "팜스토리",
-    "027740": "마니커",
-    "027830": "대성창투",
-    "027970": "한국제지",
-    "028050": "삼성E&A",
-    "028080": "휴맥스홀딩스",
-    "028100": "동아지질",
-    "028260": "삼성물산",
-    "028300": "HLB",
-    "028670": "팬오션",
-    "029460": "케이씨",
-    "029480": "광무",
-    "029530": "신도리코",
-    "029780": "삼성카드",
-    "030000": "제일기획",
-    "030190": "NICE평가정보",
-    "030200": "KT",
-    "030210": "다올투자증권",
-    "030350": "드래곤플라이",
-    "030520": "한글과컴퓨터",
-    "030530": "원익홀딩스",
-    "030610": "교보증권",
-    "030720": "동원수산",
-    "030960": "양지사",
-    "031210": "서울보증보험",
-    "031310": "아이즈비전",
-    "031330": "에스에이엠티",
-    "031430": "신세계인터내셔날",
-    "031440": "신세계푸드",
-    "031510": "오스템",
-    "031820": "아이티센씨티에스",
-    "031860": "디에이치엑스컴퍼니",
-    "031980": "피에스케이홀딩스",
-    "032080": "아즈텍WB",
-    "032190": "다우데이타",
-    "032280": "삼일",
-    "032300": "한국파마",
-    "032350": "롯데관광개발",
-    "032500": "케이엠더블유",
-    "032540": "TJ미디어",
-    "032560": "황금에스티",
-    "032580": "피델릭스",
-    "032620": "유비케어",
-    "032640": "LG유플러스",
-    "032680": "소프트센",
-    "032685": "소프트센우",
-    "032750": "삼진",
-    "032790": "엠젠솔루션",
-    "032800": "판타지오",
-    "032820": "우리기술",
-    "032830": "삼성생명",
-    "032850": "비트컴퓨터",
-    "032860": "더라미",
-    "032940": "원익",
-    "032960": "동일기연",
-    "032980": "바이온",
-    "033050": "제이엠아이",
-    "033100": "제룡전기",
-    "033130": "디지틀조선",
-    "033160": "엠케이전자",
-    "033170": "시그네틱스",
-    "033180": "KH 필룩스",
-    "033200": "모아텍",
-    "033230": "인성정보",
-    "033240": "자화전자",
-    "033250": "체시스",
-    "033270": "유나이티드제약",
-    "033290": "코웰패션",
-    "033310": "엠투엔",
-    "033320": "제이씨현시스템",
-    "033340": "좋은사람들",
-    "033500": "동성화인텍",
-    "033530": "SJG세종",
-    "033540": "파라텍",
-    "033560": "블루콤",
-    "033640": "네패스",
-    "033780": "KT&G",
-    "033790": "피노",
-    "033830": "티비씨",
-    "033920": "무학",
-    "034020": "두산에너빌리티",
-    "034120": "SBS",
-    "034220": "LG디스플레이",
-    "034230": "파라다이스",
-    "034310": "NICE",
-    "034590": "인천도시가스",
-    "034730": "SK",
-    "034810": "해성산업",
-    "034830": "한국토지신탁",
-    "034940": "조아제약",
-    "034950": "한국기업평가",
-    "035000": "HS애드",
-    "035080": "그래디언트",
-    "035150": "백산",
-    "035200": "프럼파스트",
-    "035250": "강원랜드",
-    "035290": "골드앤에스",
-    "035420": "NAVER",
-    "035460": "기산텔레콤",
-    "035510": "신세계 I&C",
-    "035600": "KG이니시스",
-    "035610": "솔본",
-    "035620": "바른손이앤에이",
-    "035720": "카카오",
-    "035760": "CJ ENM",
-    "035810": "이지홀딩스",
-    "035890": "서희건설",
-    "035900": "JYP Ent.",
-    "036000": "예림당",
-    "036010": "아비코전자",
-    "036030": "케이티알파",
-    "036090": "위지트",
-    "036120": "서울평가정보",
-    "036170": "에이치엠넥스",
-    "036180": "지더블유바이텍",
-    "036190": "금화피에스시",
-    "036200": "유니셈",
-    "036220": "오상헬스케어",
-    "036420": "콘텐트리중앙",
-    "036460": "한국가스공사",
-    "036480": "대성미생물",
-    "036530": "SNT홀딩스",
-    "036540": "SFA반도체",
-    "036560": "KZ정밀",
-    "036570": "엔씨소프트",
-    "036580": "팜스코",
-    "036620": "감성코퍼레이션",
-    "036630": "세종텔레콤",
-    "036640": "HRS",
-    "036670": "삼양케이씨아이",
-    "036690": "코맥스",
-    "036710": "심텍홀딩스",
-    "036800": "나이스정보통신",
-    "036810": "에프에스티",
-    "036830": "솔브레인홀딩스",
-    "036890": "진성티이씨",
-    "036930": "주성엔지니어링",
-    "037030": "파워넷",
-    "037070": "파세코",
-    "037230": "한국팩키지",
-    "037270": "YG PLUS",
-    "037330": "인지디스플레",
-    "037350": "성도이엔지",
-    "037370": "EG",
-    "037400": "우리엔터프라이즈",
-    "037440": "희림",
-    "037460": "삼지전자",
-    "037560": "LG헬로비전",
-    "037710": "광주신세계",
-    "037760": "쎄니트",
-    "037950": "엘컴텍",
-    "038010": "제일테크노스",
-    "038060": "루멘스",
-    "038070": "서린바이오",
-    "038110": "에코플라스틱",
-    "038290": "마크로젠",
-    "038390": "레드캡투어",
-    "038460": "바이오스마트",
-    "038500": "삼표시멘트",
-    "038530": "케이바이오",
-    "038540": "상상인",
-    "038620": "위즈코프",
-    "038680": "에스넷",
-    "038870": "에코바이오",
-    "038880": "아이에이",
-    "038950": "파인디지털",
-    "039010": "현대에이치티",
-    "039020": "이건홀딩스",
-    "039030": "이오테크닉스",
-    "039130": "하나투어",
-    "039200": "오스코텍",
-    "039240": "경남스틸",
-    "039290": "인포뱅크",
-    "039310": "세중",
-    "039340": "한국경제TV",
-    "039420": "케이엘넷",
-    "039440": "에스티아이",
-    "039490": "키움증권",
-    "039560": "다산네트웍스",
-    "039570": "HDC랩스",
-    "039610": "화성밸브",
-    "039740": "한국정보공학",
-    "039830": "오로라",
-    "039840": "디오",
-    "039860": "나노엔텍",
-    "039980": "폴라리스AI",
-    "040160": "누리플렉스",
-    "040300": "YTN",
-    "040350": "크레오에스지",
-    "040420": "정상제이엘에스",
-    "040610": "SG&G",
-    "040910": "아이씨디",
-    "041020": "폴라리스오피스",
-    "041190": "우리기술투자",
-    "041440": "현대에버다임",
-    "041460": "한국전자인증",
-    "041510": "에스엠",
-    "041520": "이엘씨",
-    "041590": "플래스크",
-    "041650": "상신브레이크",
-    "041830": "인바디",
-    "041910": "폴라리스AI파마",
-    "041920": "메디아나",
-    "041930": "동아화성",
-    "041960": "코미팜",
-    "042000": "카페24",
-    "042040": "케이피엠테크",
-    "042110": "에스씨디",
-    "042370": "비츠로테크",
-    "042420": "네오위즈홀딩스",
-    "042500": "링네트",
-    "042510": "라온시큐어",
-    "042520": "한스바이오메드",
-    "042600": "새로닉스",
-    "042660": "한화오션",
-    "042670": "HD현대인프라코어",
-    "042700": "한미반도체",
-    "042940": "상지건설",
-    "043090": "더테크놀로지",
-    "043100": "알파녹스",
-    "043150": "바텍",
-    "043200": "파루",
-    "043220": "티에스넥스젠",
-    "043260": "성호전자",
-    "043340": "에쎈테크",
-    "043360": "디지아이",
-    "043370": "피에이치에이",
-    "043590": "웰킵스하이텍",
-    "043610": "KT지니뮤직",
-    "043650": "국순당",
-    "043710": "서울리거",
-    "043910": "자연과환경",
-    "044060": "조광ILI",
-    "044180": "KD",
-    "044340": "위닉스",
-    "044380": "주연테크",
-    "044450": "KSS해운",
-    "044480": "빌리언스",
-    "044490": "태웅",
-    "044780": "에이치케이",
-    "044820": "코스맥스비티아이",
-    "044960": "이글벳",
-    "044990": "에이치엔에스하이텍",
-    "045060": "오공",
-    "045100": "한양이엔지",
-    "045300": "성우테크론",
-    "045340": "토탈소프트",
-    "045390": "대아티아이",
-    "045510": "정원엔시스",
-    "045520": "크린앤사이언스",
-    "045660": "에이텍",
-    "045970": "코아시아",
-    "046070": "코다코",
-    "046120": "오르비텍",
-    "046210": "HLB파나진",
-    "046310": "백금T&A",
-    "046390": "삼화네트웍스",
-    "046440": "KG모빌리언스",
-    "046890": "서울반도체",
-    "046940": "우원개발",
-    "046970": "우리로",
-    "047040": "대우건설",
-    "047050": "포스코인터내셔널",
-    "047080": "한빛소프트",
-    "047310": "파워로직스",
-    "047400": "유니온머티리얼",
-    "047560": "이스트소프트",
-    "047770": "코데즈컴바인",
-    "047810": "한국항공우주",
-    "047820": "초록뱀미디어",
-    "047920": "HLB제약",
-    "048410": "현대바이오",
-    "048430": "유라테크",
-    "048470": "대동스틸",
-    "048530": "인트론바이오",
-    "048550": "SM C&C",
-    "048770": "TPC",
-    "048830": "엔피케이",
-    "048870": "시너지이노베이션",
-    "048910": "대원미디어",
-    "049070": "인탑스",
-    "049080": "기가레인",
-    "049120": "파인디앤씨",
-    "049180": "셀루메드",
-    "049430": "코메론",
-    "049470": "SGA",
-    "049480": "오픈베이스",
-    "049520": "유아이엘",
-    "049550": "잉크테크",
-    "049630": "재영솔루텍",
-    "049720": "고려신용정보",
-    "049770": "동원F&B",
-    "049800": "우진플라임",
-    "049830": "승일",
-    "049950": "미래컴퍼니",
-    "049960": "쎌바이오텍",
-    "050090": "비케이홀딩스",
-    "050110": "캠시스",
-    "050120": "ES큐브",
-    "050760": "에스폴리텍",
-    "050860": "아세아텍",
-    "050890": "쏠리드",
-    "050960": "수산아이앤티",
-    "051160": "지어소프트",
-    "051360": "토비스",
-    "051370": "인터플렉스",
-    "051380": "피씨디렉트",
-    "051390": "YW",
-    "051490": "나라엠앤디",
-    "051500": "CJ프레시웨이",
-    "051600": "한전KPS",
-    "051630": "진양화학",
-    "051780": "큐로홀딩스",
-    "051900": "LG생활건강",
-    "051905": "LG생활건강우",
-    "051910": "LG화학",
-    "051915": "LG화학우",
-    "051980": "중앙첨단소재",
-    "052020": "에스티큐브",
-    "052220": "iMBC",
-    "052260": "현대바이오랜드",
-    "052300": "오션인더블유",
-    "052330": "코텍",
-    "052400": "코나아이",
-    "052420": "오성첨단소재",
-    "052460": "아이크래프트",
-    "052600": "한네트",
-    "052670": "제일바이오",
-    "052690": "한전기술",
-    "052710": "아모텍",
-    "052770": "아이톡시",
-    "052790": "액토즈소프트",
-    "052860": "아이앤씨",
-    "052900": "KX하이텍",
-    "053030": "바이넥스",
-    "053050": "지에스이",
-    "053060": "세동",
-    "053080": "케이엔솔",
-    "053160": "프리엠스",
-    "053210": "스카이라이프",
-    "053260": "금강철강",
-    "053270": "구영테크",
-    "053280": "예스24",
-    "053290": "NE능률",
-    "053300": "한국정보인증",
-    "053350": "이니텍",
-    "053450": "세코닉스",
-    "053580": "웹케시",
-    "053610": "프로텍",
-    "053620": "태양",
-    "053690": "한미글로벌",
-    "053700": "삼보모터스",
-    "053800": "안랩",
-    "053950": "경남제약",
-    "053980": "오상자이엘",
-    "054040": "한국컴퓨터",
-    "054050": "농우바이오",
-    "054090": "삼진엘앤디",
-    "054180": "메디콕스",
-    "054210": "이랜텍",
-    "054220": "비츠로시스",
-    "054300": "팬스타엔터프라이즈",
-    "054410": "케이피티유",
-    "054450": "텔레칩스",
-    "054540": "삼영엠텍",
-    "054620": "APS",
-    "054630": "에이디칩스",
-    "054670": "대한뉴팜",
-    "054780": "키이스트",
-    "054800": "아이디스홀딩스",
-    "054920": "한컴위드",
-    "054930": "유신",
-    "054940": "엑사이엔씨",
-    "054950": "제이브이엠",
-    "055490": "테이팩스",
-    "055550": "신한지주",
-    "056080": "유진로봇",
-    "056090": "시지메드텍",
-    "056190": "에스에프에이",
-    "056360": "코위버",
-    "056700": "신화인터텍",
-    "056730": "CNT85",
-    "057030": "YBM넷",
-    "057050": "현대홈쇼핑",
-    "057540": "옴니시스템",
-    "057680": "티사이언티픽",
-    "057880": "푸른소나무",
-    "058110": "멕아이씨에스",
-    "058400": "KNN",
-    "058430": "포스코스틸리온",
-    "058450": "한주에이알티",
-    "058470": "리노공업",
-    "058610": "에스피지",
-    "058630": "엠게임",
-    "058650": "세아홀딩스",
-    "058730": "다스코",
-    "058820": "CMG제약",
-    "058850": "KTcs",
-    "058860": "KTis",
-    "058970": "엠로",
-    "059090": "미코",
-    "059100": "아이컴포넌트",
-    "059120": "아진엑스텍",
-    "059210": "메타바이오메드",
-    "059270": "해성에어로보틱스",
-    "060150": "인선이엔티",
-    "060230": "소니드",
-    "060240": "스타코링크",
-    "060250": "NHN KCP",
-    "060260": "뉴보텍",
-    "060280": "큐렉소",
-    "060310": "3S",
-    "060370": "LS마린솔루션",
-    "060380": "동양에스텍",
-    "060480": "국일신동",
-    "060540": "에스에이티",
-    "060560": "HC홈센타",
-    "060570": "드림어스컴퍼니",
-    "060590": "씨티씨바이오",
-    "060720": "KH바텍",
-    "060850": "영림원소프트랩",
-    "060900": "DGP",
-    "060980": "HL홀딩스",
-    "061040": "알에프텍",
-    "061250": "화일약품",
-    "061970": "LB세미콘",
-    "062040": "산일전기",
-    "062970": "한국첨단소재",
-    "063080": "컴투스홀딩스",
-    "063160": "종근당바이오",
-    "063170": "서울옥션",
-    "063440": "SM Life Design",
-    "063570": "NICE인프라",
-    "063760": "이엘피",
-    "064090": "인크레더블버즈",
-    "064240": "홈캐스트",
-    "064260": "다날",
-    "064290": "인텍플러스",
-    "064350": "현대로템",
-    "064400": "LG씨엔에스",
-    "064480": "브리지텍",
-    "064520": "테크엘",
-    "064550": "바이오니아",
-    "064760": "티씨케이",
-    "064800": "포니링크",
-    "064820": "케이프",
-    "064850": "에프앤가이드",
-    "064960": "SNT모티브",
-    "065060": "지엔코",
-    "065130": "탑엔지니어링",
-    "065150": "대산F&B",
-    "065170": "비엘팜텍",
-    "065350": "신성델타테크",
-    "065370": "위세아이텍",
-    "065420": "에스아이리소스",
-    "065440": "이루온",
-    "065450": "빅텍",
-    "065500": "오리엔트정공",
-    "065510": "휴비츠",
-    "065530": "와이어블",
-    "065570": "삼영이엔씨",
-    "065650": "하이퍼코퍼레이션",
-    "065660": "안트로젠",
-    "065680": "우주일렉트로",
-    "065690": "파커스",
-    "065710": "서호전기",
-    "065770": "CS",
-    "065950": "웰크론",
-    "066130": "하츠",
-    "066310": "큐에스아이",
-    "066360": "체리부로",
-    "066410": "버킷스튜디오",
-    "066430": "아이로보틱스",
-    "066570": "LG전자",
-    "066575": "LG전자우",
-    "066590": "우수AMS",
-    "066620": "국보디자인",
-    "066670": "디티씨",
-    "066700": "테라젠이텍스",
-    "066790": "씨씨에스",
-    "066900": "디에이피",
-    "066910": "손오공",
-    "066970": "엘앤에프",
-    "066980": "한성크린텍",
-    "067000": "조이시티",
-    "067010": "이씨에스",
-    "067080": "대화제약",
-    "067160": "SOOP",
-    "067170": "오텍",
-    "067280": "멀티캠퍼스",
-    "067290": "JW신약",
-    "067310": "하나마이크론",
-    "067370": "선바이오",
-    "067390": "아스트",
-    "067570": "엔브이에이치코리아",
-    "067630": "HLB생명과학",
-    "067730": "로지시스",
-    "067770": "세진티에스",
-    "067830": "세이브존I&C",
-    "067900": "와이엔텍",
-    "067920": "이글루",
-    "067990": "도이치모터스",
-    "068050": "팬엔터테인먼트",
-    "068100": "케이웨더",
-    "068240": "다원시스",
-    "068270": "셀트리온",
-    "068290": "삼성출판사",
-    "068330": "일신바이오",
-    "068760": "셀트리온제약",
-    "068790": "DMS",
-    "068930": "디지털대성",
-    "068940": "셀피글로벌",
-    "069080": "웹젠",
-    "069140": "누리플랜",
-    "069260": "TKG휴켐스",
-    "069330": "유아이디",
-    "069410": "엔텔스",
-    "069460": "대호에이엘",
-    "069510": "에스텍",
-    "069540": "빛과전자",
-    "069620": "대웅제약",
-    "069640": "한세엠케이",
-    "069730": "DSR제강",
-    "069920": "엑시온그룹",
-    "069960": "현대백화점",
-    "070300": "엑스큐어",
-    "070590": "한솔인티큐브",
-    "070960": "모나용평",
-    "071050": "한국금융지주",
-    "071055": "한국금융지주우",
-    "071090": "하이스틸",
-    "071200": "인피니트헬스케어",
-    "071280": "로체시스템즈",
-    "071320": "지역난방공사",
-    "071670": "에이테크솔루션",
-    "071840": "롯데하이마트",
-    "071850": "캐스텍코리아",
-    "071950": "코아스",
-    "071970": "HD현대마린엔진",
-    "072020": "중앙백신",
-    "072130": "유엔젤",
-    "072470": "우리산업홀딩스",
-    "072710": "농심홀딩스",
-    "072770": "율호",
-    "072870": "메가스터디",
-    "072950": "빛샘전자",
-    "072990": "에이치시티",
-    "073010": "케이에스피",
-    "073110": "엘엠에스",
-    "073190": "듀오백",
-    "073240": "금호타이어",
-    "073490": "이노와이어리스",
-    "073540": "에프알텍",
-    "073560": "우리손에프앤지",
-    "073570": "리튬포어스",
-    "073640": "테라사이언스",
-    "074430": "아미노로직스",
-    "074600": "원익QnC",
-    "074610": "이엔플러스",
-    "075130": "플랜티넷",
-    "075180": "새론오토모티브",
-    "075580": "세진중공업",
-    "075970": "동국알앤에스",
-    "076080": "웰크론한텍",
-    "076610": "해성옵틱스",
-    "077360": "덕산하이메탈",
-    "077500": "유니퀘스트",
-    "077970": "STX엔진",
-    "078000": "텔코웨어",
-    "078020": "LS증권",
-    "078070": "유비쿼스홀딩스",
-    "078130": "국일제지",
-    "078140": "대봉엘에스",
-    "078150": "HB테크놀러지",
-    "078160": "메디포스트",
-    "078340": "컴투스",
-    "078350": "한양디지텍",
-    "078520": "에이블씨엔씨",
-    "078590": "휴림에이텍",
-    "078600": "대주전자재료",
-    "078860": "엔에스이엔엠",
-    "078890": "가온그룹",
-    "078930": "GS",
-    "078935": "GS우",
-    "079000": "와토스코리아",
-    "079160": "CJ CGV",
-    "079170": "한창산업",
-    "079190": "케스피온",
-    "079370": "제우스",
-    "079430": "현대리바트",
-    "079550": "LIG넥스원",
-    "079650": "서산",
-    "079810": "디이엔티",
-    "079900": "전진건설로봇",
-    "079940": "가비아",
-    "079950": "인베니아",
-    "079960": "동양이엔피",
-    "079970": "투비소프트",
-    "079980": "휴비스",
-    "080010": "이상네트웍스",
-    "080160": "모두투어",
-    "080220": "제주반도체",
-    "080420": "모다이노칩",
-    "080470": "성창오토텍",
-    "080520": "오디텍",
-    "080530": "코디",
-    "080580": "오킨스전자",
-    "080720": "한국유니온제약",
-    "081000": "일진다이아",
-    "081150": "티플랙스",
-    "081180": "쎄크",
-    "081580": "성우전자",
-    "081660": "미스토홀딩스",
-    "082210": "옵트론텍",
-    "082270": "젬백스",
-    "082640": "동양생명",
-    "082660": "코스나인",
-    "082740": "한화엔진",
-    "082800": "비보존 제약",
-    "082850": "우리바이오",
-    "082920": "비츠로셀",
-    "083310": "엘오티베큠",
-    "083420": "그린케미칼",
-    "083450": "GST",
-    "083470": "이엠앤아이",
-    "083500": "에프엔에스테크",
-    "083550": "케이엠",
-    "083640": "인콘",
-    "083650": "비에이치아이",
-    "083660": "CSA 코스믹",
-    "083790": "CG인바이츠",
-    "083930": "아바코",
-    "084010": "대한제강",
-    "084110": "휴온스글로벌",
-    "084180": "수성웹툰",
-    "084370": "유진테크",
-    "084440": "유비온",
-    "084650": "랩지노믹스",
-    "084670": "동양고속",
-    "084680": "이월드",
-    "084690": "대상홀딩스",
-    "084695": "대상홀딩스우",
-    "084730": "팅크웨어",
-    "084850": "아이티엠반도체",
-    "084870": "TBH글로벌",
-    "084990": "헬릭스미스",
-    "085310": "엔케이",
-    "085620": "미래에셋생명",
-    "085660": "차바이오텍",
-    "085670": "뉴프렉스",
-    "085810": "알티캐스트",
-    "085910": "네오티스",
-    "086040": "바이오톡스텍",
-    "086060": "진바이오텍",
-    "086280": "현대글로비스",
-    "086390": "유니테스트",
-    "086450": "동국제약",
-    "086520": "에코프로",
-    "086670": "비엠티",
-    "086710": "선진뷰티사이언스",
-    "086790": "하나금융지주",
-    "086820": "바이오솔루션",
-    "086890": "이수앱지스",
-    "086900": "메디톡스",
-    "086960": "MDS테크",
-    "086980": "쇼박스",
-    "087010": "펩트론",
-    "087260": "모바일어플라이언스",
-    "087600": "픽셀플러스",
-    "088130": "동아엘텍",
-    "088280": "쏘닉스",
-    "088290": "이원컴포텍",
-    "088340": "유라클",
-    "088350": "한화생명",
-    "088390": "이녹스",
-    "088790": "진도",
-    "088800": "에이스테크",
-    "088910": "동우팜투테이블",
-    "088980": "맥쿼리인프라",
-    "089010": "켐트로닉스",
-    "089030": "테크윙",
-    "089140": "넥스턴바이오",
-    "089150": "케이씨티",
-    "089230": "THE E&M",
-    "089470": "HDC현대EP",
-    "089590": "제주항공",
-    "089600": "KT나스미디어",
-    "089790": "제이티",
-    "089850": "유비벨록스",
-    "089860": "롯데렌탈",
-    "089890": "코세스",
-    "089970": "브이엠",
-    "089980": "상아프론테크",
-    "090080": "평화산업",
-    "090150": "아이윈",
-    "090350": "노루페인트",
-    "090355": "노루페인트우",
-    "090360": "로보스타",
-    "090370": "메타랩스",
-    "090410": "덕신이피씨",
-    "090430": "아모레퍼시픽",
-    "090435": "아모레퍼시픽우",
-    "090460": "비에이치",
-    "090470": "제이스텍",
-    "090710": "휴림로봇",
-    "090850": "현대이지웰",
-    "091090": "세원이앤씨",
-    "091120": "이엠텍",
-    "091340": "S&K폴리텍",
-    "091440": "한울소재과학",
-    "091580": "상신이디피",
-    "091590": "남화토건",
-    "091700": "파트론",
-    "091810": "티웨이항공",
-    "091970": "나노캠텍",
-    "092040": "아미코젠",
-    "092070": "디엔에프",
-    "092130": "이크레더블",
-    "092190": "서울바이오시스",
-    "092200": "디아이씨",
-    "092220": "KEC",
-    "092230": "KPX홀딩스",
-    "092300": "현우산업",
-    "092440": "기신정기",
-    "092460": "한라IMS",
-    "092600": "앤씨앤",
-    "092730": "네오팜",
-    "092780": "DYP",
-    "092790": "넥스틸",
-    "092870": "엑시콘",
-    "093050": "LF",
-    "093190": "빅솔론",
-    "093230": "이아이디",
-    "093240": "형지엘리트",
-    "093320": "케이아이엔엑스",
-    "093370": "후성",
-    "093380": "풍강",
-    "093520": "매커스",
-    "093640": "케이알엠",
-    "093920": "서원인텍",
-    "094170": "동운아나텍",
-    "094280": "효성ITX",
-    "094360": "칩스앤미디어",
-    "094480": "갤럭시아머니트리",
-    "094800": "맵스리얼티1",
-    "094820": "일진파워",
-    "094840": "슈프리마에이치큐",
-    "094850": "참좋은여행",
-    "094860": "네오리진",
-    "094940": "푸른기술",
-    "094970": "제이엠티",
-    "095190": "이엠코리아",
-    "095270": "웨이브일렉트로",
-    "095340": "ISC",
-    "095500": "미래나노텍",
-    "095570": "AJ네트웍스",
-    "095610": "테스",
-    "095660": "네오위즈",
-    "095700": "제넥신",
-    "095720": "웅진씽크빅",
-    "095910": "에스에너지",
-    "096040": "이트론",
-    "096240": "크레버스",
-    "096250": "와이즈넛",
-    "096350": "대창솔루션",
-    "096530": "씨젠",
-    "096610": "알에프세미",
-    "096630": "에스코넥",
-    "096690": "에이루트",
-    "096760": "JW홀딩스",
-    "096770": "SK이노베이션",
-    "096775": "SK이노베이션우",
-    "096870": "엘디티",
-    "097230": "HJ중공업",
-    "097520": "엠씨넥스",
-    "097780": "에코볼트",
-    "097800": "윈팩",
-    "097870": "효성오앤비",
-    "097950": "CJ제일제당",
-    "097955": "CJ제일제당 우",
-    "098070": "한텍",
-    "098120": "마이크로컨텍솔",
-    "098460": "고영",
-    "098660": "에스티오",
-    "099190": "아이센스",
-    "099220": "SDN",
-    "099320": "쎄트렉아이",
-    "099390": "브레인즈컴퍼니",
-    "099410": "동방선기",
-    "099430": "바이오플러스",
-    "099440": "스맥",
-    "099520": "DGI",
-    "099750": "이지케어텍",
-    "100030": "인지소프트",
-    "100090": "SK오션플랜트",
-    "100120": "뷰웍스",
-    "100130": "동국S&C",
-    "100220": "비상교육",
-    "100250": "진양홀딩스",
-    "100590": "머큐리",
-    "100660": "서암기계공업",
-    "100700": "세운메디칼",
-    "100790": "미래에셋벤처투자",
-    "100840": "SNT에너지",
-    "101000": "KS인더스트리",
-    "101140": "인바이오젠",
-    "101160": "월덱스",
-    "101170": "우림피티에스",
-    "101240": "씨큐브",
-    "101330": "모베이스",
-    "101360": "에코앤드림",
-    "101390": "아이엠",
-    "101400": "엔시트론",
-    "101490": "에스앤에스텍",
-    "101530": "해태제과식품",
-    "101670": "하이드로리튬",
-    "101680": "한국정밀기계",
-    "101730": "위메이드맥스",
-    "101930": "인화정공",
-    "101970": "우양에이치씨",
-    "102120": "어보브반도체",
-    "102260": "동성케미컬",
-    "102280": "쌍방울",
-    "102370": "케이옥션",
-    "102460": "이연제약",
-    "102710": "이엔에프테크놀로지",
-    "102940": "코오롱생명과학",
-    "103140": "풍산",
-    "103230": "에스앤더블류",
-    "103590": "일진전기",
-    "103840": "우양",
-    "104040": "대성파인텍",
-    "104200": "NHN벅스",
-    "104460": "디와이피엔에프",
-    "104480": "티케이케미칼",
-    "104540": "코렌텍",
-    "104620": "노랑풍선",
-    "104700": "한국철강",
-    "104830": "원익머트리얼즈",
-    "105330": "케이엔더블유",
-    "105550": "엣지파운드리",
-    "105560": "KB금융",
-    "105630": "한세실업",
-    "105740": "디케이락",
-    "105760": "포스뱅크",
-    "105840": "우진",
-    "106080": "케이이엠텍",
-    "106190": "하이텍팜",
-    "106240": "파인테크닉스",
-    "106520": "노블엠앤비",
-    "107590": "미원홀딩스",
-    "107600": "새빗켐",
-    "107640": "한중엔시에스",
-    "108230": "톱텍",
-    "108320": "LX세미콘",
-    "108380": "대양전기공업",
-    "108490": "로보티즈",
-    "108670": "LX하우시스",
-    "108675": "LX하우시스우",
-    "108860": "셀바스AI",
-    "109070": "주성코퍼레이션",
-    "109080": "옵티시스",
-    "109610": "에스와이",
-    "109670": "씨싸이트",
-    "109740": "디에스케이",
-    "109820": "진매트릭스",
-    "109860": "동일금속",
-    "109960": "AP헬스케어",
-    "110020": "전진바이오팜",
-    "110790": "크리스에프앤씨",
-    "110990": "디아이티",
-    "111110": "호전실업",
-    "111380": "동인기연",
-    "111710": "남화산업",
-    "111770": "영원무역",
-    "111870": "KH 미래물산",
-    "112040": "위메이드",
-    "112290": "와이씨켐",
-    "112610": "씨에스윈드",
-    "113810": "디젠스",
-    "114090": "GKL",
-    "114190": "강원에너지",
-    "114450": "그린생명과학",
-    "114630": "폴라리스우노",
-    "114810": "한솔아이원스",
-    "114840": "아이패밀리에스씨",
-    "115160": "휴맥스",
-    "115180": "큐리언트",
-    "115310": "인포바인",
-    "115440": "우리넷",
-    "115450": "HLB테라퓨틱스",
-    "115480": "씨유메디칼",
-    "115500": "케이씨에스",
-    "115530": "씨엔플러스",
-    "115570": "스타플렉스",
-    "115610": "이미지스",
-    "117580": "대성에너지",
-    "117670": "알파칩스",
-    "117730": "티로보틱스",
-    "118000": "메타케어",
-    "118990": "모트렉스",
-    "119500": "포메탈",
-    "119610": "인터로조",
-    "119650": "KC코트렐",
-    "119830": "아이텍",
-    "119850": "지엔씨에너지",
-    "120030": "조선선재",
-    "120110": "코오롱인더",
-    "120115": "코오롱인더우",
-    "120240": "대정화금",
-    "121440": "골프존홀딩스",
-    "121600": "나노신소재",
-    "121800": "비덴트",
-    "121850": "코이즈",
-    "121890": "에스디시스템",
-    "122310": "제노레이",
-    "122350": "삼기",
-    "122450": "KX",
-    "122640": "예스티",
-    "122690": "서진오토모티브",
-    "122870": "와이지엔터테인먼트",
-    "122900": "아이마켓코리아",
-    "122990": "와이솔",
-    "123010": "아이윈플러스",
-    "123040": "엠에스오토텍",
-    "123330": "제닉",
-    "123410": "코리아에프티",
-    "123420": "위메이드플레이",
-    "123570": "이엠넷",
-    "123690": "한국화장품",
-    "123700": "SJM",
-    "123750": "알톤",
-    "123840": "뉴온",
-    "123860": "아나패스",
-    "123890": "한국자산신탁",
-    "124500": "아이티센글로벌",
-    "124560": "태웅로직스",
-    "125020": "티씨머티리얼즈",
-    "125210": "아모그린텍",
-    "126340": "비나텍",
-    "126560": "현대퓨처넷",
-    "126600": "BGF에코머티리얼즈",
-    "126640": "화신정공",
-    "126700": "하이비젼시스템",
-    "126720": "수산인더스트리",
-    "126730": "코칩",
-    "126880": "제이엔케이글로벌",
-    "127120": "제이에스링크",
-    "127710": "아시아경제",
-    "127980": "화인써키트",
-    "128540": "에코캡",
-    "128660": "피제이메탈",
-    "128820": "대성산업",
-    "128940": "한미약품",
-    "129260": "인터지스",
-    "129890": "앱코",
-    "129920": "대성하이텍",
-    "130500": "GH신소재",
-    "130580": "나이스디앤비",
-    "130660": "한전산업",
-    "130740": "티피씨글로벌",
-    "131030": "옵투스제약",
-    "131090": "시큐브",
-    "131100": "티엔엔터테인먼트",
-    "131180": "딜리",
-    "131220": "대한과학",
-    "131290": "티에스이",
-    "131370": "알서포트",
-    "131400": "이브이첨단소재",
-    "131760": "파인텍",
-    "131970": "두산테스나",
-    "133750": "메가엠디",
-    "133820": "화인베스틸",
-    "134060": "이퓨쳐",
-    "134380": "미원화학",
-    "134580": "탑코미디어",
-    "134790": "시디즈",
-    "136150": "원일티엔아이",
-    "136410": "아셈스",
-    "136480": "하림",
-    "136490": "선진",
-    "136540": "윈스테크넷",
-    "137080": "나래나노텍",
-    "137310": "에스디바이오센서",
-    "137400": "피엔티",
-    "137940": "넥스트아이",
-    "137950": "제이씨케미칼",
-    "138070": "신진에스엠",
-    "138080": "오이솔루션",
-    "138360": "협진",
-    "138490": "코오롱ENP",
-    "138610": "나이벡",
-    "138930": "BNK금융지주",
-    "139050": "BF랩스",
-    "139130": "iM금융지주",
-    "139480": "이마트",
-    "139670": "키네마스터",
-    "139990": "아주스틸",
-    "140070": "서플러스글로벌",
-    "140410": "메지온",
-    "140430": "카티스",
-    "140520": "대창스틸",
-    "140670": "알에스오토메이션",
-    "140860": "파크시스템스",
-    "141000": "비아트론",
-    "141080": "리가켐바이오",
-    "142210": "유니트론텍",
-    "142280": "녹십자엠에스",
-    "142760": "모아라이프플러스",
-    "143160": "아이디스",
-    "143210": "핸즈코퍼레이션",
-    "143240": "사람인",
-    "143540": "영우디에스피",
-    "144510": "지씨셀",
-    "144960": "뉴파워프라즈마",
-    "145020": "휴젤",
-    "145170": "노브랜드",
-    "145210": "다이나믹디자인",
-    "145720": "덴티움",
-    "145990": "삼양사",
-    "145995": "삼양사우",
-    "146060": "율촌",
-    "146320": "비씨엔씨",
-    "147760": "피엠티",
-    "147830": "제룡산업",
-    "148150": "세경하이테크",
-    "148250": "알엔투테크놀로지",
-    "148780": "비큐AI",
-    "148930": "에이치와이티씨",
-    "149950": "아바텍",
-    "149980": "하이로닉",
-    "150840": "인트로메딕",
-    "150900": "파수",
-    "151860": "KG에코솔루션",
-    "151910": "퓨처코어",
-    "152550": "한국ANKOR유전",
-    "153460": "네이블",
-    "153490": "우리이앤엘",
-    "153710": "옵티팜",
-    "154030": "아시아종묘",
-    "154040": "다산솔루에타",
-    "155650": "와이엠씨",
-    "155660": "DSR",
-    "156100": "엘앤케이바이오",
-    "158430": "아톤",
-    "159010": "아스플로",
-    "159580": "제로투세븐",
-    "159910": "에코글로우",
-    "160190": "하이젠알앤엠",
-    "160550": "NEW",
-    "160980": "싸이맥스",
-    "161000": "애경케미칼",
-    "161390": "한국타이어앤테크놀로지",
-    "161580": "필옵틱스",
-    "161890": "한국콜마",
-    "162300": "신스틸",
-    "163280": "에어레인",
-    "163560": "동일고무벨트",
-    "163730": "핑거",
-    "166090": "하나머티리얼즈",
-    "166480": "코아스템켐온",
-    "168330": "내츄럴엔도텍",
-    "168360": "펨트론",
-    "169330": "엠브레인",
-    "170030": "현대공업",
-    "170790": "파이오링크",
-    "170900": "동아에스티",
-    "170920": "엘티씨",
-    "171010": "램테크놀러지",
-    "171090": "선익시스템",
-    "171120": "라이온켐텍",
-    "172670": "에이엘티",
-    "173130": "오파스넷",
-    "173940": "에프엔씨엔터",
-    "174880": "장원테크",
-    "174900": "앱클론",
-    "175140": "휴먼테크놀로지",
-    "175250": "아이큐어",
-    "175330": "JB금융지주",
-    "176750": "듀켐바이오",
-    "177350": "베셀",
-    "177830": "파버나인",
-    "177900": "쓰리에이로직스",
-    "178320": "서진시스템",
-    "178780": "일월지엠엘",
-    "178920": "PI첨단소재",
-    "179290": "엠아이텍",
-    "179530": "애드바이오텍",
-    "179900": "유티아이",
-    "180400": "DXVX",
-    "180640": "한진칼",
-    "181710": "NHN",
-    "182360": "큐브엔터",
-    "182400": "엔케이맥스",
-    "183190": "아세아시멘트",
-    "183300": "코미코",
-    "183490": "엔지켐생명과학",
-    "184230": "SGA솔루션즈",
-    "185490": "아이진",
-    "185750": "종근당",
-    "186230": "그린플러스",
-    "187220": "디티앤씨",
-    "187270": "신화콘텍",
-    "187420": "HLB제넥스",
-    "187660": "현대ADM",
-    "187790": "나노",
-    "187870": "디바이스",
-    "188040": "바이오포트",
-    "188260": "세니젠",
-    "189300": "인텔리안테크",
-    "189330": "씨이랩",
-    "189690": "포시에스",
-    "189860": "서전기전",
-    "189980": "흥국에프엔비",
-    "190510": "나무가",
-    "190650": "코리아에셋투자증권",
-    "191410": "육일씨엔에쓰",
-    "191420": "테고사이언스",
-    "192080": "더블유게임즈",
-    "192250": "케이사인",
-    "192390": "윈하이텍",
-    "192400": "쿠쿠홀딩스",
-    "192410": "오늘이엔엠",
-    "192440": "슈피겐코리아",
-    "192650": "드림텍",
-    "192820": "코스맥스",
-    "193250": "링크드",
-    "194370": "제이에스코퍼레이션",
-    "194480": "데브시스터즈",
-    "194700": "노바렉스",
-    "195500": "마니커에프앤지",
-    "195870": "해성디에스",
-    "195940": "HK이노엔",
-    "195990": "에이비프로바이오",
-    "196170": "알테오젠",
-    "196300": "HLB펩",
-    "196450": "코아시아씨엠",
-    "196490": "디에이테크놀로지",
-    "196700": "웹스",
-    "197140": "디지캡",
-    "198080": "캐프",
-    "198440": "강동씨앤엘",
-    "198940": "한주라이트메탈",
-    "199430": "케이엔알시스템",
-    "199480": "뱅크웨어글로벌",
-    "199550": "레이저옵텍",
-    "199730": "바이오인프라",
-    "199800": "툴젠",
-    "199820": "제일일렉트릭",
-    "200130": "콜마비앤에이치",
-    "200230": "텔콘RF제약",
-    "200350": "아티스트스튜디오",
-    "200470": "에이팩트",
-    "200670": "휴메딕스",
-    "200710": "에이디테크놀로지",
-    "200780": "비씨월드제약",
-    "200880": "서연이화",
-    "201490": "미투온",
-    "203400": "에이비온",
-    "203450": "유니온바이오메트릭스",
-    "203650": "드림시큐리티",
-    "203690": "아크솔루션스",
-    "204020": "그리티",
-    "204270": "제이앤티씨",
-    "204320": "HL만도",
-    "204610": "티쓰리",
-    "204620": "글로벌텍스프리",
-    "204630": "스튜디오산타클로스",
-    "204840": "지엘팜텍",
-    "205100": "엑셈",
-    "205470": "휴마시스",
-    "205500": "넥써쓰",
-    "206400": "베노티앤알",
-    "206560": "덱스터",
-    "206640": "바디텍메드",
-    "206650": "유바이오로직스",
-    "207760": "미스터블루",
-    "207940": "삼성바이오로직스",
-    "208140": "정다운",
-    "208340": "파멥신",
-    "208350": "지란지교시큐리티",
-    "208370": "셀바스헬스케어",
-    "208640": "썸에이지",
-    "208710": "포톤",
-    "208860": "엔지스테크널러지",
-    "209640": "와이제이링크",
-    "210120": "캔버스엔",
-    "210540": "디와이파워",
-    "210980": "SK디앤디",
-    "211050": "인카금융서비스",
-    "211270": "AP위성",
-    "212560": "네오오토",
-    "212710": "아이에스티이",
-    "213420": "덕산네오룩스",
-    "213500": "한솔제지",
-    "214150": "클래시스",
-    "214180": "헥토이노베이션",
-    "214260": "라파스",
-    "214270": "FSN",
-    "214320": "이노션",
-    "214330": "금호에이치티",
-    "214370": "케어젠",
-    "214390": "경보제약",
-    "214420": "토니모리",
-    "214430": "아이쓰리시스템",
-    "214450": "파마리서치",
-    "214610": "더바이오메드",
-    "214680": "디알텍",
-    "215000": "골프존",
-    "215090": "솔디펜스",
-    "215100": "로보로보",
-    "215200": "메가스터디교육",
-    "215360": "우리산업",
-    "215380": "우정바이오",
-    "215480": "토박스코리아",
-    "215600": "신라젠",
-    "215790": "이노인스트루먼트",
-    "216050": "인크로스",
-    "216080": "제테마",
-    "217190": "제너셈",
-    "217270": "넵튠",
-    "217330": "싸이토젠",
-    "217480": "에스디생명공학",
-    "217500": "러셀",
-    "217620": "선샤인푸드",
-    "217730": "강스템바이오텍",
-    "217820": "원익피앤이",
-    "218150": "미래생명자원",
-    "218410": "RFHIC",
-    "219130": "타이거일렉",
-    "219420": "링크제니시스",
-    "219550": "디와이디",
-    "219750": "한국비티비",
-    "220100": "퓨쳐켐",
-    "220180": "핸디소프트",
-    "220260": "켐트로스",
-    "221800": "유투바이오",
-    "221840": "하이즈항공",
-    "221980": "케이디켐",
-    "222040": "코스맥스엔비티",
-    "222080": "씨아이에스",
-    "222110": "팬젠",
-    "222160": "NPX",
-    "222420": "쎄노텍",
-    "222800": "심텍",
-    "222810": "세토피아",
-    "222980": "한국맥널티",
-    "223250": "드림씨아이에스",
-    "223310": "딥마인드",
-    "224060": "더코디",
-    "224110": "에이텍모빌리티",
-    "225190": "LK삼양",
-    "225220": "제놀루션",
-    "225430": "케이엠제약",
-    "225530": "HC보광산업",
-    "225570": "넥슨게임즈",
-    "225590": "패션플랫폼",
-    "226320": "잇츠한불",
-    "226330": "신테카바이오",
-    "226340": "본느",
-    "226360": "KH 건설",
-    "226400": "오스테오닉",
-    "226590": "엠디바이스",
-    "226950": "올릭스",
-    "227100": "퀀텀온",
-    "227610": "아우딘퓨쳐스",
-    "227840": "현대코퍼레이션홀딩스",
-    "227950": "엔투텍",
-    "228340": "동양파일",
-    "228670": "레이",
-    "228760": "지노믹트리",
-    "228850": "레이언스",
-    "229000": "젠큐릭스",
-    "229640": "LS에코에너지",
-    "230240": "에치에프알",
-    "230360": "에코마케팅",
-    "230980": "비유테크놀러지",
-    "232140": "와이씨",
-    "232680": "라온테크",
-    "232830": "아이티센피엔에스",
-    "234030": "싸이닉솔루션",
-    "234080": "JW생명과학",
-    "234100": "폴라리스세원",
-    "234300": "에스트래픽",
-    "234340": "헥토파이낸셜",
-    "234690": "녹십자웰빙",
-    "234920": "자이글",
-    "235980": "메드팩토",
-    "236200": "슈프리마",
-    "236810": "엔비티",
-    "237690": "에스티팜",
-    "237750": "피앤씨테크",
-    "237820": "플레이디",
-    "237880": "클리오",
-    "238090": "앤디포스",
-    "238120": "얼라인드",
-    "238200": "비피도",
-    "238490": "힘스",
-    "239340": "이스트에이드",
-    "239610": "에이치엘사이언스",
-    "239890": "피엔에이치테크",
-    "240550": "동방메디컬",
-    "240600": "유진테크놀로지",
-    "240810": "원익IPS",
-    "241520": "DSC인베스트먼트",
-    "241560": "두산밥캣",
-    "241590": "화승엔터프라이즈",
-    "241690": "유니테크노",
-    "241710": "코스메카코리아",
-    "241770": "메카로",
-    "241790": "티이엠씨씨엔에스",
-    "241820": "피씨엘",
-    "241840": "에이스토리",
-    "242040": "나무기술",
-    "243070": "휴온스",
-    "243840": "신흥에스이씨",
-    "244460": "올리패스",
-    "244920": "에이플러스에셋",
-    "245620": "EDGC",
-    "246250": "에스엘에스바이오",
-    "246690": "TS인베스트먼트",
-    "246710": "티앤알바이오팹",
-    "246720": "아스타",
-    "246960": "SCL사이언스",
-    "247540": "에코프로비엠",
-    "247660": "나노씨엠에스",
-    "248070": "솔루엠",
-    "248170": "샘표식품",
-    "249420": "일동제약",
-    "250000": "보라티알",
-    "250060": "모비스",
-    "250930": "예선테크",
-    "251120": "바이오에프디엔씨",
-    "251270": "넷마블",
-    "251370": "와이엠티",
-    "251630": "브이원텍",
-    "251970": "펌텍코리아",
-    "252500": "세화피앤씨",
-    "252990": "샘씨엔에스",
-    "253450": "스튜디오드래곤",
-    "253590": "네오셈",
-    "253840": "수젠텍",
-    "254120": "자비스",
-    "254490": "미래반도체",
-    "255220": "SG",
-    "255440": "야스",
-    "256150": "한독크린텍",
-    "256630": "포인트엔지니어링",
-    "256840": "한국비엔씨",
-    "256940": "킵스파마",
-    "257370": "피엔티엠에스",
-    "257720": "실리콘투",
-    "258610": "케일럼",
-    "258790": "소프트캠프",
-    "258830": "세종메디칼",
-    "259630": "엠플러스",
-    "259960": "크래프톤",
-    "260660": "알리코제약",
-    "260930": "씨티케이",
-    "260970": "에스앤디",
-    "261200": "덴티스",
-    "261780": "차백신연구소",
-    "262260": "에이프로",
-    "262840": "아이퀘스트",
-    "263020": "디케이앤디",
-    "263050": "유틸렉스",
-    "263600": "덕우전자",
-    "263690": "디알젬",
-    "263700": "케어랩스",
-    "263720": "디앤씨미디어",
-    "263750": "펄어비스",
-    "263770": "유에스티",
-    "263800": "데이타솔루션",
-    "263810": "상신전자",
-    "263860": "지니언스",
-    "263920": "휴엠앤씨",
-    "264450": "유비쿼스",
-    "264660": "씨앤지하이테크",
-    "264850": "이랜시스",
-    "264900": "크라운제과",
-    "265520": "AP시스템",
-    "265560": "영화테크",
-    "265740": "엔에프씨",
-    "267250": "HD현대",
-    "267260": "HD현대일렉트릭",
-    "267270": "HD현대건설기계",
-    "267290": "경동도시가스",
-    "267320": "나인테크",
-    "267790": "배럴",
-    "267850": "아시아나IDT",
-    "267980": "매일유업",
-    "268280": "미원에스씨",
-    "269620": "시스웍",
-    "270520": "앱트뉴로사이언스",
-    "270660": "에브리봇",
-    "270870": "뉴트리",
-    "271560": "오리온",
-    "271830": "팸텍",
-    "271940": "일진하이솔루스",
-    "271980": "제일약품",
-    "272110": "케이엔제이",
-    "272210": "한화시스템",
-    "272290": "이녹스첨단소재",
-    "272450": "진에어",
-    "272550": "삼양패키징",
-    "273060": "와이즈버즈",
-    "273640": "와이엠텍",
-    "274090": "켄코아에어로스페이스",
-    "274400": "이노시뮬레이션",
-    "275630": "에스에스알",
-    "276040": "스코넥",
-    "276730": "한울앤제주",
-    "277070": "린드먼아시아",
-    "277410": "인산가",
-    "277810": "레인보우로보틱스",
-    "277880": "티에스아이",
-    "278280": "천보",
-    "278470": "에이피알",
-    "278650": "HLB바이오스텝",
-    "279600": "미디어젠",
-    "280360": "롯데웰푸드",
-    "281740": "레이크머티리얼즈",
-    "281820": "케이씨텍",
-    "282330": "BGF리테일",
-    "282720": "금양그린파워",
-    "282880": "코윈테크",
-    "284620": "카이노스메드",
-    "284740": "쿠쿠홈시스",
-    "285130": "SK케미칼",
-    "285490": "노바텍",
-    "285800": "진영",
-    "286750": "나노실리칸첨단소재",
-    "286940": "롯데이노베이트",
-    "287840": "인투셀",
-    "288330": "브릿지바이오테라퓨틱스",
-    "288620": "에스퓨얼셀",
-    "288980": "모아데이타",
-    "289010": "아이스크림에듀",
-    "289080": "SV인베스트먼트",
-    "289220": "자이언트스텝",
-    "289930": "웨이비스",
-    "290090": "트윔",
-    "290120": "DH오토리드",
-    "290270": "휴네시온",
-    "290380": "대유",
-    "290520": "신도기연",
-    "290550": "디케이티",
-    "290560": "신시웨이",
-    "290650": "엘앤씨바이오",
-    "290660": "네오펙트",
-    "290670": "대보마그네틱",
-    "290690": "소룩스",
-    "290720": "푸드나무",
-    "290740": "액트로",
-    "291230": "엔피",
-    "291650": "압타머사이언스",
-    "291810": "핀텔",
-    "293480": "하나제약",
-    "293490": "카카오게임즈",
-    "293580": "나우IB",
-    "293780": "압타바이오",
-    "294090": "이오플로우",
-    "294140": "레몬",
-    "294570": "쿠콘",
-    "294630": "서남",
-    "294870": "HDC현대산업개발",
-    "295310": "에이치브이엠",
-    "296640": "이노룰스",
-    "297090": "씨에스베어링",
-    "297570": "알로이스",
-    "297890": "HB솔루션",
-    "298000": "효성화학",
-    "298020": "효성티앤씨",
-    "298040": "효성중공업",
-    "298050": "HS효성첨단소재",
-    "298060": "에스씨엠생명과학",
-    "298380": "에이비엘바이오",
-    "298540": "더네이쳐홀딩스",
-    "298690": "에어부산",
-    "298830": "슈어소프트테크",
-    "299030": "하나기술",
-    "299170": "더블유에스아이",
-    "299660": "셀리드",
-    "299900": "위지윅스튜디오",
-    "300080": "플리토",
-    "300120": "라온피플",
-    "300720": "한일시멘트",
-    "301300": "바이브컴퍼니",
-    "302430": "이노메트리",
-    "302440": "SK바이오사이언스",
-    "302550": "리메드",
-    "303030": "지니틱스",
-    "303360": "프로티아",
-    "303530": "이노뎁",
-    "303810": "동국생명과학",
-    "304100": "솔트룩스",
-    "304360": "에스바이오메딕스",
-    "304840": "피플바이오",
-    "305090": "마이크로디지탈",
-    "306040": "에스제이그룹",
-    "306200": "세아제강",
-    "306620": "네온테크",
-    "307180": "아이엘",
-    "307280": "원바이오젠",
-    "307750": "국전약품",
-    "307870": "비투엔",
-    "307930": "컴퍼니케이",
-    "307950": "현대오토에버",
-    "308080": "바이젠셀",
-    "308100": "형지글로벌",
-    "308170": "씨티알모빌리티",
-    "308430": "셀비온",
-    "309930": "오하임앤컴퍼니",
-    "309960": "LB인베스트먼트",
-    "310200": "애니플러스",
-    "310210": "보로노이",
-    "310870": "디와이씨",
-    "311320": "지오엘리먼트",
-    "311390": "네오크레마",
-    "311690": "CJ 바이오사이언스",
-    "312610": "에이에프더블류",
-    "313760": "캐리",
-    "314130": "지놈앤컴퍼니",
-    "314140": "알피바이오",
-    "314930": "바이오다인",
-    "315640": "딥노이드",
-    "316140": "우리금융지주",
-    "317120": "라닉스",
-    "317240": "TS트릴리온",
-    "317330": "덕산테코피아",
-    "317400": "자이에스앤디",
-    "317530": "캐리소프트",
-    "317690": "퀀타매트릭스",
-    "317770": "엑스페릭스",
-    "317830": "에스피시스템스",
-    "317850": "대모",
-    "317870": "엔바이오니아",
-    "318000": "KBG",
-    "318010": "팜스빌",
-    "318020": "포인트모바일",
-    "318160": "셀바이오휴먼텍",
-    "318410": "비비씨",
-    "319400": "현대무벡스",
-    "319660": "피에스케이",
-    "320000": "한울반도체",
-    "321260": "프로이천",
-    "321370": "센서뷰",
-    "321550": "티움바이오",
-    "321820": "아티스트컴퍼니",
-    "322000": "HD현대에너지솔루션",
-    "322180": "LS티라유텍",
-    "322310": "오로스테크놀로지",
-    "322510": "제이엘케이",
-    "322780": "코퍼스코리아",
-    "323280": "태성",
-    "323350": "다원넥스뷰",
-    "323410": "카카오뱅크",
-    "323990": "박셀바이오",
-    "326030": "SK바이오팜",
-    "327260": "RF머트리얼즈",
-    "328130": "루닛",
-    "328380": "솔트웨어",
-    "329180": "HD현대중공업",
-    "330350": "위더스제약",
-    "330730": "스톤브릿지벤처스",
-    "330860": "네패스아크",
-    "331380": "포커스에이아이",
-    "331520": "밸로프",
-    "331740": "아우토크립트",
-    "331920": "셀레믹스",
-    "332290": "누보",
-    "332370": "아이디피",
-    "332570": "PS일렉트로닉스",
-    "333050": "모코엠시스",
-    "333430": "일승",
-    "333620": "엔시스",
-    "334970": "프레스티지바이오로직스",
-    "335810": "프리시젼바이오",
-    "335870": "윙스풋",
-    "335890": "비올",
-    "336060": "웨이버스",
-    "336260": "두산퓨얼셀",
-    "336370": "솔루스첨단소재",
-    "336570": "원텍",
-    "336680": "탑런토탈솔루션",
-    "337930": "젝시믹스",
-    "338220": "뷰노",
-    "338840": "와이바이오로직스",
-    "339770": "교촌에프앤비",
-    "339950": "아이비김영",
-    "340360": "다보링크",
-    "340440": "세림B&G",
-    "340450": "지씨지놈",
-    "340570": "티앤엘",
-    "340810": "시선AI",
-    "340930": "유일에너테크",
-    "344820": "KCC글라스",
-    "344860": "이노진",
-    "347000": "센코",
-    "347700": "스피어",
-    "347740": "피엔케이피부임상연구센타",
-    "347770": "핌스",
-    "347850": "디앤디파마텍",
-    "347860": "알체라",
-    "347890": "엠투아이",
-    "348030": "모비릭스",
-    "348080": "큐라티스",
-    "348150": "고바이오랩",
-    "348210": "넥스틴",
-    "348340": "뉴로메카",
-    "348350": "위드텍",
-    "348370": "엔켐",
-    "351320": "넥사다이내믹스",
-    "351330": "이삭엔지니어링",
-    "351870": "차이커뮤니케이션",
-    "352090": "스톰테크",
-    "352480": "씨앤씨인터내셔널",
-    "352700": "씨앤투스",
-    "352770": "셀레스트라",
-    "352820": "하이브",
-    "352910": "오비고",
-    "352940": "인바이오",
-    "353190": "휴럼",
-    "353200": "대덕전자",
-    "353590": "오토앤",
-    "353810": "이지바이오",
-    "354200": "엔젠바이오",
-    "354320": "알멕",
-    "355150": "코스텍시스",
-    "355390": "크라우드웍스",
-    "355690": "에이텀",
-    "356680": "엑스게이트",
-    "356860": "티엘비",
-    "356890": "싸이버원",
-    "357230": "에이치피오",
-    "357550": "석경에이티",
-    "357580": "아모센스",
-    "357780": "솔브레인",
-    "357880": "SKAI",
-    "358570": "지아이이노베이션",
-    "359090": "씨엔알리서치",
-    "360070": "탑머티리얼",
-    "360350": "코셈",
-    "361390": "제노코",
-    "361570": "알비더블유",
-    "361610": "SK아이이테크놀로지",
-    "361670": "삼영에스앤씨",
-    "362320": "청담글로벌",
-    "362990": "드림인사이트",
-    "363250": "진시스템",
-    "363260": "모비데이즈",
-    "363280": "티와이홀딩스",
-    "364950": "에이아이코리아",
-    "365270": "큐라클",
-    "365330": "에스와이스틸텍",
-    "365340": "성일하이텍",
-    "365590": "하이딥",
-    "365900": "브이씨",
-    "366030": "공구우먼",
-    "367000": "플래티어",
-    "368600": "아이씨에이치",
-    "368770": "파이버프로",
-    "368970": "오에스피",
-    "370090": "퓨런티어",
-    "371950": "풍원정밀",
-    "372170": "윤성에프앤씨",
-    "372320": "큐로셀",
-    "372800": "아이티아이즈",
-    "372910": "한컴라이프케어",
-    "373110": "엑셀세라퓨틱스",
-    "373160": "데이원컴퍼니",
-    "373170": "엠아이큐브솔루션",
-    "373200": "엑스플러스",
-    "373220": "LG에너지솔루션",
-    "375500": "DL이앤씨",
-    "376180": "피코그램",
-    "376270": "에이치이엠파마",
-    "376290": "씨유테크",
-    "376300": "디어유",
-    "376900": "로킷헬스케어",
-    "376930": "노을",
-    "376980": "원티드랩",
-    "377030": "비트맥스",
-    "377220": "프롬바이오",
-    "377300": "카카오페이",
-    "377330": "이지트로닉스",
-    "377450": "리파인",
-    "377460": "위니아에이드",
-    "377480": "마음AI",
-    "377740": "바이오노트",
-    "378340": "필에너지",
-    "378800": "샤페론",
-    "378850": "화승알앤에이",
-    "380540": "옵티코어",
-    "380550": "뉴로핏",
-    "381620": "제닉스",
-    "381970": "케이카",
-    "382150": "온코크로스",
-    "382480": "지아이텍",
-    "382800": "지앤비에스 에코",
-    "382840": "원준",
-    "382900": "범한퓨얼셀",
-    "383220": "F&F",
-    "383310": "에코프로에이치엔",
-    "383800": "LX홀딩스",
-    "383930": "디티앤씨알오",
-    "384470": "코어라인소프트",
-    "387570": "파인메딕스",
-    "388050": "지투파워",
-    "388610": "지에프씨생명과학",
-    "388720": "유일로보틱스",
-    "388790": "라이콤",
-    "388870": "파로스아이바이오",
-    "389020": "자람테크놀로지",
-    "389030": "지니너스",
-    "389140": "포바이포",
-    "389260": "대명에너지",
-    "389470": "인벤티지랩",
-    "389500": "에스비비테크",
-    "389650": "넥스트바이오메디컬",
-    "389680": "유디엠텍",
-    "391710": "코닉오토메이션",
-    "393210": "토마토시스템",
-    "393890": "더블유씨피",
-    "393970": "대진첨단소재",
-    "394280": "오픈엣지테크놀로지",
-    "394800": "쓰리빌리언",
-    "396270": "넥스트칩",
-    "396300": "세아메카닉스",
-    "396470": "워트",
-    "397030": "에이프릴바이오",
-    "398120": "에스지헬스케어",
-    "399720": "가온칩스",
-    "402030": "코난테크놀로지",
-    "402340": "SK스퀘어",
-    "402490": "그린리소스",
-    "403490": "우듬지팜",
-    "403550": "쏘카",
-    "403870": "HPSP",
-    "405000": "플라즈맵",
-    "405100": "큐알티",
-    "405920": "나라셀라",
-    "406820": "뷰티스킨",
-    "407400": "꿈비",
-    "408900": "스튜디오미르",
-    "408920": "메쎄이상",
-    "411080": "샌즈랩",
-    "412350": "레이저쎌",
-    "412540": "제일엠앤에스",
-    "413390": "엠오티",
-    "413630": "씨피시스템",
-    "413640": "비아이매트릭스",
-    "415380": "스튜디오삼익",
-    "415640": "KB발해인프라",
-    "416180": "신성에스티",
-    "417010": "나노팀",
-    "417180": "핑거스토리",
-    "417200": "LS머트리얼즈",
-    "417500": "제이아이테크",
-    "417790": "트루엔",
-    "417840": "저스템",
-    "417860": "오브젠",
-    "417970": "모델솔루션",
-    "418250": "시큐레터",
-    "418420": "라온텍",
-    "418470": "KT밀리의서재",
-    "418550": "제이오",
-    "418620": "E8",
-    "419050": "삼기에너지솔루션즈",
-    "419080": "엔젯",
-    "419120": "산돌",
-    "419530": "SAMG엔터",
-    "419540": "비스토스",
-    "420570": "제이투케이바이오",
-    "420770": "기가비스",
-    "424760": "벨로크",
-    "424870": "이뮨온시아",
-    "424960": "스마트레이더시스템",
-    "424980": "마이크로투나노",
-    "425040": "티이엠씨",
-    "425420": "티에프이",
-    "429270": "시지트로닉스",
-    "430690": "한싹",
-    "431190": "케이쓰리아이",
-    "432430": "와이랩",
-    "432470": "케이엔에스",
-    "432720": "퀄리타스반도체",
-    "432980": "엠에프씨",
-    "434480": "모니터랩",
-    "435570": "에르코스",
-    "437730": "삼현",
-    "438700": "버넥트",
-    "439090": "마녀공장",
-    "439580": "블루엠텍",
-    "440110": "파두",
-    "440290": "HB인베스트먼트",
-    "440320": "오픈놀",
-    "441270": "파인엠텍",
-    "443060": "HD현대마린솔루션",
-    "443250": "레뷰코퍼레이션",
-    "443670": "에스피소프트",
-    "444530": "심플랫폼",
-    "445090": "에이직랜드",
-    "445180": "퓨릿",
-    "445680": "큐리옥스바이오시스템즈",
-    "446070": "유니드비티플러스",
-    "446540": "메가터치",
-    "448280": "에코아이",
-    "448710": "코츠테크놀로지",
-    "448900": "한국피아이엠",
-    "450080": "에코프로머티",
-    "450140": "코오롱모빌리티그룹",
-    "450330": "하스",
-    "450520": "인스웨이브",
-    "450950": "아스테라시스",
-    "451220": "아이엠티",
-    "451250": "삐아",
-    "451760": "컨텍",
-    "452160": "제이엔비",
-    "452190": "한빛레이저",
-    "452200": "민테크",
-    "452260": "한화갤러리아",
-    "452280": "한선엔지니어링",
-    "452300": "캡스톤파트너스",
-    "452400": "이닉스",
-    "452430": "사피엔반도체",
-    "452450": "피아이이",
-    "453340": "현대그린푸드",
-    "453450": "그리드위즈",
-    "453860": "에이에스텍",
-    "454910": "두산로보틱스",
-    "455180": "케이지에이",
-    "455900": "엔젤로보틱스",
-    "456010": "아이씨티케이",
-    "456040": "OCI",
-    "456070": "이엔셀",
-    "457190": "이수스페셜티케미컬",
-    "457370": "한켐",
-    "457550": "우진엔텍",
-    "457600": "벡트",
-    "458650": "성우",
-    "458870": "씨어스테크놀로지",
-    "459100": "위츠",
-    "459510": "나우로보틱스",
-    "460470": "아이빔테크놀로지",
-    "460850": "동국씨엠",
-    "460860": "동국제강",
-    "460870": "에스엠씨지",
-    "460930": "현대힘스",
-    "460940": "피앤에스로보틱스",
-    "461030": "아이엠비디엑스",
-    "461300": "아이스크림미디어",
-    "462310": "뉴키즈온",
-    "462350": "이노스페이스",
-    "462510": "라메디텍",
-    "462520": "조선내화",
-    "462860": "더즌",
-    "462870": "시프트업",
-    "462980": "아이지넷",
-    "463020": "뉴엔AI",
-    "463480": "모티브링크",
-    "464080": "에스오에스랩",
-    "464280": "티디에스팜",
-    "464500": "아이언디바이스",
-    "464580": "닷밀",
-    "465480": "인스피언",
-    "465770": "STX그린로지스",
-    "466100": "클로봇",
-    "466410": "사이냅소프트",
-    "468530": "프로티나",
-    "469750": "아이비젼웍스",
-    "471820": "셀로맥스사이언스",
-    "472850": "폰드그룹",
-    "473980": "노머스",
-    "474170": "루미르",
-    "474610": "RF시스템즈",
-    "474650": "링크솔루션",
-    "475150": "SK이터닉스",
-    "475230": "엔알비",
-    "475400": "씨메스",
-    "475430": "키스트론",
-    "475460": "미트박스",
-    "475560": "더본코리아",
-    "475580": "에이럭스",
-    "475660": "에스켐",
-    "475830": "오름테라퓨틱",
-    "475960": "토모큐브",
-    "476040": "오가노이드사이언스",
-    "476060": "온코닉테라퓨틱스",
-    "476080": "M83",
-    "478560": "블랙야크아이앤씨",
-    "479960": "위너스",
-    "480370": "씨케이솔루션",
-    "481070": "에이유브랜즈",
-    "482630": "삼양엔씨켐",
-    "483650": "달바글로벌",
-    "484120": "도우인시스",
-    "484810": "티엑스알로보틱스",
-    "484870": "엠앤씨솔루션",
-    "487570": "HS효성",
-    "489460": "바이오비쥬",
-    "489500": "엘케이켐",
-    "489790": "한화비전",
-    "499790": "GS피앤엘",
-    "900070": "글로벌에스엠",
-    "900100": "애머릿지",
-    "900110": "이스트아시아홀딩스",
-    "900120": "씨엑스아이",
-    "900140": "엘브이엠씨홀딩스",
-    "900250": "크리스탈신소재",
-    "900260": "로스웰",
-    "900270": "헝셩그룹",
-    "900290": "GRT",
-    "900300": "오가닉티코스메틱",
-    "900310": "컬러레이",
-    "900340": "윙입푸드",
-    "950130": "엑세스바이오",
-    "950140": "잉글우드랩",
-    "950160": "코오롱티슈진",
-    "950170": "JTC",
-    "950190": "고스트스튜디오",
-    "950200": "소마젠",
-    "950210": "프레스티지바이오파마",
-    "950220": "네오이뮨텍",
-}
 
-SECTORS = {
-    "기술": ['005930', '005935', '035720', '323410', '066570', '272210', '377300', '036570', '018880', '353200', '014820', '066575', '033240', '005680', '008110', '094280', '017370', '017900', '008700', '002700', '011230', '004770', '009320', '006200', '009140', '014910', '014825', '014915', '140860', '293490', '178320', '078600', '214430', '445680', '171090', '265520', '298830', '047560', '126700', '037460', '071280', '033160', '051160', '443670', '424960', '199430', '080580', '012860', '033320', '393210', '384470', '006140', '041460', '043260', '263600', '036010', '052790', '466410', '317830', '474610', '045340', '100030', '057540', '069540', '413630', '220180', '060850', '317530', '263810', '081580', '363250', '072950', '032680', '047080', '258790', '027040', '121890', '079970', '032685'],
-    "자동차": ['005380', '000270', '012330', '005387', '161390', '005385', '073240', '002350', '001500', '005389', '002355', '250060'],
-    "바이오": ['207940', '068270', '326030', '302440', '069620', '009420', '137310', '950210', '019170', '249420', '377740', '001060', '033270', '009290', '003220', '005500', '016580', '000520', '102460', '293480', '001360', '063160', '214390', '003060', '002720', '101140', '002630', '000220', '017180', '010600', '019175', '002210', '001067', '000225', '001065', '000227', '000250', '141080', '298380', '068760', '290650', '085660', '086450', '047920', '397030', '206650', '389650', '314930', '099430', '064550', '082800', '176750', '489460', '334970', '058820', '048410', '067080', '304360', '293780', '323990', '288330', '086820', '950130', '353810', '011040', '059210', '338840', '251120', '060590', '156100', '052260', '006620', '092190', '048530', '054050', '311690', '321550', '049960', '278650', '131030', '009300', '317870', '042520', '082850', '348150', '330350', '226330', '002800', '246710', '067370', '007370', '038460', '068330', '012790', '388870', '217730', '195990', '260660', '038070', '188040', '200230', '052670', '318160', '420570', '377220', '038870', '314140', '014570', '304840', '053950', '354200', '086040', '203450', '179530', '200780', '307280', '018680', '086060', '335810', '221800', '089140', '110020', '034940', '038530', '246250', '214610', '199730', '215380', '352940', '080720', '225430'],
-    "금융": ['105560', '086790', '316140', '024110', '006800', '005830', '071050', '005940', '016360', '029780', '039490', '138930', '175330', '031210', '139130', '001720', '003540', '003530', '030610', '003470', '000370', '001270', '000400', '006220', '071055', '003545', '016610', '001200', '005945', '001510', '001750', '030210', '003547', '003460', '006805', '001275', '001290', '003465', '003475', '003535', '001755', '001515', '211050', '078020', '007330', '190650'],
-    "에너지": ['373220', '015760', '036460', '011780', '018670', '020150', '229640', '100840', '002960', '322000', '005090', '017390', '117580', '003650', '011785', '004090', '267290', '034590', '002360', '119850', '215200', '389260', '114190', '378340', '024060', '072870', '419050', '095910'],
-    "화학": ['011170', '014680', '285130', '004000', '008730', '005420', '161000', '007690', '025860', '001390', '025000', '083420', '134380', '005950', '298000', '014440', '051630', '104480', '137950', '007770'],
-    "엔터테인먼트": ['352820', '037270', '241590', '035900', '122870', '419530', '182360', '048550', '054300', '063440', '068050', '173940', '131100', '037400'],
-    "게임": ['192080', '225570', '058630'],
-    "통신": ['033780', '030200', '017670', '058850', '058860', '025770', '036800', '089600', '418470', '043610', '036630', '010170', '020180', '035460'],
-    "건설": ['329180', '010140', '298040', '000720', '006360', '267270', '047040', '097230', '075580', '079900', '009410', '013580', '003480', '002990', '005960', '013360', '000725', '005965', '009415', '002995', '035890', '025950', '026150', '021320', '042940', '226360'],
-    "유통": ['139480', '069960', '071840', '006370'],
-}
+class _Universe:
+    """한 번 읽은 종목 목록. refresh 시 통째로 교체한다."""
+    __slots__ = ("path", "mtime", "checked_at", "codes", "names", "stocks", "sectors",
+                 "name_to_code", "gram_index")
+
+    def __init__(self, path, mtime, codes, names, sectors):
+        self.path = path
+        self.mtime = mtime
+        self.checked_at = time.monotonic()
+        self.codes = codes        # 종목코드 순
+        self.names = names
+        self.stocks = dict(zip(codes, names))
+        self.sectors = sectors
+        # 정확한 종목명 → 코드 (동명 종목은 먼저 나온 코드)
+        self.name_to_code = {}
+        for code, name in zip(codes, names):
+            self.name_to_code.setdefault(name, code)
+        self.gram_index = None    # 첫 부분 검색 때 _gram_index()가 생성
+
+
+_universe = None
+_lock = threading.Lock()
+
+
+def _read_universe(path):
+    mtime = os.stat(path).st_mtime
+    with open(path, encoding="utf-8") as f:
+        stock_block, _, sector_block = f.read().partition("\n\n")
+    rows = sorted(line.split("\t", 1) for line in stock_block.splitlines() if line)
+    sectors = {}
+    for line in sector_block.splitlines():
+        if line:
+            sector, _, codes = line.partition("\t")
+            sectors[sector] = codes.split()
+    return _Universe(path, mtime, tuple(code for code, _ in rows), tuple(name for _, name in rows), sectors)
+
+
+def _get_universe():
+    universe = _universe
+    if universe is not None and not (
+        RELOAD_CHECK_SEC and time.monotonic() - universe.checked_at >= RELOAD_CHECK_SEC
+    ):
+        return universe
+    with _lock:
+        if _universe is None:
+            _install(_read_universe(DATA_PATH))
+        elif RELOAD_CHECK_SEC and time.monotonic() - _universe.checked_at >= RELOAD_CHECK_SEC:
+            _universe.checked_at = time.monotonic()
+            try:
+                changed = os.stat(_universe.path).st_mtime != _universe.mtime
+                if changed:
+                    _install(_read_universe(_universe.path))
+            except (OSError, ValueError):
+                pass  # 교체 중이거나 잘못된 파일이면 기존 목록 유지
+        return _universe
+
+
+def _install(universe):
+    # _lock 안에서 호출
+    global _universe
+    _universe = universe
+    _resolve_name.cache_clear()
+
+
+def refresh(path=None):
+    """종목 파일(기본 DATA_PATH)을 다시 읽어 목록·인덱스를 교체하고 종목명 해석 캐시를 비운다. 종목 수 반환."""
+    universe = _read_universe(path or DATA_PATH)
+    with _lock:
+        _install(universe)
+    return len(universe.codes)
+
+
+def write_universe(stocks, sectors, path=None):
+    """{종목코드: 종목명}, {섹터: [종목코드]}를 종목 파일 형식으로 원자적으로 저장 (적용은 refresh)."""
+    path = path or DATA_PATH
+    lines = [f"{code}\t{stocks[code]}" for code in sorted(stocks)]
+    lines.append("")
+    lines += [f"{sector}\t{' '.join(codes)}" for sector, codes in sectors.items()]
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    os.replace(tmp, path)
+
+
+def __getattr__(name):
+    # 기존 모듈 속성 호환: 접근할 때 읽고, refresh 후에는 새 목록을 반환
+    if name == "KOREAN_STOCKS":
+        return _get_universe().stocks
+    if name == "SECTORS":
+        return _get_universe().sectors
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# ── 종목명 조회 인덱스 (첫 부분 검색 때 1회 생성) ───────────────────────────────
+# gram_index: 1글자/2글자 조각 → 해당 조각을 포함한 종목 위치 배열 (종목코드 순)
+# 위치는 int 객체 리스트 대신 부호 없는 정수 배열로 보관 (항목당 2바이트)
+
+def _gram_index(universe):
+    index = universe.gram_index
+    if index is None:
+        postings = {}
+        for i, name in enumerate(universe.names):
+            grams = set(name) | {name[j:j + 2] for j in range(len(name) - 1)}
+            for gram in grams:
+                postings.setdefault(gram, []).append(i)
+        typecode = "H" if len(universe.names) <= 0xFFFF else "I"
+        index = {gram: array(typecode, positions) for gram, positions in postings.items()}
+        universe.gram_index = index
+    return index
+
+def _match_positions(keyword, universe=None):
+    """keyword를 이름에 포함한 종목 위치 (종목코드 순)."""
+    universe = universe or _get_universe()
+    if not keyword:
+        return range(len(universe.names))
+    index = _gram_index(universe)
+    if len(keyword) == 1:
+        return index.get(keyword, [])
+    grams = {keyword[j:j + 2] for j in range(len(keyword) - 1)}
+    postings = sorted((index.get(g, []) for g in grams), key=len)
+    candidates = set(postings[0])
+    for p in postings[1:]:
+        if not candidates:
+            break
+        candidates.intersection_update(p)
+    # 2글자 조각이 모두 있어도 연속 부분문자열인지는 최종 확인
+    return [i for i in sorted(candidates) if keyword in universe.names[i]]
 
 def get_company_name(ticker):
-    return KOREAN_STOCKS.get(ticker, "Unknown")
+    return _get_universe().stocks.get(ticker, "Unknown")
 
 def get_ticker_by_name(company_name):
-    for ticker, name in KOREAN_STOCKS.items():
-        if name == company_name:
-            return ticker
-    return None
+    return _get_universe().name_to_code.get(company_name)
 
 def search_company_by_partial_name(partial_name):
-    matches = []
-    for ticker, name in KOREAN_STOCKS.items():
-        if partial_name in name:
-            matches.append((ticker, name))
-    return matches
+    universe = _get_universe()
+    return [(universe.codes[i], universe.names[i]) for i in _match_positions(partial_name, universe)]
 
 def get_sector_stocks(sector):
-    return SECTORS.get(sector, [])
+    return _get_universe().sectors.get(sector, [])
 
 def search_stocks(keyword):
-    results = []
-    for ticker, name in KOREAN_STOCKS.items():
-        if keyword in name:
-            results.append((ticker, name))
-    return results
+    return search_company_by_partial_name(keyword)
 
 def get_ticker_from_name(input_text):
-    input_text = input_text.strip()
-    
-    exact_ticker = get_ticker_by_name(input_text)
+    return _resolve_name(input_text.strip())
+
+@lru_cache(maxsize=1024)
+def _resolve_name(name):
+    """종목명 → 'XXXXXX.KS'. 정확히 일치하거나 부분 일치가 하나뿐일 때만."""
+    exact_ticker = get_ticker_by_name(name)
     if exact_ticker:
         return exact_ticker + ".KS"
-    
-    matches = search_company_by_partial_name(input_text)
-    
+
+    universe = _get_universe()
+    matches = _match_positions(name, universe)
     if len(matches) == 1:
-        return matches[0][0] + ".KS"
-    elif len(matches) > 1:
-        return None
-    
+        return universe.codes[matches[0]] + ".KS"
     return None
 
+# ── 입력 분류 ────────────────────────────────────────────────────────────────
+# 종목명 검색 없이 형태만으로 판별 가능한 입력 패턴
+_KRX_CODE = re.compile(r"^\d{6}$")
+_KRX_TICKER = re.compile(r"^(\d{6})\.(KS|KQ)$")
+_CRYPTO_PAIR = re.compile(r"^[A-Z0-9]{2,10}-(USD|USDT|KRW|EUR|BTC|ETH)$")
+_PLAIN_TICKER = re.compile(r"^[A-Z0-9][A-Z0-9.=\-]{0,11}$")
+
+def classify_ticker_input(user_input):
+    """대문자 입력의 종류: krx_code, krx_ticker, index, crypto, ticker, name."""
+    if _KRX_CODE.match(user_input):
+        return "krx_code"
+    if _KRX_TICKER.match(user_input):
+        return "krx_ticker"
+    if user_input.startswith("^"):
+        return "index"
+    if _CRYPTO_PAIR.match(user_input):
+        return "crypto"
+    if _PLAIN_TICKER.match(user_input):
+        return "ticker"
+    return "name"
+
 def process_ticker_input(user_input):
     user_input = user_input.strip().upper()
-    
-    ticker_from_name = get_ticker_from_name(user_input)
+    kind = classify_ticker_input(user_input)
+
+    stocks = _get_universe().stocks
+    if kind == "krx_code":
+        return user_input + ".KS", stocks.get(user_input, "알 수 없는 회사")
+
+    if kind == "krx_ticker":
+        base_code = user_input[:6]
+        return user_input, stocks.get(base_code, "알 수 없는 회사")
+
+    if kind in ("index", "crypto"):
+        return user_input, None
+
+    if kind == "ticker":
+        # SK, LG, KT, NAVER 처럼 영문 티커 형태인 한국 종목명은 정확히 일치할 때만 한국 주식
+        code = get_ticker_by_name(user_input)
+        if code:
+            return code + ".KS", stocks[code]
+        return user_input, None
+
+    ticker_from_name = _resolve_name(user_input)
     if ticker_from_name:
-        return ticker_from_name, KOREAN_STOCKS[ticker_from_name.replace(".KS", "")]
-    
-    if user_input.isdigit() and len(user_input) == 6:
-        korean_ticker = user_input + ".KS"
-        company_name = KOREAN_STOCKS.get(user_input, "알 수 없는 회사")
-        return korean_ticker, company_name
-    
-    if user_input.endswith(".KS"):
-        base_code = user_input.replace(".KS", "")
-        if base_code.isdigit() and len(base_code) == 6:
-            company_name = KOREAN_STOCKS.get(base_code, "알 수 없는 회사")
-            return user_input, company_name
-    
+        return ticker_from_name, stocks[ticker_from_name.replace(".KS", "")]
     return user_input, None
 
 def get_all_stocks():
-    return KOREAN_STOCKS
+    return _get_universe().stocks
 
 def get_stock_count():
-    return len(KOREAN_STOCKS)
+    return len(_get_universe().codes)
 
 def get_all_sectors():
-    return list(SECTORS.keys())
+    return list(_get_universe().sectors.keys())
 
 # 버전 정보
 __version__ = "1.0.0"
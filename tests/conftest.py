@@ -1,5 +1,8 @@
 import sys
 import os
+
+import numpy as np
+import pandas as pd
 import pytest
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -12,3 +15,12 @@ async def mcp_client():
     from mcp_server import mcp
     async with Client(mcp) as client:
         yield client
+
+
+@pytest.fixture
+def price_series():
+    """합성 종가 시계열 팩토리 - 영업일 인덱스의 기하 랜덤워크 (같은 seed면 같은 값)."""
+    def make(n=300, seed=0, sigma=0.02, start="2020-01-01"):
+        idx = pd.bdate_range(start, periods=n)
+        return pd.Series(100 * np.cumprod(1 + np.random.default_rng(seed).normal(0, sigma, n)), index=idx)
+    return make
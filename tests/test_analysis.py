@@ -0,0 +1,203 @@
+"""N일 분석 계산 커널 테스트 - 네트워크 없이 합성 시계열로 검증"""
+import time
+from math import comb
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis import (
+    HORIZON_UNITS, TRADING_DAYS, add_forward_returns, binomial_p_value, bootstrap_win_rate, drop_grid, drop_stats,
+    find_drop_days, forward_prices,
+)
+
+
+def _pandas_signals(close, drop_threshold, days_after, horizon_unit=None):
+    """일반 pandas 연산으로 만든 신호일별 기대값 (N일 후 데이터가 있는 신호만)."""
+    pct = close.pct_change() * 100
+    signal = close[pct <= -drop_threshold]
+    dates = pd.Series(close.index, index=close.index)
+    if horizon_unit == TRADING_DAYS:
+        later_date = dates.shift(-days_after).reindex(signal.index)
+    else:
+        target = signal.index + pd.Timedelta(days=days_after)
+        later_date = pd.Series(dates.reindex(target, method="bfill").to_numpy(), index=signal.index)
+    later_date = later_date.dropna()
+    today = close[later_date.index]
+    later = pd.Series(close[later_date].to_numpy(), index=later_date.index)
+    return pd.DataFrame({
+        "change": (later - today) / today * 100,
+        "win": today > later,
+        "drop": pct[later_date.index],
+        "days": (later_date - later_date.index).dt.days,
+    })
+
+
+def _naive_forward(index, close, sig_date, days_after):
+    future = index[index >= sig_date + pd.Timedelta(days=days_after)]
+    if len(future) == 0:
+        return np.nan, np.nan
+    return close[future[0]], (future[0] - sig_date).days
+
+
+@pytest.mark.parametrize("days_after", [1, 3, 7, 30, 365])
+def test_forward_prices_matches_scan(days_after, price_series):
+    """N1: searchsorted 결과가 기존 거래일 순차 탐색과 동일"""
+    close = price_series(400)
+    signals = close.index[::7]
+    prices, actual = forward_prices(close.index, close.to_numpy(), signals, days_after)
+    for i, d in enumerate(signals):
+        exp_price, exp_days = _naive_forward(close.index, close, d, days_after)
+        np.testing.assert_equal(prices[i], exp_price)
+        np.testing.assert_equal(actual[i], exp_days)
+
+
+def test_forward_prices_weekend_snaps_forward(price_series):
+    """N2: 목표일이 주말이면 다음 거래일(월요일) 사용"""
+    close = price_series(10)
+    fri = pd.Timestamp("2020-01-03")
+    prices, actual = forward_prices(close.index, close.to_numpy(), pd.DatetimeIndex([fri]), 1)
+    assert actual[0] == 3
+    assert prices[0] == close[pd.Timestamp("2020-01-06")]
+
+
+def test_forward_prices_past_end_is_nan(price_series):
+    """N3: 데이터 범위를 넘는 신호일은 NaN"""
+    close = price_series(10)
+    prices, actual = forward_prices(close.index, close.to_numpy(), close.index[-2:], 30)
+    assert np.isnan(prices).all()
+    assert np.isnan(actual).all()
+
+
+def test_drop_pipeline_matches_row_loop(price_series):
+    """N4: 신호일 추출 → N일 후 결과 → 통계가 행 단위 계산과 동일"""
+    close = price_series(400)
+    prices, signals = find_drop_days(close.to_frame("Close"), 2.0)
+    pct = close.pct_change() * 100
+    assert list(signals.index) == list(pct[pct <= -2.0].index)
+
+    result = add_forward_returns(signals, prices, 5)
+    wins = 0
+    for d, row in result.iterrows():
+        later, _ = _naive_forward(close.index, close, d, 5)
+        assert row["Price_5D_Later"] == later
+        assert row["Result"] == ("Win" if close[d] > later else "Lose")
+        wins += row["Result"] == "Win"
+
+    stats = drop_stats(close.index, close.to_numpy(), 2.0, 5)
+    assert stats.total == len(result) and stats.win == wins
+    assert stats.lose == len(result) - wins
+    assert stats.avg_change == pytest.approx(result["Change_5D"].mean())
+    expected = "sell" if stats.win_rate > 55 else "wait" if stats.win_rate < 45 else "neutral"
+    assert stats.strategy == expected
+
+
+def test_drop_grid_matches_single_analysis(price_series):
+    """N5: 격자 각 칸이 (기준, 기간)별 pandas 계산과 동일, 신호 없는 칸은 NaN"""
+    close = price_series(600, seed=3)
+    thresholds, horizons = [0.5, 2.0, 50.0], [1, 7, 30]
+    grid = drop_grid(close.to_frame("Close"), thresholds, horizons)
+    for t in thresholds[:2]:
+        for h in horizons:
+            expected = _pandas_signals(close, t, h)
+            assert grid["count"].loc[t, h] == len(expected)
+            assert grid["win_rate"].loc[t, h] == pytest.approx(expected["win"].mean() * 100)
+            assert grid["avg_change"].loc[t, h] == pytest.approx(expected["change"].mean())
+            assert grid["median_change"].loc[t, h] == pytest.approx(expected["change"].median())
+    assert (grid["count"].loc[50.0] == 0).all()
+    assert grid["win_rate"].loc[50.0].isna().all()
+
+
+def test_bootstrap_ci_matches_normal_approximation():
+    """N6: 부트스트랩 신뢰구간이 정규근사와 가깝고, 50%에서 먼 승률일수록 p-value가 작음"""
+    wins = np.array([True] * 70 + [False] * 30)
+    boot = bootstrap_win_rate(wins, resamples=20_000, seed=0)
+    se = np.sqrt(0.7 * 0.3 / 100) * 100
+    assert boot["resamples"] == 20_000
+    assert boot["ci_low"] == pytest.approx(70 - 1.96 * se, abs=1.5)
+    assert boot["ci_high"] == pytest.approx(70 + 1.96 * se, abs=1.5)
+    assert boot["p_value"] < 0.01
+    even = bootstrap_win_rate(np.array([True, False] * 50), resamples=5_000, seed=0)
+    assert even["p_value"] > 0.5
+
+
+def test_bootstrap_respects_time_budget():
+    """N7: 시간 예산이 0이면 첫 블록만 계산하고 사용한 재표본 수를 보고"""
+    wins = np.random.default_rng(0).random(2_000) > 0.5
+    boot = bootstrap_win_rate(wins, resamples=100_000, budget_sec=0)
+    assert 0 < boot["resamples"] < 100_000
+    assert boot["ci_low"] <= wins.mean() * 100 <= boot["ci_high"]
+
+
+def test_trading_day_horizon_is_positional_shift(price_series):
+    """N8: 거래일 모드는 Close.shift(-N)과 같고, 격자 거래일 모드도 단일 분석과 동일"""
+    data = price_series(500, seed=5).to_frame("Close")
+    data = data.drop(data.index[[10, 11, 50, 200]])  # 휴장일 섞기
+    prices, signals = find_drop_days(data, 1.0)
+    result = add_forward_returns(signals, prices, 5, TRADING_DAYS)
+    expected = data["Close"].shift(-5).reindex(signals.index).dropna()
+    pd.testing.assert_index_equal(result.index, expected.index)
+    np.testing.assert_allclose(result["Price_5D_Later"], expected.to_numpy())
+    assert (result["Actual_Days_Later"] >= 5).all()
+
+    grid = drop_grid(data, [1.0], [5], TRADING_DAYS)
+    assert grid["count"].loc[1.0, 5] == len(expected)
+    assert grid["win_rate"].loc[1.0, 5] == pytest.approx((signals["Close"].reindex(expected.index) > expected).mean() * 100)
+    with pytest.raises(ValueError):
+        add_forward_returns(signals, prices, 5, "weeks")
+
+
+@pytest.mark.parametrize("horizon_unit", HORIZON_UNITS)
+def test_drop_stats_matches_pandas(horizon_unit, price_series):
+    """N9: 배열 커널 통계가 pandas 계산과 동일 (결과별 평균·중간값 포함)"""
+    close = price_series(800, seed=7)
+    expected = _pandas_signals(close, 2.0, 7, horizon_unit)
+    change, win = expected["change"], expected["win"]
+    stats = drop_stats(close.index, close.to_numpy(), 2.0, 7, horizon_unit)
+    assert stats.signals == int((close.pct_change() <= -0.02).sum())
+    assert stats.total == len(expected) and stats.win == win.sum() and stats.lose == (~win).sum()
+    assert stats.win_rate == pytest.approx(win.mean() * 100)
+    assert stats.avg_change == pytest.approx(change.mean())
+    assert stats.median_change == pytest.approx(change.median())
+    assert stats.avg_win_change == pytest.approx(change[win].mean())
+    assert stats.avg_lose_change == pytest.approx(change[~win].mean())
+    assert stats.max_drop_pct == pytest.approx(expected["drop"].min())
+    assert stats.avg_actual_days == pytest.approx(expected["days"].mean())
+    np.testing.assert_array_equal(stats.wins, win.to_numpy())
+
+    none = drop_stats(close.index, close.to_numpy(), 90.0, 7, horizon_unit)
+    assert none.signals == none.total == 0 and none.avg_change is None
+
+
+def test_small_unanimous_sample_uses_exact_test():
+    """N10: 5전 5승은 정확한 이항검정 p=0.0625와 Wilson 구간 (부트스트랩의 [100, 100] 아님)"""
+    boot = bootstrap_win_rate(np.ones(5, dtype=bool), seed=0)
+    assert boot["method"] == "wilson" and boot["resamples"] == 0
+    assert boot["p_value"] == pytest.approx(0.0625)
+    assert boot["ci_low"] == pytest.approx(56.55, abs=0.01)
+    assert boot["ci_high"] == pytest.approx(100.0)
+    lopsided = bootstrap_win_rate(np.array([False] * 40), seed=0)
+    assert lopsided["method"] == "wilson" and lopsided["ci_low"] == pytest.approx(0, abs=1e-9) and lopsided["ci_high"] > 5
+
+
+@pytest.mark.parametrize("horizon_unit", HORIZON_UNITS)
+def test_non_positive_horizon_rejected(horizon_unit, price_series):
+    """N11: N일이 1 미만이면 (거래일 모드의 위치 역순 참조 대신) ValueError"""
+    data = price_series(100).to_frame("Close")
+    for days_after in (0, -3):
+        with pytest.raises(ValueError):
+            drop_stats(data.index, data["Close"].to_numpy(), 1.0, days_after, horizon_unit)
+        with pytest.raises(ValueError):
+            drop_grid(data, [1.0], [5, days_after], horizon_unit)
+
+
+def test_binomial_p_value_is_linear_time():
+    """N12: 이항검정은 큰 정수 합과 같은 값이고, 신호 수만 개도 시간 예산 안에 끝남"""
+    for win, n in [(3, 5), (70, 100), (480, 1000)]:
+        exact = min(1.0, 2 * sum(comb(n, i) for i in range(min(win, n - win) + 1)) / 2 ** n)
+        assert binomial_p_value(win, n) == pytest.approx(exact, rel=1e-9)
+    wins = np.random.default_rng(0).random(50_000) > 0.495
+    t0 = time.perf_counter()
+    boot = bootstrap_win_rate(wins, resamples=1_000, budget_sec=0.2)
+    assert time.perf_counter() - t0 < 1.5
+    assert 0 < boot["p_value"] < 1
@@ -0,0 +1,153 @@
+"""TTL 캐시 테스트 - 가짜 시계로 만료/LRU 동작, 동시 요청 합치기 검증"""
+import threading
+import time
+
+from cache import SingleFlight, TTLCache, ttl_cache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_entry_expires_after_ttl():
+    """C1: ttl 경과 전에는 적중, 경과 후에는 미스"""
+    clock = FakeClock()
+    cache = TTLCache(ttl=60, timer=clock)
+    cache.set("k", 1)
+    clock.now = 59.9
+    assert cache.get("k") == 1
+    clock.now = 60.0
+    assert cache.get("k") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_lru_bound_evicts_least_recent():
+    """C2: maxsize 초과 시 가장 오래 사용하지 않은 키부터 제거"""
+    cache = TTLCache(ttl=60, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_decorator_skips_none_and_exceptions():
+    """C3: None 결과와 예외는 캐시하지 않아 다음 호출에서 재시도"""
+    calls = []
+
+    @ttl_cache(ttl=60)
+    def fetch(symbol, fail=False):
+        calls.append(symbol)
+        if fail:
+            raise RuntimeError
+        return None if symbol == "none" else symbol.lower()
+
+    assert fetch("QQQ") == "qqq"
+    assert fetch("QQQ") == "qqq"
+    fetch("none")
+    fetch("none")
+    for _ in range(2):
+        try:
+            fetch("ERR", fail=True)
+        except RuntimeError:
+            pass
+    assert calls == ["QQQ", "none", "none", "ERR", "ERR"]
+    fetch.cache_clear()
+    fetch("QQQ")
+    assert calls[-1] == "QQQ"
+
+
+def test_concurrent_misses_share_one_call():
+    """C4: 같은 키의 동시 미스는 한 번만 실행하고 결과를 공유"""
+    calls = []
+    start = threading.Barrier(8)
+
+    @ttl_cache(ttl=60)
+    def fetch(symbol):
+        calls.append(symbol)
+        time.sleep(0.2)
+        return {"symbol": symbol}
+
+    results = []
+
+    def worker():
+        start.wait()
+        results.append(fetch("005930.KS"))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert calls == ["005930.KS"]
+    assert len(results) == 8
+    assert all(r is results[0] for r in results)
+    assert fetch.flight.shared == 7
+
+
+def test_single_flight_propagates_error_to_waiters():
+    """C5: 리더의 예외는 기다리던 호출에도 전달되고 이후 호출은 새로 실행"""
+    flight = SingleFlight()
+    calls = []
+
+    def boom():
+        calls.append(1)
+        time.sleep(0.2)
+        raise RuntimeError("rate limited")
+
+    errors = []
+
+    def worker():
+        try:
+            flight.do("fgi", boom)
+        except RuntimeError as e:
+            errors.append(str(e))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1
+    assert errors == ["rate limited"] * 4
+    assert flight.do("fgi", lambda: 42) == 42
+
+
+def test_stale_value_served_while_revalidating():
+    """C6: ttl이 지난 값은 grace 동안 즉시 반환하고 갱신은 백그라운드에서 한 번만, 실패 시 직전 값 유지"""
+    results = iter([1, None, 3])
+    done = threading.Event()
+
+    @ttl_cache(ttl=60, grace=600)
+    def fetch():
+        value = next(results)
+        done.set()
+        return value
+
+    clock = FakeClock()
+    fetch.cache.timer = clock
+    assert fetch() == 1
+
+    clock.now = 61
+    done.clear()
+    assert fetch() == 1  # 갱신 결과 None → 직전 값 유지
+    assert done.wait(1)
+    time.sleep(0.05)
+    assert fetch.age() == 61
+
+    done.clear()
+    assert fetch() == 1
+    assert done.wait(1)
+    time.sleep(0.05)
+    assert fetch() == 3
+    assert fetch.cache.stats()["stale_hits"] == 2
+
+    clock.now = 61 + 661
+    assert fetch.age() is None  # grace 종료 → 미스
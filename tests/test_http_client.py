@@ -0,0 +1,59 @@
+"""공용 HTTP 세션 테스트 - 로컬 서버로 재시도/keep-alive/User-Agent 검증"""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import http_client
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive 허용
+    statuses = []
+    seen = []
+
+    def do_GET(self):
+        self.seen.append((self.client_address[1], self.headers.get("User-Agent")))
+        status = self.statuses.pop(0) if self.statuses else 200
+        body = b"ok"
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _Handler.statuses = []
+    _Handler.seen = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/", _Handler
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_retries_on_5xx(server, monkeypatch):
+    """H1: 5xx 응답은 백오프 후 재시도"""
+    url, handler = server
+    handler.statuses = [503, 502]
+    session = http_client.build_session()
+    monkeypatch.setattr(session.get_adapter(url).max_retries, "backoff_factor", 0)
+    r = session.get(url, timeout=5)
+    assert r.status_code == 200
+    assert len(handler.seen) == 3
+
+
+def test_connection_reused_with_user_agent(server):
+    """H2: 연속 요청이 같은 연결을 재사용하고 공통 User-Agent 전송"""
+    url, handler = server
+    session = http_client.build_session()
+    for _ in range(3):
+        assert session.get(url, timeout=5).text == "ok"
+    ports = {port for port, _ in handler.seen}
+    assert len(ports) == 1
+    assert all(ua == http_client.USER_AGENT for _, ua in handler.seen)
@@ -0,0 +1,134 @@
+"""지표 갱신기 테스트 - 스냅샷 게시, 직전 값 유지, 즉시 갱신"""
+import threading
+import time
+
+import pandas as pd
+
+from indicators import (
+    SCRAPE_INTERVAL, IndicatorRefresher, Source, buffett_field, build_refresher, interpret_qqq, interpret_usd_krw,
+)
+
+
+def test_publish_keeps_last_good_value():
+    """R1: None으로 들어온 필드는 직전 값과 갱신 시각을 유지"""
+    r = IndicatorRefresher({})
+    r.publish({"vix": 14.0, "fgi": 40})
+    first = r.snapshot()
+    r.publish({"vix": None, "fgi": 42})
+    snap = r.snapshot()
+    assert snap.version == first.version + 1
+    assert snap.get("vix") == 14.0
+    assert snap.updated_at["vix"] == first.updated_at["vix"]
+    assert snap.get("fgi") == 42
+    assert first.get("fgi") == 40  # 이전 스냅샷은 불변
+
+
+def test_sources_refresh_independently_and_on_demand():
+    """R2: 소스별 스레드가 첫 시도 후 ready, refresh_now로 주기 전 재갱신"""
+    calls = {"fast": 0, "slow": 0}
+    second = threading.Event()
+
+    def fast():
+        calls["fast"] += 1
+        if calls["fast"] == 2:
+            second.set()
+        return {"vix": float(calls["fast"])}
+
+    def slow():
+        calls["slow"] += 1
+        return None  # 실패: 값 없음
+
+    r = IndicatorRefresher({"fast": Source(fast, 3600), "slow": Source(slow, 3600)}).start()
+    try:
+        snap = r.wait_ready(timeout=2)
+        assert r.ready()
+        assert snap.get("vix") == 1.0
+        assert "slow" not in snap.values and snap.age("slow") is None
+        r.refresh_now(["fast"])
+        assert second.wait(2)
+        r.wait_ready(timeout=0)
+    finally:
+        r.stop()
+    assert calls["slow"] == 1
+
+
+def test_failed_refresh_marks_stale_until_grace():
+    """R3: 갱신 실패 필드는 stale로 표시하고 grace가 지나면 값 대신 default"""
+    r = IndicatorRefresher({}, grace=60)
+    r.publish({"fgi": 40})
+    r.publish({"fgi": None})
+    snap = r.snapshot()
+    assert snap.is_stale("fgi")
+    assert snap.get("fgi") == 40
+    assert snap.get("fgi", now=snap.updated_at["fgi"] + 61) is None
+    r.publish({"fgi": 41})
+    assert not r.snapshot().is_stale("fgi")
+
+
+def test_refresh_now_targets_sources_with_cooldown():
+    """R4: 지표 이름으로 소스를 골라 깨우고, 쿨다운 안의 반복 요청은 무시"""
+    calls = {"market": 0, "fgi": 0}
+
+    def fetcher(name, fields):
+        def fetch():
+            calls[name] += 1
+            return dict.fromkeys(fields, calls[name])
+        return fetch
+
+    r = IndicatorRefresher({
+        "market": Source(fetcher("market", ("vix", "rsi")), 3600),
+        "fgi": Source(fetcher("fgi", ("fgi",)), 3600),
+    }).start()
+    try:
+        r.wait_ready(timeout=2)
+        names = r.sources_for(["fgi"])
+        assert names == ["fgi"]
+        version = r.snapshot().version
+        assert r.refresh_now(names, cooldown=60) == []  # 방금 시도함 → 쿨다운
+        assert r.refresh_now([]) == []  # 대상 소스가 없으면 전체 갱신으로 바뀌지 않음
+        assert r.refresh_now(names) == ["fgi"]
+        snap = r.wait_newer(version, timeout=2)
+        assert snap.get("fgi") == 2
+    finally:
+        r.stop()
+    assert calls["market"] == 1
+
+
+def test_interpret_shared_labels():
+    """R5: 공용 해석 함수 (대시보드와 MCP가 같은 문구/신호 사용)"""
+    assert interpret_qqq(110, 100) == ("상승 추세 (+10.0%)", "bullish")
+    assert interpret_qqq(None, 100) == ("데이터 없음", "neutral")
+    assert interpret_usd_krw(1400, 0.0, 0.0) == ("보합", "neutral")
+    assert interpret_usd_krw(1400, -3.5, -0.25)[1] == "bullish"
+
+
+def _wait_for(refresher, name, timeout):
+    """name 값이 게시된 스냅샷 (timeout초 안에 없으면 마지막 스냅샷)."""
+    deadline = time.monotonic() + timeout
+    snap = refresher.snapshot()
+    while snap.get(name) is None and time.monotonic() < deadline:
+        snap = refresher.wait_newer(snap.version, deadline - time.monotonic())
+    return snap
+
+
+def test_slow_buffett_scrape_does_not_hold_market_fields():
+    """R6: 버핏 지수 스크래핑은 별도 소스라 느려도 시세 지표를 먼저 게시하고, 도착하면 SPY 추정치를 대체"""
+    spy = pd.DataFrame({"Close": [400.0, 410.0]}, index=pd.bdate_range("2024-01-01", periods=2))
+    release = threading.Event()
+
+    def scrape():
+        release.wait(2)
+        return 195.0
+
+    r = build_refresher(lambda: {"SPY": spy}, lambda: None, lambda: None, scrape).start()
+    try:
+        snap = _wait_for(r, "buffett", 1)
+        assert snap.get("buffett") == (410.0 / 400 * 180, "estimated")
+        assert buffett_field(snap) == "buffett"
+        assert r.sources["buffett"].interval == SCRAPE_INTERVAL
+        release.set()
+        snap = _wait_for(r, "buffett_actual", 2)
+        assert buffett_field(snap) == "buffett_actual"
+        assert snap.get(buffett_field(snap)) == (195.0, "actual")
+    finally:
+        r.stop()
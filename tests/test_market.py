@@ -0,0 +1,133 @@
+"""시장 지표 함수 테스트 - 성공 기준 M3~M8 (데이터 소스는 가짜 함수로 대체)"""
+import json
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import market_data
+import mcp_server
+
+
+def _parse(result):
+    content = result.content if hasattr(result, "content") else result
+    text = content[0].text if hasattr(content[0], "text") else str(content[0])
+    return json.loads(text)
+
+
+@pytest.fixture(autouse=True)
+def fresh_refresher(monkeypatch):
+    """테스트마다 새 갱신기 (가짜 소스를 패치한 뒤 첫 Tool 호출 시 시작)"""
+    refresher = mcp_server._build_refresher()
+    monkeypatch.setattr(mcp_server, "_refresher", refresher)
+    yield refresher
+    refresher.stop()
+
+
+@pytest.fixture
+def fake_sources(monkeypatch):
+    def slow(value, delay):
+        def fn():
+            time.sleep(delay)
+            return value
+        return fn
+
+    monkeypatch.setattr(mcp_server, "_get_market_history", slow(_frames(), 0.3))
+    monkeypatch.setattr(mcp_server, "_fetch_fgi", slow(20, 0.3))
+    monkeypatch.setattr(mcp_server, "_fetch_pci", slow(1.0, 0.3))
+    monkeypatch.setattr(mcp_server, "_fetch_buffett", slow(200.0, 0.3))
+
+
+def _frames():
+    idx = pd.bdate_range("2024-01-01", periods=250)
+    ramp = pd.DataFrame({"Close": np.linspace(400, 500, 250)}, index=idx)
+    flat = lambda v: pd.DataFrame({"Close": np.full(250, v)}, index=idx)
+    krw = flat(1395.0)
+    krw.iloc[-1, 0] = 1400.0
+    return {"QQQ": ramp, "^VIX": flat(14.0), "USDKRW=X": krw, "SPY": ramp, "^W5000": flat(43776.0)}
+
+
+async def test_indicators_fetched_concurrently(mcp_client, fake_sources):
+    """M4: 시세·FGI·Put/Call·버핏 소스를 동시에 갱신해 가장 느린 소스 수준의 시간에 첫 응답"""
+    t0 = time.perf_counter()
+    data = _parse(await mcp_client.call_tool("get_market_indicators", {}))
+    elapsed = time.perf_counter() - t0
+    assert elapsed < 1.5
+    assert data["fear_greed_index"]["value"] == 20
+    assert data["qqq_vs_200ma"]["signal"] == "bullish"
+    assert data["usd_krw"]["rate"] == 1400.0
+    assert data["usd_krw"]["change"] == 5.0
+    assert data["buffett_indicator"]["value"] == 150.0  # Wilshire 5000 기반이면 스크래핑 값보다 우선
+    assert data["rsi_sp500"]["signal"] == "bearish"
+
+
+async def test_indicator_past_deadline_is_missing(mcp_client, fake_sources, monkeypatch):
+    """M3: 마감 시간을 넘긴 지표는 '데이터 없음'으로 반환하고 나머지는 정상"""
+    def hang():
+        time.sleep(2)
+        return 0.5
+
+    monkeypatch.setattr(mcp_server, "_fetch_pci", hang)
+    monkeypatch.setattr(mcp_server, "INDICATOR_DEADLINE", 0.8)
+    t0 = time.perf_counter()
+    data = _parse(await mcp_client.call_tool("get_market_indicators", {}))
+    assert time.perf_counter() - t0 < 1.8
+    assert data["put_call_ratio"]["value"] is None
+    assert data["put_call_ratio"]["label"] == "데이터 없음"
+    assert data["vix"]["value"] == 14.0
+
+
+async def test_failing_source_degrades_gracefully(mcp_client, fake_sources, monkeypatch):
+    """M8: 예외를 던지는 소스는 null로 대체"""
+    def boom():
+        raise RuntimeError("upstream down")
+
+    monkeypatch.setattr(mcp_server, "_get_market_history", boom)
+    data = _parse(await mcp_client.call_tool("get_market_indicators", {}))
+    assert data["vix"]["value"] is None
+    assert data["vix"]["signal"] == "neutral"
+    assert data["fear_greed_index"]["value"] == 20
+
+
+def test_download_market_history_splits_per_symbol(monkeypatch):
+    """M5: 일괄 다운로드 결과를 심볼별로 분리하고 빈 심볼은 제외"""
+    idx = pd.bdate_range("2024-01-01", periods=3)
+    cols = pd.MultiIndex.from_product([["QQQ", "^VIX", "^W5000"], ["Close", "Volume"]])
+    raw = pd.DataFrame(np.arange(18, dtype=float).reshape(3, 6), index=idx, columns=cols)
+    raw[("^W5000", "Close")] = np.nan
+    raw[("^W5000", "Volume")] = np.nan
+    raw.loc[idx[0], ("^VIX", "Close")] = np.nan
+    raw.loc[idx[0], ("^VIX", "Volume")] = np.nan
+    calls = []
+    monkeypatch.setattr(market_data.yf, "download", lambda tickers, **kw: calls.append(tickers) or raw)
+
+    frames = market_data.download_market_history(("QQQ", "^VIX", "^W5000", "SPY"))
+    assert calls == [["QQQ", "^VIX", "^W5000", "SPY"]]
+    assert set(frames) == {"QQQ", "^VIX"}
+    assert len(frames["^VIX"]) == 2
+    assert market_data.latest_vix(frames) == 14.0
+
+
+async def test_indicators_served_from_snapshot(mcp_client, monkeypatch):
+    """M6: 반복 호출은 yfinance 재조회 없이 최신 스냅샷에서 응답"""
+    calls = []
+    monkeypatch.setattr(mcp_server, "download_market_history", lambda: calls.append(1) or _frames())
+    monkeypatch.setattr(mcp_server, "_fetch_fgi", lambda: 20)
+    monkeypatch.setattr(mcp_server, "_fetch_pci", lambda: 1.0)
+    monkeypatch.setattr(mcp_server, "_fetch_buffett", lambda: None)
+    for _ in range(5):
+        data = _parse(await mcp_client.call_tool("get_market_indicators", {}))
+    assert calls == [1]
+    assert data["vix"]["value"] == 14.0
+
+
+async def test_warm_snapshot_does_not_wait_on_sources(mcp_client, fake_sources, fresh_refresher):
+    """M7: 스냅샷이 채워진 뒤에는 느린 소스를 기다리지 않고 필드별 경과 시간을 함께 반환"""
+    await mcp_client.call_tool("get_market_indicators", {})
+    fresh_refresher.refresh_now()
+    t0 = time.perf_counter()
+    data = _parse(await mcp_client.call_tool("get_market_indicators", {}))
+    assert time.perf_counter() - t0 < 0.2
+    assert data["fear_greed_index"]["age_sec"] >= 0
+    assert data["snapshot_version"] >= 1
@@ -0,0 +1,189 @@
+"""가격 저장소 테스트 - yfinance 다운로드를 가짜 함수로 대체해 네트워크 없이 검증"""
+import os
+import pickle
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import price_store
+
+
+FULL = pd.DataFrame(
+    {"Close": np.arange(1, 21, dtype=float), "Volume": np.arange(20, dtype=float)},
+    index=pd.bdate_range("2024-01-01", periods=20),
+)
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    calls = []
+    frame = {"data": FULL.iloc[:15]}
+
+    def fake_download(ticker, start=None, progress=False, auto_adjust=True, **kwargs):
+        calls.append(pd.Timestamp(start))
+        df = frame["data"]
+        return df[df.index >= pd.Timestamp(start)].copy()
+
+    monkeypatch.setattr(price_store, "STORE_DIR", str(tmp_path))
+    monkeypatch.setattr(price_store, "STALE_GRACE", 0)  # 기본은 동기 갱신 (ST7에서 백그라운드 검증)
+    monkeypatch.setattr(price_store.yf, "download", fake_download)
+    return calls, frame
+
+
+def test_first_call_downloads_and_persists(store, tmp_path):
+    """ST1: 첫 호출은 전체 다운로드 후 파일 저장"""
+    calls, _ = store
+    data = price_store.get_history("QQQ", "2024-01-01")
+    assert len(data) == 15
+    assert len(calls) == 1
+    assert any(p.suffix == ".parquet" for p in tmp_path.iterdir())
+
+
+def test_fresh_store_skips_network(store):
+    """ST2: MAX_AGE 안의 재호출은 네트워크 없이 디스크에서 응답"""
+    calls, _ = store
+    price_store.get_history("QQQ", "2024-01-01")
+    data = price_store.get_history("QQQ", "2024-01-05")
+    assert len(calls) == 1
+    assert data.index[0] == pd.Timestamp("2024-01-05")
+
+
+def test_stale_store_fetches_only_tail(store, monkeypatch):
+    """ST3: 오래된 저장분은 마지막 구간만 받아 이어 붙임"""
+    calls, frame = store
+    price_store.get_history("QQQ", "2024-01-01")
+    frame["data"] = FULL
+    monkeypatch.setattr(price_store, "MAX_AGE", 0)
+    data = price_store.get_history("QQQ", "2024-01-01")
+    assert len(calls) == 2
+    assert calls[1] == FULL.index[13]
+    pd.testing.assert_series_equal(data["Close"], FULL["Close"], check_freq=False)
+
+
+def test_adjusted_history_change_triggers_full_reload(store, monkeypatch):
+    """ST4: 겹치는 날 수정종가가 바뀌면 전체 재다운로드"""
+    calls, frame = store
+    price_store.get_history("QQQ", "2024-01-01")
+    frame["data"] = FULL.assign(Close=FULL["Close"] * 0.9)
+    monkeypatch.setattr(price_store, "MAX_AGE", 0)
+    data = price_store.get_history("QQQ", "2024-01-01")
+    assert calls[-1] == pd.Timestamp("2024-01-01")
+    assert data["Close"].iloc[0] == pytest.approx(0.9)
+
+
+def test_earlier_start_refetches(store):
+    """ST5: 저장 범위보다 이른 시작일 요청 시 다시 다운로드"""
+    calls, _ = store
+    price_store.get_history("QQQ", "2024-01-10")
+    price_store.get_history("QQQ", "2024-01-01")
+    assert calls == [pd.Timestamp("2024-01-10"), pd.Timestamp("2024-01-01")]
+
+
+def test_adjust_modes_stored_separately(store):
+    """ST6: 수정주가/원주가 모드는 별도 파일"""
+    calls, _ = store
+    price_store.get_history("QQQ", "2024-01-01", auto_adjust=True)
+    price_store.get_history("QQQ", "2024-01-01", auto_adjust=False)
+    assert len(calls) == 2
+
+
+def test_stale_within_grace_served_then_refreshed_in_background(store, monkeypatch):
+    """ST7: MAX_AGE가 지났어도 grace 안이면 저장분을 즉시 반환하고 뒷부분은 백그라운드 갱신"""
+    calls, frame = store
+    price_store.get_history("QQQ", "2024-01-01")
+    frame["data"] = FULL
+    monkeypatch.setattr(price_store, "MAX_AGE", 0)
+    monkeypatch.setattr(price_store, "STALE_GRACE", 3600)
+    data = price_store.get_history("QQQ", "2024-01-01")
+    assert len(data) == 15
+    assert data.attrs["age_sec"] >= 0
+    for _ in range(100):
+        if not price_store._refreshing:
+            break
+        time.sleep(0.02)
+    monkeypatch.setattr(price_store, "MAX_AGE", 900)
+    assert len(price_store.get_history("QQQ", "2024-01-01")) == 20
+    assert len(calls) == 2
+
+
+def test_price_arrays_from_store_are_compact(store):
+    """ST8: get_price_arrays는 저장분에서 종가·거래량만 읽어 int32 일수 + float32 배열로 반환"""
+    calls, _ = store
+    wide = FULL.iloc[:15].assign(Open=1.0, High=2.0, Low=0.5)
+    price_store._write(price_store._path("QQQ", True), wide, wide.index[0])
+    arrays = price_store.get_price_arrays(["QQQ"], "2024-01-03")["QQQ"]
+    assert calls == []
+    assert arrays.days.dtype == np.int32 and arrays.close.dtype == np.float32
+    assert len(arrays) == 13 and arrays.nbytes == 13 * 12
+    np.testing.assert_array_equal(arrays.close, wide["Close"].iloc[2:].to_numpy(dtype=np.float32))
+    assert arrays.days[0] == (pd.Timestamp("2024-01-03") - pd.Timestamp("1970-01-01")).days
+
+
+def test_price_arrays_are_mapped_from_arena(store):
+    """ST9: 저장 시 아레나도 갱신되고, 압축 배열은 mmap 뷰로 열리며 피클은 경로만 전달"""
+    calls, frame = store
+    price_store.get_history("QQQ", "2024-01-01")
+    arrays = price_store.get_price_arrays(["QQQ"], "2024-01-03")["QQQ"]
+    assert calls == [pd.Timestamp("2024-01-01")]
+    assert not arrays.close.flags.owndata and not arrays.close.flags.writeable
+    np.testing.assert_array_equal(arrays.close, FULL["Close"].iloc[2:15].to_numpy(dtype=np.float32))
+
+    payload = pickle.dumps(arrays)
+    assert len(payload) < 200  # 배열 대신 (경로, 시작 일수)
+    np.testing.assert_array_equal(pickle.loads(payload).days, arrays.days)
+
+    # 저장분을 교체해도 이미 매핑한 배열은 그대로 유효
+    before = arrays.close.copy()
+    price_store._write(price_store._path("QQQ", True), FULL, FULL.index[0])
+    np.testing.assert_array_equal(arrays.close, before)
+    assert len(price_store.get_price_arrays(["QQQ"], "2024-01-03")["QQQ"]) == 18
+
+
+def test_batch_refresh_extends_without_shrinking_store(store, monkeypatch):
+    """ST10: 일괄 조회도 오래된 저장분은 뒷부분만 받고, 더 늦은 시작일로 저장 구간을 줄이지 않음"""
+    calls, frame = store
+    wide = FULL.iloc[:15].assign(Open=1.0)
+    path = price_store._path("QQQ", True)
+    price_store._write(path, wide, wide.index[0])
+    frame["data"] = FULL.assign(Open=1.0)
+    monkeypatch.setattr(price_store, "MAX_AGE", 0)
+    arrays = price_store.get_price_arrays(["QQQ"], "2024-01-10")["QQQ"]
+    assert calls == [FULL.index[13]]
+    assert len(arrays) == len(FULL.loc["2024-01-10":])
+    data, covered_from, _ = price_store._read(path)
+    assert covered_from == FULL.index[0]
+    assert len(data) == 20 and "Open" in data
+
+
+def test_unwritable_store_still_returns_download(store, tmp_path, monkeypatch):
+    """ST11: 저장 디렉터리를 만들 수 없어도 첫 다운로드 결과는 그대로 반환"""
+    calls, _ = store
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    monkeypatch.setattr(price_store, "STORE_DIR", str(blocker / "store"))
+    data = price_store.get_history("QQQ", "2024-01-01")
+    assert len(data) == 15 and len(calls) == 1
+    assert data.attrs["age_sec"] == 0.0
+
+
+@pytest.mark.parametrize("with_arena", [True, False])
+def test_batch_lookup_revalidates_within_grace(store, monkeypatch, with_arena):
+    """ST12: 일괄 조회도 grace 안의 오래된 저장분은 즉시 반환하고 뒷부분은 백그라운드 갱신 (아레나 유무 모두)"""
+    calls, frame = store
+    path = price_store._path("QQQ", True)
+    price_store._write(path, FULL.iloc[:15], FULL.index[0])
+    if not with_arena:
+        os.remove(price_store._arena_path(path))
+    frame["data"] = FULL
+    monkeypatch.setattr(price_store, "MAX_AGE", 0)
+    monkeypatch.setattr(price_store, "STALE_GRACE", 3600)
+    assert len(price_store.get_price_arrays(["QQQ"], "2024-01-01")["QQQ"]) == 15
+    for _ in range(100):
+        if not price_store._refreshing:
+            break
+        time.sleep(0.02)
+    assert calls == [FULL.index[13]]
+    data, covered_from, _ = price_store._read(path)
+    assert len(data) == 20 and covered_from == FULL.index[0]
@@ -0,0 +1,77 @@
+"""증분 RSI 엔진 테스트 - 전체 재계산과 일치, 잠정 봉 교체, 수정주가 재계산 감지"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators import market_fields
+from rsi import SMA, WILDER, RSIEngine, rsi_panel
+
+
+@pytest.mark.parametrize("method", [SMA, WILDER])
+def test_incremental_matches_full_recompute(method, price_series):
+    """RS1: 봉마다 update한 값이 패널 전체 계산과 같음 (봉이 부족한 구간은 None)"""
+    closes = price_series()
+    expected = rsi_panel(closes.to_frame(), 14, method).iloc[:, 0]
+    engine = RSIEngine(14, method)
+    values = [engine.update("SPY", close, ts) for ts, close in closes.items()]
+    assert values[:14] == [None] * 14
+    np.testing.assert_allclose(np.array(values[14:], dtype=float), expected.iloc[14:], rtol=1e-9)
+
+
+def _rolling_rsi(series, window=14):
+    """pandas rolling 평균으로 계산한 단순이동평균 RSI 시계열 (기준값)."""
+    delta = series.diff()
+    gain = delta.where(delta > 0, 0).rolling(window).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window).mean()
+    return 100 - 100 / (1 + gain / loss)
+
+
+def test_sma_panel_matches_rolling_mean(price_series):
+    """RS2: SMA 방식은 pandas rolling 평균 RSI와 같고, 패널은 열마다 독립 계산 (상장일이 달라도)"""
+    a, b = price_series(seed=1), price_series(seed=2)
+    b.iloc[:100] = np.nan  # 늦게 상장
+    panel = rsi_panel(pd.DataFrame({"A": a, "B": b}), 14, SMA)
+    np.testing.assert_allclose(panel["A"].iloc[14:], _rolling_rsi(a).iloc[14:], rtol=1e-9)
+    assert panel["B"].iloc[-1] == pytest.approx(_rolling_rsi(b.dropna()).iloc[-1])
+    assert panel["B"].iloc[:114].isna().all()
+    wilder = rsi_panel(pd.DataFrame({"B": b}), 14, WILDER)["B"]
+    assert wilder.iloc[-1] == pytest.approx(rsi_panel(b.dropna().to_frame(), 14, WILDER).iloc[-1, 0])
+
+
+def test_extend_replaces_pending_bar_and_only_reads_new_bars(price_series):
+    """RS3: 같은 날짜 봉은 잠정 값만 교체, 이후 호출은 새 봉만 반영"""
+    closes = price_series()
+    engine = RSIEngine(14, WILDER)
+    engine.extend("SPY", closes.iloc[:-1])
+    intraday = closes.copy()
+    intraday.iloc[-1] *= 1.05  # 장중 값
+    engine.extend("SPY", intraday)
+    final = engine.extend("SPY", closes)  # 같은 날 확정 값으로 교체
+    assert final == pytest.approx(rsi_panel(closes.to_frame()).iloc[-1, 0])
+    # 새 봉 하나만 넘겨도 이어서 계산
+    nxt = pd.Series([closes.iloc[-1] * 0.98], index=[closes.index[-1] + pd.offsets.BDay()])
+    full = pd.concat([closes, nxt])
+    assert engine.extend("SPY", nxt) == pytest.approx(rsi_panel(full.to_frame()).iloc[-1, 0])
+
+
+def test_extend_rebuilds_after_adjustment(price_series):
+    """RS4: 과거 종가가 재조정되면 상태를 다시 만들어 전체 계산과 일치"""
+    closes = price_series()
+    engine = RSIEngine(14, WILDER)
+    engine.extend("SPY", closes)
+    adjusted = closes * 0.97
+    adjusted.iloc[-1] = closes.iloc[-1]
+    assert engine.extend("SPY", adjusted) == pytest.approx(rsi_panel(adjusted.to_frame()).iloc[-1, 0])
+    with pytest.raises(ValueError):
+        RSIEngine(14, "ema")
+
+
+def test_extend_without_new_bars_returns_none(price_series):
+    """RS5: 다운로드가 비면 직전 RSI를 새 값으로 내보내지 않음 (상태는 유지)"""
+    closes = price_series()
+    engine = RSIEngine(14, WILDER)
+    last = engine.extend("SPY", closes)
+    assert engine.extend("SPY", pd.Series(dtype=float)) is None
+    assert engine.extend("SPY", closes.iloc[:-5]) is None
+    assert engine.value("SPY") == pytest.approx(last)
+    assert market_fields({}, rsi_engine=engine)["rsi"] is None
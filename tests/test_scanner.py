@@ -0,0 +1,73 @@
+"""유니버스 스캔 테스트 - 일괄 다운로드를 가짜 함수로 대체해 청크/순위/부분 결과 검증"""
+import json
+
+import pytest
+
+import scanner
+from analysis import PriceArrays, add_forward_returns, find_drop_days
+
+
+def _history(price_series, seed):
+    return price_series(300, seed, sigma=0.03).to_frame("Close")
+
+
+@pytest.fixture
+def fake_histories(monkeypatch, price_series):
+    calls = []
+
+    def get_price_arrays(tickers, start):
+        calls.append(list(tickers))
+        return {t: PriceArrays.from_frame(_history(price_series, int(t[:6]))) for t in tickers}
+
+    monkeypatch.setattr(scanner, "get_price_arrays", get_price_arrays)
+    return calls
+
+
+def test_universe_sector_and_all():
+    """U1: 섹터 이름과 '전체'로 대상 종목 선택, 모르는 섹터는 ValueError"""
+    assert scanner.universe("바이오") == scanner.get_sector_stocks("바이오")
+    assert len(scanner.universe()) == len(scanner.get_all_stocks())
+    with pytest.raises(ValueError):
+        scanner.universe("없는섹터")
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_scan_chunks_match_single_ticker(fake_histories, processes, price_series):
+    """U2: 청크별 일괄 다운로드 후 종목별 통계가 단일 종목 분석과 동일 (프로세스 풀 포함)"""
+    codes = scanner.universe("자동차")
+    steps = list(scanner.scan(codes, 3.0, 7, "2020-01-01", chunk_size=5, processes=processes))
+    assert [len(c) for c in fake_histories] == [5, 5, 2]
+    assert [done for done, _ in steps] == [5, 10, 12]
+
+    results = {r["code"]: r for _, partial in steps for r in partial}
+    data = _history(price_series, int(codes[0]))
+    prices, signals = find_drop_days(data, 3.0)
+    result = add_forward_returns(signals, prices, 7)
+    assert results[codes[0]]["total_signals"] == len(result)
+    assert results[codes[0]]["win_rate"] == round((result["Result"] == "Win").mean() * 100, 1)
+
+
+def test_rank_filters_and_sorts():
+    """U3: 신호 수 미달 종목 제외 후 기준 내림차순 상위 N개"""
+    rows = [
+        {"code": "a", "total_signals": 10, "win_rate": 40.0, "avg_change_pct": 2.0},
+        {"code": "b", "total_signals": 3, "win_rate": 90.0, "avg_change_pct": 9.0},
+        {"code": "c", "total_signals": 8, "win_rate": 60.0, "avg_change_pct": -1.0},
+    ]
+    assert [r["code"] for r in scanner.rank(rows, "win_rate", 5)] == ["c", "a"]
+    assert [r["code"] for r in scanner.rank(rows, "avg_change_pct", 0, 1)] == ["b"]
+
+
+async def test_scan_tool_ranks_sector(mcp_client, fake_histories, monkeypatch):
+    """U4: scan_drop_signals Tool이 섹터 전체를 스캔해 순위 반환"""
+    monkeypatch.setattr(scanner, "PROCESSES", 1)
+    monkeypatch.setattr(scanner, "CHUNK_SIZE", 4)
+    result = await mcp_client.call_tool("scan_drop_signals", {"sector": "자동차", "min_signals": 1, "limit": 3})
+    data = json.loads(result.content[0].text)
+    assert data["scanned"] == 12
+    assert len(fake_histories) == 3
+    rates = [r["win_rate"] for r in data["ranking"]]
+    assert rates == sorted(rates, reverse=True) and len(rates) == 3
+
+    bad = json.loads((await mcp_client.call_tool("scan_drop_signals", {"sector": "없는섹터"})).content[0].text)
+    assert "error" in bad
@@ -0,0 +1,65 @@
+"""스크래핑 파서 테스트 - 합성 HTML 픽스처(실제 페이지의 대상 요소 구조를 흉내 냄)로 기존 BeautifulSoup 경로와 결과 비교"""
+import os
+
+import pytest
+from bs4 import BeautifulSoup
+
+import scrapers
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def _fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def _legacy_fgi(page):
+    el = BeautifulSoup(page, "html.parser").find("div", class_="text-center text-4xl font-semibold mb-1 text-white")
+    if el:
+        t = el.text.strip()
+        return int(t) if t.isdigit() else None
+    return None
+
+
+def _legacy_pci(page):
+    for td in BeautifulSoup(page, "html.parser").find_all("td", class_="col-6"):
+        try:
+            return float(td.text.strip().replace(",", ""))
+        except ValueError:
+            continue
+    return None
+
+
+def test_fgi_fixture_matches_legacy_parser():
+    """W1: 공포&탐욕 지수 픽스처 결과가 기존 파서와 동일"""
+    page = _fixture("feargreedmeter.html")
+    assert scrapers.parse_fgi(page) == _legacy_fgi(page) == 38
+
+
+def test_pci_fixture_matches_legacy_parser():
+    """W2: Put/Call 픽스처에서 숫자로 읽히는 첫 td.col-6 반환"""
+    page = _fixture("ycharts_put_call.html")
+    assert scrapers.parse_pci(page) == _legacy_pci(page) == 0.71
+
+
+@pytest.mark.parametrize("page, expected", [
+    ("<div class='text-center text-4xl font-semibold mb-1 text-white'> 71 </div>", 71),
+    ('<div class="text-center text-4xl font-semibold mb-1 text-white">--</div>', None),
+    ("<div>no index here</div>", None),
+])
+def test_fgi_edge_cases(page, expected):
+    """W3: 작은따옴표 속성(구조 파서 폴백), 숫자 아님, 요소 없음"""
+    assert scrapers.parse_fgi(page) == expected
+
+
+@pytest.mark.parametrize("page, expected", [
+    ("<table><tr><td class='col-6'>1,02</td></tr></table>", 102.0),
+    ('<table><tr><td class="x col-6 right"><span>0.88</span></td></tr></table>', 0.88),
+    ('<table><tr><td class="col-60">0.5</td><td class="md-col-6">0.6</td></tr></table>', None),
+    ('<table><tr><td class="col-6">N/A</td></tr></table>', None),
+])
+def test_pci_edge_cases(page, expected):
+    """W4: class 토큰 일치 규칙과 중첩 태그, 폴백"""
+    assert scrapers.parse_pci(page) == expected
+    assert _legacy_pci(page) == expected
@@ -0,0 +1,106 @@
+"""stock_library 조회 함수 테스트 - 인덱스 결과가 전체 순차 탐색과 동일한지, 지연 로드·교체 검증"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+import stock_library as sl
+
+
+def _linear(keyword):
+    return [(code, name) for code, name in sl.KOREAN_STOCKS.items() if keyword in name]
+
+
+@pytest.mark.parametrize("keyword", [
+    "삼성", "SK", "현대", "한", "전자", "바이오", "우B", "LG에너지솔루션", "", "존재하지않는회사XYZ",
+])
+def test_partial_search_matches_linear_scan(keyword):
+    """L1: 부분 검색 결과·순서가 순차 탐색과 동일"""
+    assert sl.search_stocks(keyword) == _linear(keyword)
+    assert sl.search_company_by_partial_name(keyword) == _linear(keyword)
+
+
+def test_every_name_substring_found():
+    """L2: 모든 종목명의 임의 부분문자열로 자기 자신이 검색됨"""
+    for code, name in list(sl.KOREAN_STOCKS.items())[::25]:
+        part = name[len(name) // 3:len(name) // 3 + 3] or name
+        assert (code, name) in sl.search_stocks(part)
+
+
+def test_exact_name_lookup():
+    """L3: 정확한 종목명 → 코드"""
+    assert sl.get_ticker_by_name("삼성전자") == "005930"
+    assert sl.get_ticker_by_name("삼성") is None
+    assert sl.get_ticker_from_name("삼성전자") == "005930.KS"
+
+
+@pytest.mark.parametrize("user_input, expected", [
+    ("005930", ("005930.KS", "삼성전자")),
+    ("005930.ks", ("005930.KS", "삼성전자")),
+    ("247540.KQ", ("247540.KQ", "에코프로비엠")),
+    ("AAPL", ("AAPL", None)),
+    ("brk-b", ("BRK-B", None)),
+    ("^GSPC", ("^GSPC", None)),
+    ("BTC-USD", ("BTC-USD", None)),
+    ("SK", ("034730.KS", "SK")),
+    ("삼성전자", ("005930.KS", "삼성전자")),
+    ("sk하이닉스", ("000660.KS", "SK하이닉스")),
+    ("삼성", ("삼성", None)),
+])
+def test_process_ticker_input(user_input, expected):
+    """L4: 코드·티커·인덱스·코인·종목명 입력 분류 및 변환"""
+    assert sl.process_ticker_input(user_input) == expected
+
+
+def test_ticker_inputs_skip_name_search(monkeypatch):
+    """L5: 코드/티커 형태 입력은 부분 검색을 거치지 않음"""
+    def fail(_):
+        raise AssertionError("name search called")
+
+    monkeypatch.setattr(sl, "_match_positions", fail)
+    for user_input in ("AAPL", "005930", "000660.KS", "^KS11", "ETH-KRW"):
+        sl.process_ticker_input(user_input)
+
+
+def test_universe_loaded_lazily():
+    """L6: import 시에는 종목 파일을 읽지 않고, 첫 조회 때 목록만 읽고 검색 인덱스는 첫 검색 때 생성"""
+    code = (
+        "import stock_library as sl\n"
+        "assert sl._universe is None\n"
+        "assert sl.get_company_name('005930') == '삼성전자'\n"
+        "assert sl._universe.gram_index is None\n"
+        "sl.search_stocks('삼성')\n"
+        "assert sl._universe.gram_index\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=os.path.dirname(sl.__file__))
+
+
+@pytest.fixture
+def universe_file(tmp_path, monkeypatch):
+    path = str(tmp_path / "stocks.tsv")
+    sl.write_universe({"111111": "가나전자", "000001": "다라바이오"}, {"테스트": ["111111"]}, path)
+    yield path
+    sl.refresh()  # 기본 종목 파일로 복원
+
+
+def test_refresh_replaces_universe(universe_file):
+    """L7: 다른 종목 파일로 refresh하면 조회·검색·종목명 해석 캐시가 모두 새 목록 기준"""
+    assert sl.get_ticker_from_name("삼성전자") == "005930.KS"
+    assert sl.refresh(universe_file) == 2
+    assert sl.get_ticker_from_name("삼성전자") is None
+    assert sl.search_stocks("전자") == [("111111", "가나전자")]
+    assert list(sl.get_all_stocks()) == ["000001", "111111"]
+    assert sl.get_sector_stocks("테스트") == ["111111"]
+    assert sl.process_ticker_input("다라") == ("000001.KS", "다라바이오")
+    assert sl.KOREAN_STOCKS is sl.get_all_stocks()
+
+
+def test_changed_file_reloaded_automatically(universe_file, monkeypatch):
+    """L8: 파일 수정 시각이 바뀌면 RELOAD_CHECK_SEC 이후 조회에서 자동으로 다시 읽음"""
+    sl.refresh(universe_file)
+    monkeypatch.setattr(sl, "RELOAD_CHECK_SEC", 1e-9)
+    sl.write_universe({"222222": "마바식품"}, {}, universe_file)
+    os.utime(universe_file, (0, 0))
+    assert sl.get_stock_count() == 1
+    assert sl.get_company_name("222222") == "마바식품"
@@ -1,7 +1,12 @@
-"""MCP Tool 단위 테스트 - 성공 기준 S1, A1~A5, P1~P4"""
+"""MCP Tool 단위 테스트 - 성공 기준 S1, S4, A1~A5, G1~G4, P1~P4"""
+import asyncio
 import json
+import time
+
 import pytest
 
+import mcp_server
+
 
 def _parse(result):
     """call_tool 결과에서 dict/list 파싱."""
@@ -10,18 +15,34 @@ def _parse(result):
     return json.loads(text)
 
 
-# ── S1: 4개 Tool 등록 확인 ────────────────────────────────────────────────────
+# ── S1: 6개 Tool 등록 확인 ────────────────────────────────────────────────────
 
 async def test_tools_registered(mcp_client):
     tools = await mcp_client.list_tools()
     names = [t.name for t in tools]
-    assert len(tools) == 4, f"Tool 수 불일치: {names}"
+    assert len(tools) == 6, f"Tool 수 불일치: {names}"
     assert "get_market_indicators" in names
     assert "analyze_stock_drops" in names
+    assert "analyze_drop_grid" in names
+    assert "scan_drop_signals" in names
     assert "get_stock_price" in names
     assert "search_korean_stock" in names
 
 
+# ── S4: 느린 Tool이 다른 요청을 막지 않음 ───────────────────────────────────────
+
+async def test_slow_tool_does_not_block_event_loop(mcp_client, monkeypatch):
+    """S4: 블로킹 다운로드 중에도 다른 Tool 호출은 즉시 응답"""
+    monkeypatch.setattr(mcp_server, "_analyze_stock_drops", lambda *a: time.sleep(1.0) or {"ok": True})
+    slow = asyncio.create_task(mcp_client.call_tool("analyze_stock_drops", {"ticker": "QQQ"}))
+    await asyncio.sleep(0.1)
+    t0 = time.perf_counter()
+    await mcp_client.call_tool("search_korean_stock", {"query": "삼성"})
+    assert time.perf_counter() - t0 < 0.5
+    assert not slow.done()
+    assert _parse(await slow) == {"ok": True}
+
+
 # ── A1~A5: analyze_stock_drops ───────────────────────────────────────────────
 
 async def test_analyze_basic(mcp_client):
@@ -89,6 +110,63 @@ async def test_analyze_strategy_values(mcp_client):
         assert data["strategy"] in ("sell", "wait", "neutral")
 
 
+# ── G1~G4: analyze_drop_grid / 신뢰구간 / 거래일 모드 ─────────────────────────
+
+@pytest.fixture
+def fake_history(monkeypatch, price_series):
+    """get_history를 합성 시계열로 대체하고 호출된 티커 목록을 반환."""
+    data = price_series(500, seed=1).to_frame("Close")
+    calls = []
+    monkeypatch.setattr(mcp_server, "get_history", lambda t, s: calls.append(t) or data.copy())
+    return calls
+
+
+async def test_drop_grid_single_download(mcp_client, fake_history):
+    """G1: 기준 × 기간 격자를 다운로드 한 번으로 계산, 칸 값은 단일 분석과 동일"""
+    grid = _parse(await mcp_client.call_tool("analyze_drop_grid", {
+        "ticker": "QQQ", "drop_thresholds_pct": [2.0, 1.0], "days_after_list": [7, 3],
+    }))
+    single = _parse(await mcp_client.call_tool("analyze_stock_drops", {
+        "ticker": "QQQ", "drop_threshold_pct": 2.0, "days_after": 7,
+    }))
+    assert fake_history == ["QQQ", "QQQ"]
+    assert grid["drop_thresholds_pct"] == [1.0, 2.0] and grid["days_after_list"] == [3, 7]
+    assert grid["total_signals"][1][1] == single["total_signals"]
+    assert grid["win_rate"][1][1] == single["win_rate"]
+    assert grid["avg_change_pct"][1][1] == single["avg_change_pct"]
+    assert "win_rate_ci95" not in single
+
+
+async def test_analyze_confidence_interval(mcp_client, fake_history):
+    """G2: confidence_interval=true이면 승률을 포함하는 95% 구간과 p-value 반환"""
+    with_ci = _parse(await mcp_client.call_tool("analyze_stock_drops", {
+        "ticker": "QQQ", "drop_threshold_pct": 2.0, "days_after": 7, "confidence_interval": True,
+    }))
+    low, high = with_ci["win_rate_ci95"]
+    assert low <= with_ci["win_rate"] <= high
+    assert 0 < with_ci["p_value"] <= 1 and with_ci["resamples_used"] > 0
+
+
+async def test_analyze_trading_day_horizon(mcp_client, fake_history):
+    """G3: horizon_unit=trading_days 지원, 알 수 없는 단위는 에러"""
+    trading = _parse(await mcp_client.call_tool("analyze_stock_drops", {
+        "ticker": "QQQ", "drop_threshold_pct": 2.0, "days_after": 7, "horizon_unit": "trading_days",
+    }))
+    assert trading["horizon_unit"] == "trading_days" and trading["total_signals"] > 0
+    bad = _parse(await mcp_client.call_tool("analyze_drop_grid", {"ticker": "QQQ", "horizon_unit": "weeks"}))
+    assert "error" in bad
+
+
+async def test_non_positive_horizon_is_tool_error(mcp_client, fake_history):
+    """G4: days_after / days_after_list가 1 미만이면 다운로드 없이 에러"""
+    single = _parse(await mcp_client.call_tool("analyze_stock_drops", {
+        "ticker": "QQQ", "days_after": 0, "horizon_unit": "trading_days",
+    }))
+    grid = _parse(await mcp_client.call_tool("analyze_drop_grid", {"ticker": "QQQ", "days_after_list": [3, -1]}))
+    assert "error" in single and "error" in grid
+    assert fake_history == []
+
+
 # ── P1~P4: get_stock_price ────────────────────────────────────────────────────
 
 async def test_price_us_ticker(mcp_client):